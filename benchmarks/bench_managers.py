@@ -0,0 +1,355 @@
+"""
+Benchmarks the :class:`StateManager` & :class:`AsyncStateManager`.
+
+Every operation is timed for each combination of the amount of states, whether
+the states & the manager have hooks, and whether debug logging is enabled. The
+results are written as JSON in nanoseconds per operation & can be compared to a
+previous run to catch regressions.
+
+Run it from the root of the repository::
+
+    python -m benchmarks.bench_managers --save-baseline
+    python -m benchmarks.bench_managers --baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.game_state import AsyncState, AsyncStateManager, State, StateManager
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import Any, Dict, List, Optional, Tuple, Type
+
+
+DEFAULT_SIZES: Tuple[int, ...] = (10, 100, 1_000, 10_000)
+DEFAULT_OUTPUT: Path = Path(__file__).with_name("results.json")
+DEFAULT_BASELINE: Path = Path(__file__).with_name("baseline.json")
+# The amount of operations timed per repeat for the benchmarks which don't scale
+# with the amount of states.
+OPERATIONS: int = 1_000
+RELOADS: int = 100
+
+logger = logging.getLogger("src.game_state")
+
+
+def _make_states(base: Type[Any], amount: int, hooks: bool) -> List[Type[Any]]:
+    bases: Tuple[Type[Any], ...] = (base,)
+    namespace: Dict[str, Any] = {}
+    if hooks:
+        if issubclass(base, AsyncState):
+
+            async def async_listener(self: Any, _: Any) -> None: ...
+
+            namespace = {
+                "on_enter": async_listener,
+                "on_leave": async_listener,
+            }
+        else:
+
+            def listener(self: Any, _: Any) -> None: ...
+
+            namespace = {"on_enter": listener, "on_leave": listener}
+
+    return [
+        type(f"BenchState{index}", bases, namespace) for index in range(amount)
+    ]
+
+
+def _set_global_hooks(manager: Any, hooks: bool) -> None:
+    if not hooks:
+        return
+
+    if isinstance(manager, AsyncStateManager):
+
+        async def async_global(state: Any, other_state: Any) -> None: ...
+
+        manager.global_on_enter = async_global
+        manager.global_on_leave = async_global
+    else:
+
+        def sync_global(state: Any, other_state: Any) -> None: ...
+
+        manager.global_on_enter = sync_global
+        manager.global_on_leave = sync_global
+
+
+def _switch_order(amount: int) -> Iterator[str]:
+    while True:
+        for index in range(amount):
+            yield f"BenchState{index}"
+
+
+def bench_sync(amount: int, hooks: bool, repeat: int) -> Dict[str, float]:
+    class Base(State["Any"]): ...
+
+    states = _make_states(Base, amount, hooks)
+    timings: Dict[str, List[float]] = {
+        "load_states": [],
+        "lazy_promotion": [],
+        "change_state": [],
+        "reload_state": [],
+    }
+
+    for _ in range(repeat):
+        manager = StateManager["Any"](bound_state_type=Base)
+        _set_global_hooks(manager, hooks)
+
+        started = time.perf_counter_ns()
+        manager.load_states(*states)
+        timings["load_states"].append(
+            (time.perf_counter_ns() - started) / amount
+        )
+
+        names = _switch_order(amount)
+        started = time.perf_counter_ns()
+        for _ in range(OPERATIONS):
+            manager.change_state(next(names))
+        timings["change_state"].append(
+            (time.perf_counter_ns() - started) / OPERATIONS
+        )
+
+        current = manager.current_state
+        reloadable = [
+            state.state_name for state in states if state is not type(current)
+        ]
+        started = time.perf_counter_ns()
+        for index in range(RELOADS):
+            manager.reload_state(reloadable[index % len(reloadable)])
+        timings["reload_state"].append(
+            (time.perf_counter_ns() - started) / RELOADS
+        )
+
+        lazy_manager = StateManager["Any"](bound_state_type=Base)
+        _set_global_hooks(lazy_manager, hooks)
+        lazy_manager.add_lazy_states(*states)
+        started = time.perf_counter_ns()
+        for state in states:
+            lazy_manager.change_state(state.state_name)
+        timings["lazy_promotion"].append(
+            (time.perf_counter_ns() - started) / amount
+        )
+
+    return {name: min(values) for name, values in timings.items()}
+
+
+async def bench_async(
+    amount: int, hooks: bool, repeat: int
+) -> Dict[str, float]:
+    class Base(AsyncState["Any"]): ...
+
+    states = _make_states(Base, amount, hooks)
+    timings: Dict[str, List[float]] = {
+        "load_states": [],
+        "lazy_promotion": [],
+        "change_state": [],
+        "reload_state": [],
+    }
+
+    for _ in range(repeat):
+        manager = AsyncStateManager["Any"](bound_state_type=Base)
+        _set_global_hooks(manager, hooks)
+
+        started = time.perf_counter_ns()
+        await manager.load_states(*states)
+        timings["load_states"].append(
+            (time.perf_counter_ns() - started) / amount
+        )
+
+        names = _switch_order(amount)
+        started = time.perf_counter_ns()
+        for _ in range(OPERATIONS):
+            await manager.change_state(next(names))
+        timings["change_state"].append(
+            (time.perf_counter_ns() - started) / OPERATIONS
+        )
+
+        current = manager.current_state
+        reloadable = [
+            state.state_name for state in states if state is not type(current)
+        ]
+        started = time.perf_counter_ns()
+        for index in range(RELOADS):
+            await manager.reload_state(reloadable[index % len(reloadable)])
+        timings["reload_state"].append(
+            (time.perf_counter_ns() - started) / RELOADS
+        )
+
+        lazy_manager = AsyncStateManager["Any"](bound_state_type=Base)
+        _set_global_hooks(lazy_manager, hooks)
+        lazy_manager.add_lazy_states(*states)
+        started = time.perf_counter_ns()
+        for state in states:
+            await lazy_manager.change_state(state.state_name)
+        timings["lazy_promotion"].append(
+            (time.perf_counter_ns() - started) / amount
+        )
+
+    return {name: min(values) for name, values in timings.items()}
+
+
+def _set_logging(enabled: bool) -> Optional[logging.Handler]:
+    if not enabled:
+        logger.setLevel(logging.WARNING)
+        return None
+
+    # Format every record & throw it away, so the cost of logging is measured
+    # without flooding the terminal.
+    handler = logging.StreamHandler(open(os.devnull, "w"))  # noqa: SIM115
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+    )
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    return handler
+
+
+def _run_bench_async(
+    amount: int, hooks: bool, repeat: int
+) -> Dict[str, float]:
+    return asyncio.run(bench_async(amount, hooks, repeat))
+
+
+def run(sizes: Tuple[int, ...], repeat: int) -> Dict[str, float]:
+    benchmarks: Tuple[
+        Tuple[str, Callable[[int, bool, int], Dict[str, float]]], ...
+    ] = (
+        ("sync", bench_sync),
+        ("async", _run_bench_async),
+    )
+    logger.propagate = False
+    results: Dict[str, float] = {}
+
+    for machine, benchmark in benchmarks:
+        for amount in sizes:
+            for hooks in (False, True):
+                for logging_enabled in (False, True):
+                    handler = _set_logging(logging_enabled)
+                    try:
+                        timings = benchmark(amount, hooks, repeat)
+                    finally:
+                        if handler is not None:
+                            logger.removeHandler(handler)
+                            handler.close()
+
+                    for operation, nanoseconds in timings.items():
+                        key = (
+                            f"{machine}.{operation}[states={amount},"
+                            f"hooks={'on' if hooks else 'off'},"
+                            f"logging={'on' if logging_enabled else 'off'}]"
+                        )
+                        results[key] = nanoseconds
+                        print(f"{key:<70} {nanoseconds:>12,.0f} ns/op")
+
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    regressions: List[str] = []
+    print(
+        f"\n{'benchmark':<70} {'baseline':>12} {'current':>12} {'change':>8}"
+    )
+
+    for key, nanoseconds in results.items():
+        previous = baseline.get(key)
+        if previous is None or previous == 0:
+            continue
+
+        change = nanoseconds / previous - 1
+        marker = ""
+        if change > threshold:
+            regressions.append(key)
+            marker = "  REGRESSED"
+        print(
+            f"{key:<70} {previous:>12,.0f} {nanoseconds:>12,.0f} {change:>+8.1%}{marker}"
+        )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the sync & async state managers."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="The amounts of states to benchmark with.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The amount of times each benchmark is repeated. The fastest run is kept.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help="The file to write the results to.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="A previous results file to compare against.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="The slowdown over the baseline counted as a regression (0.25 = 25%%).",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"Also write the results to {DEFAULT_BASELINE.name}.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(tuple(args.sizes), args.repeat)
+    report = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created_at": datetime.now(timezone.utc).isoformat(),  # noqa: UP017
+            "repeat": args.repeat,
+            "unit": "ns/op",
+        },
+        "results": results,
+    }
+
+    args.output.write_text(json.dumps(report, indent=4) + "\n")
+    if args.save_baseline:
+        DEFAULT_BASELINE.write_text(json.dumps(report, indent=4) + "\n")
+
+    if args.baseline is None:
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed.")
+        return 1
+
+    print("\nNo regressions found.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+import pygame
+from game_state import State, StateManager
+from game_state.utils import MISSING
+
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+speed = 200
+pygame.init()
+pygame.display.init()
+pygame.display.set_caption("Game State Example")
+
+
+class MyBaseState(State["MyBaseState"]):
+    window: pygame.Surface = MISSING
+    # Mention the attributes we want all our states to share.
+
+
+class MainMenuState(MyBaseState, state_name="MainMenu"):
+    def process_event(self, event: pygame.event.Event) -> None:
+        # This is called by `StateManager.run` for every event.
+
+        if event.type == pygame.QUIT:
+            # Setting `is_running` to false stops `StateManager.run`.
+            self.manager.is_running = False
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_w:
+            self.manager.change_state("Game")
+
+    def process_render(self, alpha: float) -> None:
+        # This is called by `StateManager.run` once every frame.
+
+        self.window.fill(GREEN)
+        pygame.display.update()
+
+
+class GameState(MyBaseState, state_name="Game"):
+    def __init__(self) -> None:
+        self.player_x: float = 250.0
+        self.last_player_x: float = 250.0
+
+    def process_event(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.QUIT:
+            self.manager.is_running = False
+
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_w:
+            self.manager.change_state("MainMenu")
+
+    def process_update(self, dt: float) -> None:
+        # This is called by `StateManager.run` with a fixed `dt`, as many times
+        # as needed to catch up with the time that has passed. The movement is
+        # the same no matter how fast the game is being drawn.
+
+        self.last_player_x = self.player_x
+
+        pressed = pygame.key.get_pressed()
+        if pressed[pygame.K_a]:
+            self.player_x -= speed * dt
+
+        if pressed[pygame.K_d]:
+            self.player_x += speed * dt
+
+    def process_render(self, alpha: float) -> None:
+        # `alpha` is how far we are between the last & the next update. We use it
+        # to draw the player smoothly in between the two positions.
+
+        self.window.fill(BLUE)
+
+        x = self.last_player_x + (self.player_x - self.last_player_x) * alpha
+        pygame.draw.rect(self.window, "red", (x, 100, 50, 50))
+        pygame.display.update()
+
+
+def main() -> None:
+    window = pygame.display.set_mode((500, 600))
+
+    state_manager = StateManager[MyBaseState](
+        bound_state_type=MyBaseState, window=window
+    )
+    state_manager.load_states(MainMenuState, GameState)
+    state_manager.change_state("MainMenu")
+
+    state_manager.run(
+        events=pygame.event.get,
+        # Updates the states 60 times a second.
+        timestep=1 / 60,
+        # Draws at most 144 frames a second.
+        frame_rate=144,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,3 @@
-from pathlib import Path
-
 import pygame
 from game_state import StateManager
 
@@ -18,14 +16,12 @@ def main() -> None:
         bound_state_type=MyBaseState, window=window
     )
 
-    path_obj = Path("states.")
-
-    # Use glob to find all files ending with .py
-    for file_path in path_obj.glob("*.py"):
-        if file_path.is_file():  # Ensure it's a file and not a directory
-            state_manager.connect_state_hook("states." + file_path.name[:-3])
+    state_manager.discover_state_hooks("states", index_path="states.json")
+    # Finds the states in the `states` folder without importing them. The file of
+    # a state is only imported & hooked up once we change to that state. The
+    # scanned files are cached in `states.json` to skip parsing them next time.
 
-    # The other alternative-
+    # The other alternative, which imports the files right away-
     # state_manager.connect_state_hook("main_menu")
     # state_manager.connect_state_hook("game")
 
@@ -17,14 +17,28 @@ __copyright__ = "Copyright 2024-present Krish Mohan M."
 
 from typing import Literal, NamedTuple
 
-from .async_machine import AsyncState, AsyncStateManager
-from .sync_machine import State, StateManager
+from .async_machine import (
+    AsyncRegionManager,
+    AsyncState,
+    AsyncStateManager,
+    AsyncStateManagerPool,
+)
+from .sync_machine import (
+    RegionManager,
+    State,
+    StateManager,
+    StateManagerPool,
+)
 
 __all__ = (
+    "AsyncRegionManager",
     "AsyncState",
     "AsyncStateManager",
+    "AsyncStateManagerPool",
+    "RegionManager",
     "State",
     "StateManager",
+    "StateManagerPool",
     "version_info",
 )
 
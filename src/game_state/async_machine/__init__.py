@@ -1,4 +1,11 @@
 from .manager import AsyncStateManager
+from .pool import AsyncStateManagerPool
+from .regions import AsyncRegionManager
 from .state import AsyncState
 
-__all__ = ("AsyncState", "AsyncStateManager")
+__all__ = (
+    "AsyncRegionManager",
+    "AsyncState",
+    "AsyncStateManager",
+    "AsyncStateManagerPool",
+)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from src.game_state.async_machine.manager import AsyncStateManager
+from src.game_state.async_machine.state import AsyncState
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any, Dict, List, Set, Type
+
+
+__all__ = ("AsyncStateManagerPool",)
+
+
+S = TypeVar("S", bound="AsyncState[Any]")
+
+
+class AsyncStateManagerPool(Generic[S]):
+    r"""
+    Allocates independent :class:`AsyncStateManager` sessions sharing the same
+    state classes.
+
+    Every session manager uses instance binding, meaning the manager & the keyword
+    arguments are bound to the state instances instead of the state classes. This
+    allows any number of sessions to run the same states side by side.
+
+    .. versionadded:: 2.5
+
+    .. note::
+        States marked with ``eager_load`` or ``lazy_load`` are claimed by the pool
+        when it's created and are added to every session it allocates.
+
+    :param bound_state_type:
+        | The base state class which all states inherits from.
+    :type bound_state_type: type[AsyncState]
+    :param states:
+        | The states to be loaded into every session.
+    :param lazy_states:
+        | The states to be lazily loaded into every session.
+    :param \**kwargs:
+        | The keyword arguments to bind to the states of every session.
+    """
+
+    def __init__(
+        self,
+        *,
+        bound_state_type: Type[S] = AsyncState,
+        states: Iterable[Type[S]] = (),
+        lazy_states: Iterable[Type[S]] = (),
+        **kwargs: Any,
+    ) -> None:
+        self.bound_state_type: Type[S] = bound_state_type
+
+        self._states: List[Type[S]] = [
+            *cast("List[Type[S]]", bound_state_type._eager_states),  # pyright: ignore[reportPrivateUsage]
+            *states,
+        ]
+        self._lazy_states: List[Type[S]] = [
+            *cast("List[Type[S]]", bound_state_type._lazy_states),  # pyright: ignore[reportPrivateUsage]
+            *lazy_states,
+        ]
+        bound_state_type._eager_states.clear()  # pyright: ignore[reportPrivateUsage]
+        bound_state_type._lazy_states.clear()  # pyright: ignore[reportPrivateUsage]
+
+        self._kwargs: Dict[str, Any] = kwargs
+        self._sessions: Set[AsyncStateManager[S]] = set()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def acquire(self, **kwargs: Any) -> AsyncStateManager[S]:
+        r"""
+        Allocates a new session manager with the pool's states loaded into it.
+
+        .. versionadded:: 2.5
+
+        :param \**kwargs:
+            | The keyword arguments to bind to the states of this session, overriding
+              the ones passed to the pool.
+
+        :returns:
+            | The manager of the session.
+        :rtype: AsyncStateManager
+        """
+        manager = AsyncStateManager(
+            bound_state_type=self.bound_state_type,
+            instance_binding=True,
+            **{**self._kwargs, **kwargs},
+        )
+        manager.add_lazy_states(*self._lazy_states)
+        await manager.load_states(*self._states)
+
+        self._sessions.add(manager)
+        return manager
+
+    async def release(self, manager: AsyncStateManager[S]) -> None:
+        r"""
+        Unloads every state of a session & removes it from the pool. Any lazy
+        states still being prefetched are cancelled.
+
+        .. versionadded:: 2.5
+
+        :param manager:
+            | The manager of the session as returned by :meth:`acquire`.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the manager doesn't belong to the pool.
+        """
+        if manager not in self._sessions:
+            msg = "The manager doesn't belong to this pool."
+            raise StateError(msg, last_state=manager.last_state)
+
+        self._sessions.remove(manager)
+        manager.is_running = False
+        for state_name in tuple(manager.lazy_state_map):
+            manager.remove_lazy_state(state_name)
+        for state_name in tuple(manager.state_map):
+            await manager.unload_state(state_name, force=True)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from src.game_state.async_machine.manager import AsyncStateManager
+from src.game_state.async_machine.state import AsyncState
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from typing import Any, Dict, Type
+
+
+__all__ = ("AsyncRegionManager",)
+
+
+S = TypeVar("S", bound="AsyncState[Any]")
+
+
+class AsyncRegionManager(Generic[S]):
+    r"""
+    Runs several independent regions side by side, such as the HUD, the world &
+    the ambience of a game. Every region is a :class:`AsyncStateManager` of its own with
+    its own current state, and :meth:`update` steps all of them together.
+
+    The region managers use instance binding, so the regions can share the same
+    state classes.
+
+    .. versionadded:: 2.5
+
+    .. code-block:: python
+
+        regions = AsyncRegionManager()
+        await regions.add_region("hud").load_states(Hud)
+        await regions.add_region("world").load_states(Overworld, Dungeon)
+
+        await regions["hud"].change_state("Hud")
+        await regions["world"].change_state("Overworld")
+
+        await regions.update(dt)
+
+    :param bound_state_type:
+        | The base state class which all states inherits from.
+    :type bound_state_type: type[AsyncState]
+    :param \**kwargs:
+        | The keyword arguments to bind to the states of every region.
+    """
+
+    def __init__(
+        self,
+        *,
+        bound_state_type: Type[S] = AsyncState,
+        **kwargs: Any,
+    ) -> None:
+        self.bound_state_type: Type[S] = bound_state_type
+
+        self._kwargs: Dict[str, Any] = kwargs
+        self._regions: Dict[str, AsyncStateManager[S]] = {}
+        self._region_view: Mapping[str, AsyncStateManager[S]] = (
+            MappingProxyType(self._regions)
+        )
+
+    def __getitem__(self, name: str) -> AsyncStateManager[S]:
+        return self._regions[name]
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    @property
+    def regions(self) -> Mapping[str, AsyncStateManager[S]]:
+        r"""
+        A read-only view of the region managers by their names.
+
+        .. versionadded:: 2.5
+
+        :type: typing.Mapping[str, AsyncStateManager]
+        """
+        return self._region_view
+
+    def add_region(self, name: str, **kwargs: Any) -> AsyncStateManager[S]:
+        r"""
+        Adds a new region.
+
+        .. versionadded:: 2.5
+
+        :param name:
+            | The name of the region.
+        :param \**kwargs:
+            | The keyword arguments to bind to the states of this region, overriding
+              the ones passed to the :class:`AsyncRegionManager`.
+
+        :returns:
+            | The manager of the region.
+        :rtype: AsyncStateManager
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when a region with the same name already exists.
+        """
+        if name in self._regions:
+            msg = f"Region `{name}` already exists."
+            raise StateError(msg)
+
+        manager = AsyncStateManager(
+            bound_state_type=self.bound_state_type,
+            instance_binding=True,
+            **{**self._kwargs, **kwargs},
+        )
+        self._regions[name] = manager
+        return manager
+
+    def remove_region(self, name: str) -> AsyncStateManager[S]:
+        r"""
+        Removes a region. Its states are left loaded in the returned manager.
+
+        .. versionadded:: 2.5
+
+        :param name:
+            | The name of the region.
+
+        :returns:
+            | The manager of the removed region.
+        :rtype: AsyncStateManager
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the region doesn't exist.
+        """
+        try:
+            return self._regions.pop(name)
+        except KeyError:
+            msg = f"Region `{name}` doesn't exist."
+            raise StateError(msg) from None
+
+    async def update(self, dt: float) -> None:
+        r"""
+        Calls :meth:`AsyncState.process_update` of the current state of every region
+        concurrently with :func:`asyncio.gather`. Regions without a current state
+        are skipped.
+
+        .. versionadded:: 2.5
+
+        :param dt:
+            | The time to advance the states by in seconds.
+        """
+        await asyncio.gather(
+            *(
+                manager.current_state.process_update(dt)
+                for manager in self._regions.values()
+                if manager.current_state is not None
+            )
+        )
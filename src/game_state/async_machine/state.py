@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from abc import ABC
 from typing import TYPE_CHECKING, Generic, TypeVar, overload
 
+from src.game_state.events import _compile_event_handlers  # pyright: ignore[reportPrivateUsage]
 from src.game_state.utils import MISSING
 
 if TYPE_CHECKING:
-    from typing import Any, List, Literal, Optional, Type
+    from collections.abc import Coroutine
+    from typing import Any, Dict, List, Literal, Optional, Set, Tuple, Type
 
     from src.game_state.async_machine.manager import AsyncStateManager
+    from src.game_state.events import _EventHandler  # pyright: ignore[reportPrivateUsage]
 
 
 __all__ = ("AsyncState",)
+logger = logging.getLogger(__name__)
 
 S = TypeVar("S", bound="AsyncState[Any]")
+T = TypeVar("T")
 
 
 class AsyncState(ABC, Generic[S]):
@@ -30,11 +37,38 @@ class AsyncState(ABC, Generic[S]):
             The manager to which the state is bound to.
 
             .. versionadded:: 2.4
+
+        neighbours: :class:`tuple` [:class:`str`, ...]
+            The names of the states likely to be switched to from this state. They're
+            prefetched in the background once this state has been entered when
+            :attr:`AsyncStateManager.auto_prefetch` is enabled.
+
+            .. versionadded:: 2.5
+
+        update_below: :class:`bool`
+            Whether the state covered by this state in the
+            :attr:`AsyncStateManager.state_stack` keeps being updated by
+            :meth:`AsyncStateManager.run`. ``False`` by default.
+
+            .. versionadded:: 2.5
+
+        render_below: :class:`bool`
+            Whether the state covered by this state in the
+            :attr:`AsyncStateManager.state_stack` keeps being rendered by
+            :meth:`AsyncStateManager.run`, such as a game drawn behind a pause menu.
+            ``False`` by default.
+
+            .. versionadded:: 2.5
     """
 
     state_name: str = MISSING
     manager: AsyncStateManager[AsyncState[S]] = MISSING
+    neighbours: Tuple[str, ...] = ()
+    update_below: bool = False
+    render_below: bool = False
 
+    _tasks: Optional[Set[asyncio.Task[Any]]] = None
+    _event_handlers: Dict[Any, Tuple[_EventHandler, ...]] = {}
     _eager_states: List[Type[AsyncState[S]]] = []
     _lazy_states: List[Type[AsyncState[S]]] = []
 
@@ -106,6 +140,7 @@ class AsyncState(ABC, Generic[S]):
             enable one (or none) of them.
         """
         cls.state_name = state_name or cls.__name__
+        cls._event_handlers = _compile_event_handlers(cls)
 
         if lazy_load and eager_load:
             msg = (
@@ -127,6 +162,12 @@ class AsyncState(ABC, Generic[S]):
         This listener is invoked both during the initial load of the state and
         when the state is reloaded.
 
+        .. versionchanged:: 2.5
+
+            | The listener can be an asynchronous generator yielding its loading
+              progress to be loaded over multiple frames with
+              :meth:`AsyncStateManager.begin_loading`.
+
         .. versionadded:: 2.4
 
         .. note::
@@ -157,6 +198,61 @@ class AsyncState(ABC, Generic[S]):
               the first time (``False``) or reloaded (``True``).
         """
 
+    def estimate_size(self) -> int:
+        r"""
+        Estimates the memory used by the state in bytes. Used by the
+        :class:`AsyncStateManager` to keep the loaded states within its
+        :attr:`AsyncStateManager.memory_budget`.
+
+        Returns ``0`` by default.
+
+        .. versionadded:: 2.5
+
+        :rtype: int
+        """
+        return 0
+
+    async def on_hibernate(self) -> Any:
+        r"""
+        Called before the state is unloaded when the :class:`AsyncStateManager` has a
+        :attr:`AsyncStateManager.hibernation_dir`. The returned snapshot is written to
+        disk & passed to :meth:`on_resume` the next time the state is switched to,
+        instead of initializing & loading the state again.
+
+        Returns ``None`` by default, which unloads the state as usual.
+
+        The snapshot is also saved by :meth:`AsyncStateManager.snapshot`, so this may be called
+        without the state being unloaded.
+
+        .. versionadded:: 2.5
+
+        .. note::
+
+            Snapshots are pickled unless the manager has a
+            :attr:`AsyncStateManager.hibernation_codec`. Large buffers such as
+            :class:`bytearray` or :class:`memoryview` can be wrapped in
+            :class:`pickle.PickleBuffer` to be written & read back without copies.
+            They're read back as read-only :class:`memoryview` objects of the snapshot
+            file, which stays mapped until they're released. Copy them, such as
+            through ``bytearray(buffer)``, to modify them. On Windows, where a mapped
+            file can't be removed, they're read back as copies instead.
+
+        :returns:
+            | The snapshot of the state or ``None``.
+        """
+        return None
+
+    async def on_resume(self, snapshot: Any) -> None:
+        r"""
+        Called instead of ``__init__`` & :meth:`on_load` when a hibernated state is
+        switched to, with the snapshot returned by :meth:`on_hibernate`.
+
+        .. versionadded:: 2.5
+
+        :param snapshot:
+            | The snapshot of the state.
+        """
+
     async def on_enter(self, previous_state: Optional[S]) -> None:
         r"""
         This listener is called once when a state has been switched and is
@@ -189,3 +285,99 @@ class AsyncState(ABC, Generic[S]):
             | The next state that is going to be applied.
         :type next_state: State
         """
+
+    async def process_event(self, event: Any) -> None:
+        r"""
+        Called by :meth:`AsyncStateManager.dispatch_event` for the events which aren't
+        handled by any of the state's listeners registered with
+        :func:`~game_state.events.on_event`.
+
+        .. versionadded:: 2.5
+
+        :param event:
+            | The event to be processed.
+        """
+
+    async def process_update(self, dt: float) -> None:
+        r"""
+        Called by :meth:`AsyncStateManager.run` to advance the state by a fixed timestep
+        while it's running.
+
+        .. versionadded:: 2.5
+
+        :param dt:
+            | The time to advance the state by in seconds.
+        """
+
+    async def process_render(self, alpha: float) -> None:
+        r"""
+        Called by :meth:`AsyncStateManager.run` once every frame after the updates while
+        the state is running.
+
+        .. versionadded:: 2.5
+
+        :param alpha:
+            | How far the frame is between the last & the next update, from ``0`` up
+              to ``1``. Useful for interpolating the positions drawn.
+        """
+
+    def create_task(
+        self, coro: Coroutine[Any, Any, T], *, name: Optional[str] = None
+    ) -> asyncio.Task[T]:
+        r"""
+        Schedules a coroutine as a task owned by the state. The tasks still running
+        are cancelled & awaited by the :class:`AsyncStateManager` once the state
+        has been left or unloaded, and once :meth:`AsyncStateManager.run` stops.
+
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            class Lobby(AsyncState):
+                async def on_enter(self, previous_state: AsyncState | None) -> None:
+                    self.create_task(self.poll_players())
+
+        :param coro:
+            | The coroutine to be scheduled.
+        :param name:
+            | Default ``None``.
+            |
+            | The name of the task.
+
+        :rtype: asyncio.Task
+        """
+        if self._tasks is None:
+            self._tasks = set()
+
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def cancel_tasks(self) -> None:
+        r"""
+        Cancels the tasks made through :meth:`create_task` which are still running
+        & waits for them to finish. Errors raised by the tasks are logged.
+
+        .. versionadded:: 2.5
+
+        .. note::
+
+            This method need not be called manually.
+        """
+        if not self._tasks:
+            return
+
+        tasks = tuple(self._tasks)
+        for task in tasks:
+            task.cancel()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for task, result in zip(tasks, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    "Task %s of state %s raised an error",
+                    task.get_name(),
+                    self.state_name,
+                    exc_info=result,
+                )
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import ast
+import importlib.util
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, cast
+
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional
+
+
+__all__ = ()
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the layout of the index changes, which discards older indexes.
+_INDEX_VERSION: int = 2
+
+
+def _discover_state_hooks(  # pyright: ignore[reportUnusedFunction]
+    package: str, index_path: Optional[str], state_type: type
+) -> Dict[str, str]:
+    # Maps the names of the states found in the package to the modules whose hook
+    # loads them. The package itself isn't imported, only its parents are.
+    spec = importlib.util.find_spec(package)
+    if spec is None or spec.submodule_search_locations is None:
+        msg = f"`{package}` isn't a package to discover states from."
+        raise StateError(msg)
+
+    index = _read_index(index_path)
+    entries: Dict[str, Dict[str, Any]] = {}
+    changed = False
+
+    for location in spec.submodule_search_locations:
+        for root, directories, files in os.walk(location):
+            directories[:] = sorted(
+                directory
+                for directory in directories
+                if not directory.startswith((".", "__"))
+            )
+
+            for file in sorted(files):
+                if not file.endswith(".py") or file == "__init__.py":
+                    continue
+
+                path = os.path.join(root, file)
+                module = ".".join(
+                    (
+                        package,
+                        *os.path.relpath(path, location)[:-3].split(os.sep),
+                    )
+                )
+                stat = os.stat(path)
+
+                entry = index.get(path)
+                if (
+                    entry is None
+                    or entry["module"] != module
+                    or entry["mtime_ns"] != stat.st_mtime_ns
+                    or entry["size"] != stat.st_size
+                ):
+                    logger.debug("Scanning state module: %s", module)
+                    entry = {
+                        "module": module,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        **_scan_module(path, module),
+                    }
+                    changed = True
+                entries[path] = entry
+
+    if index_path is not None and (changed or entries.keys() != index.keys()):
+        _write_index(index_path, entries)
+
+    classes: Dict[str, Dict[str, Any]] = {
+        f"{entry['module']}.{record['name']}": record
+        for entry in entries.values()
+        for record in entry["classes"]
+    }
+    resolved: Dict[str, bool] = {}
+
+    state_hooks: Dict[str, str] = {}
+    for entry in entries.values():
+        if not entry["hook"]:
+            continue
+
+        for record in entry["classes"]:
+            if not _is_state_class(
+                f"{entry['module']}.{record['name']}",
+                classes,
+                state_type,
+                resolved,
+            ):
+                continue
+
+            state_name = record["state_name"]
+            if state_name in state_hooks:
+                logger.warning(
+                    "State `%s` is defined in both %s & %s, using the former.",
+                    state_name,
+                    state_hooks[state_name],
+                    entry["module"],
+                )
+                continue
+            state_hooks[state_name] = entry["module"]
+
+    return state_hooks
+
+
+def _scan_module(path: str, module: str) -> Dict[str, Any]:
+    with open(path, "rb") as file:
+        tree = ast.parse(file.read(), path)
+
+    # The full names of what the module imports, by the names they're bound to.
+    imports: Dict[str, str] = {}
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname is None:
+                    top_level = alias.name.partition(".")[0]
+                    imports[top_level] = top_level
+                else:
+                    imports[alias.asname] = alias.name
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                source = importlib.util.resolve_name(
+                    "." * node.level + (node.module or ""),
+                    module.rpartition(".")[0],
+                )
+            except ImportError:
+                # A relative import past the top-level package, which fails anyway.
+                continue
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"{source}.{alias.name}"
+
+    # Every class defined at the top level of the module is recorded with the full
+    # names of its bases, which are resolved to tell the states apart once the
+    # module is discovered. Classes with bases other than (subscripted) names, such
+    # as calls, are skipped.
+    classes: List[Dict[str, Any]] = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or not node.bases:
+            continue
+
+        bases = [_resolve_base(base, imports, module) for base in node.bases]
+        if None in bases:
+            continue
+
+        state_name = node.name
+        for keyword in node.keywords:
+            if (
+                keyword.arg == "state_name"
+                and isinstance(keyword.value, ast.Constant)
+                and isinstance(keyword.value.value, str)
+            ):
+                state_name = keyword.value.value
+        classes.append(
+            {"name": node.name, "state_name": state_name, "bases": bases}
+        )
+
+    return {
+        "hook": any(
+            isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and node.name == "hook"
+            for node in tree.body
+        ),
+        "classes": classes,
+    }
+
+
+def _resolve_base(
+    node: ast.expr, imports: Dict[str, str], module: str
+) -> Optional[str]:
+    if isinstance(node, ast.Subscript):
+        node = node.value
+
+    attributes: List[str] = []
+    while isinstance(node, ast.Attribute):
+        attributes.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+
+    # Names which aren't imported are taken to be defined in the module itself.
+    return ".".join(
+        (imports.get(node.id, f"{module}.{node.id}"), *reversed(attributes))
+    )
+
+
+def _is_state_class(
+    name: str,
+    classes: Dict[str, Dict[str, Any]],
+    state_type: type,
+    resolved: Dict[str, bool],
+) -> bool:
+    if name in resolved:
+        return resolved[name]
+    # Guards against the bases of a class referring back to it.
+    resolved[name] = False
+
+    # Imported classes are checked as they are, while the classes of the package
+    # are resolved through the bases they were scanned with. Any other class isn't
+    # known without importing it, so it's not taken to be a state.
+    module_name, _, attribute = name.rpartition(".")
+    module = sys.modules.get(module_name)
+    if module is not None:
+        value = getattr(module, attribute, None)
+        result = isinstance(value, type) and issubclass(value, state_type)
+    elif name in classes:
+        result = any(
+            _is_state_class(base, classes, state_type, resolved)
+            for base in classes[name]["bases"]
+        )
+    else:
+        result = False
+
+    resolved[name] = result
+    return result
+
+
+def _read_index(index_path: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    if index_path is None:
+        return {}
+
+    try:
+        with open(index_path, encoding="utf-8") as file:
+            index: Dict[str, Any] = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(index, dict) or index.get("version") != _INDEX_VERSION:
+        return {}
+
+    modules = index.get("modules")
+    if not isinstance(modules, dict):
+        return {}
+
+    # A corrupt entry is dropped, so its module is scanned again.
+    entries: Dict[str, Dict[str, Any]] = {}
+    for path, entry in cast("Dict[str, Any]", modules).items():
+        if not isinstance(entry, dict):
+            continue
+        fields = cast("Dict[str, Any]", entry)
+        records = fields.get("classes")
+        if (
+            isinstance(fields.get("module"), str)
+            and isinstance(fields.get("mtime_ns"), int)
+            and isinstance(fields.get("size"), int)
+            and isinstance(fields.get("hook"), bool)
+            and isinstance(records, list)
+            and all(
+                _is_class_record(record)
+                for record in cast("List[Any]", records)
+            )
+        ):
+            entries[path] = fields
+    return entries
+
+
+def _is_class_record(record: Any) -> bool:
+    if not isinstance(record, dict):
+        return False
+
+    fields = cast("Dict[str, Any]", record)
+    bases = fields.get("bases")
+    return (
+        isinstance(fields.get("name"), str)
+        and isinstance(fields.get("state_name"), str)
+        and isinstance(bases, list)
+        and all(isinstance(base, str) for base in cast("List[Any]", bases))
+    )
+
+
+def _write_index(index_path: str, entries: Dict[str, Dict[str, Any]]) -> None:
+    directory = os.path.dirname(os.path.abspath(index_path))
+    descriptor, temporary_path = tempfile.mkstemp(
+        suffix=".json", prefix=".state-index-", dir=directory
+    )
+    try:
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump({"version": _INDEX_VERSION, "modules": entries}, file)
+        os.replace(temporary_path, index_path)
+    except OSError:
+        logger.warning("Could not write the state index: %s", index_path)
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
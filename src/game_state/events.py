@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Dict, List, Tuple
+
+    # The listener followed by the attributes & their values the event must have.
+    _EventHandler = Tuple[Callable[..., Any], Tuple[Tuple[str, Any], ...]]
+
+
+__all__ = ("on_event",)
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+_EVENTS_ATTRIBUTE: str = "__game_state_events__"
+
+
+def on_event(event_type: Any, **filters: Any) -> Callable[[F], F]:
+    r"""
+    Registers a state method as the listener of an event type. The decorator can be
+    stacked to listen to multiple events.
+
+    The listeners are collected when the state is subclassed, so that
+    :meth:`StateManager.dispatch_event` & :meth:`AsyncStateManager.dispatch_event`
+    can look up the listeners of an event by its ``type``.
+
+    .. versionadded:: 2.5
+
+    .. code-block:: python
+
+        class MainMenu(State):
+            @on_event(pygame.KEYDOWN, key=pygame.K_w)
+            def start_game(self, event: pygame.event.Event) -> None:
+                self.manager.change_state("Game")
+
+            @on_event(pygame.QUIT)
+            def quit(self, event: pygame.event.Event) -> None:
+                self.manager.is_running = False
+
+    .. note::
+
+        Overriding a decorated method in a subclass replaces its registrations, the
+        overriding method has to be decorated again to keep listening to the events.
+
+    :param event_type:
+        | The ``type`` of the events to listen to.
+    :param \**filters:
+        | The attributes & their values the event must have for the listener to be
+          called, such as ``key=pygame.K_w``.
+    """
+    registration = (event_type, tuple(filters.items()))
+
+    def decorator(func: F) -> F:
+        registrations: List[Tuple[Any, Tuple[Tuple[str, Any], ...]]] = getattr(
+            func, _EVENTS_ATTRIBUTE, []
+        )
+        setattr(func, _EVENTS_ATTRIBUTE, [*registrations, registration])
+        return func
+
+    return decorator
+
+
+def _compile_event_handlers(  # pyright: ignore[reportUnusedFunction]
+    cls: type,
+) -> Dict[Any, Tuple[_EventHandler, ...]]:
+    # Walks the MRO from the base so that the methods of the subclasses replace the
+    # ones they override.
+    methods: Dict[str, Any] = {}
+    for klass in reversed(cls.__mro__):
+        methods.update(klass.__dict__)
+
+    handlers: Dict[Any, List[_EventHandler]] = {}
+    for method in methods.values():
+        for event_type, filters in getattr(method, _EVENTS_ATTRIBUTE, ()):
+            handlers.setdefault(event_type, []).append((method, filters))
+
+    return {
+        event_type: tuple(listeners)
+        for event_type, listeners in handlers.items()
+    }
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import time
+from array import array
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import Dict, List, Optional, Tuple
+
+
+__all__ = ("Transition", "TransitionHistory")
+
+# The handle stored for a transition from no state.
+_NO_STATE: int = -1
+
+
+class Transition(NamedTuple):
+    r"""
+    A transition recorded by :class:`TransitionHistory`.
+
+    .. versionadded:: 2.5
+
+    :param from_state:
+        | The name of the state which was left, ``None`` for the first transition.
+    :param to_state:
+        | The name of the state which was entered.
+    :param timestamp_ns:
+        | When the transition started, from :func:`time.perf_counter_ns`.
+    :param duration_ns:
+        | How long the transition took, including its listeners.
+    """
+
+    from_state: Optional[str]
+    to_state: str
+    timestamp_ns: int
+    duration_ns: int
+
+
+class TransitionHistory:
+    r"""
+    A fixed-size history of the most recent transitions of a manager, made by
+    :meth:`StateManager.enable_history`. Once full, the oldest transitions are
+    overwritten.
+
+    The transitions are stored by the handles of their states in arrays allocated
+    upfront, so recording a transition doesn't allocate.
+
+    .. versionadded:: 2.5
+
+    .. code-block:: python
+
+        history = manager.enable_history(256)
+        ...
+        previous = history.last(2)[0].to_state
+        print(history.dwell_times())
+
+    :attributes:
+        capacity: :class:`int`
+            The maximum amount of transitions kept.
+
+        total: :class:`int`
+            The amount of transitions recorded since the history was made or
+            cleared, including the overwritten ones.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "_durations",
+        "_from_handles",
+        "_state_names",
+        "_timestamps",
+        "_to_handles",
+        "capacity",
+        "total",
+    )
+
+    def __init__(self, capacity: int, state_names: Sequence[str]) -> None:
+        if capacity <= 0:
+            msg = "The capacity must be positive."
+            raise ValueError(msg)
+
+        self.capacity: int = capacity
+        self.total: int = 0
+        self._state_names: Sequence[str] = state_names
+        self._from_handles: array[int] = array("q", bytes(8 * capacity))
+        self._to_handles: array[int] = array("q", bytes(8 * capacity))
+        self._timestamps: array[int] = array("q", bytes(8 * capacity))
+        self._durations: array[int] = array("q", bytes(8 * capacity))
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def record(
+        self,
+        from_handle: Optional[int],
+        to_handle: int,
+        timestamp_ns: int,
+        duration_ns: int,
+    ) -> None:
+        r"""
+        Records a transition. Called by the manager.
+
+        :param from_handle:
+            | The handle of the state which was left, if any.
+        :param to_handle:
+            | The handle of the state which was entered.
+        :param timestamp_ns:
+            | When the transition started, from :func:`time.perf_counter_ns`.
+        :param duration_ns:
+            | How long the transition took.
+        """
+        index = self.total % self.capacity
+        self._from_handles[index] = (
+            _NO_STATE if from_handle is None else from_handle
+        )
+        self._to_handles[index] = to_handle
+        self._timestamps[index] = timestamp_ns
+        self._durations[index] = duration_ns
+        self.total += 1
+
+    def clear(self) -> None:
+        r"""
+        Forgets the recorded transitions, such as when a new session starts. The
+        arrays are kept to be reused.
+        """
+        self.total = 0
+
+    def _indexes(self, amount: int) -> range:
+        # The indexes of the last ``amount`` transitions, oldest first. They may
+        # go below zero, which wraps around to the end of the arrays.
+        end = self.total % self.capacity
+        return range(end - min(amount, len(self)), end)
+
+    def last(self, amount: int) -> List[Transition]:
+        r"""
+        Returns the most recent transitions, oldest first.
+
+        :param amount:
+            | The maximum amount of transitions to be returned.
+
+        :rtype: typing.List[Transition]
+        """
+        names = self._state_names
+        transitions: List[Transition] = []
+        for index in self._indexes(amount):
+            from_handle = self._from_handles[index]
+            transitions.append(
+                Transition(
+                    None if from_handle == _NO_STATE else names[from_handle],
+                    names[self._to_handles[index]],
+                    self._timestamps[index],
+                    self._durations[index],
+                )
+            )
+        return transitions
+
+    def dwell_times(self, now_ns: Optional[int] = None) -> Dict[str, int]:
+        r"""
+        Sums up how long each state stayed entered over the recorded transitions,
+        in nanoseconds. The most recently entered state is counted up to
+        ``now_ns``.
+
+        :param now_ns:
+            | Default ``None``.
+            |
+            | The time to count the most recently entered state up to, from
+              :func:`time.perf_counter_ns`. The current time when not passed.
+
+        :rtype: typing.Dict[str, int]
+        """
+        if self.total == 0:
+            return {}
+
+        names = self._state_names
+        dwell_times: Dict[str, int] = {}
+        indexes = self._indexes(len(self))
+        ends = [self._timestamps[index] for index in indexes[1:]]
+        ends.append(time.perf_counter_ns() if now_ns is None else now_ns)
+
+        for index, ended in zip(indexes, ends):
+            state_name = names[self._to_handles[index]]
+            dwell_times[state_name] = (
+                dwell_times.get(state_name, 0)
+                + ended
+                - self._timestamps[index]
+            )
+        return dwell_times
+
+    def counts(self) -> Dict[Tuple[Optional[str], str], int]:
+        r"""
+        Counts the recorded transitions by the states they went from & to.
+
+        :rtype: typing.Dict[typing.Tuple[typing.Optional[str], str], int]
+        """
+        pairs: Dict[Tuple[int, int], int] = {}
+        for index in self._indexes(len(self)):
+            pair = (self._from_handles[index], self._to_handles[index])
+            pairs[pair] = pairs.get(pair, 0) + 1
+
+        names = self._state_names
+        return {
+            (
+                None if from_handle == _NO_STATE else names[from_handle],
+                names[to_handle],
+            ): count
+            for (from_handle, to_handle), count in pairs.items()
+        }
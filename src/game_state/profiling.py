@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+
+    # The category, name, start, end & thread of a span.
+    _Span = Tuple[str, str, int, int, int]
+
+
+__all__ = ("PROFILE_ENV", "StartupProfiler")
+
+PROFILE_ENV: str = "GAME_STATE_PROFILE"
+
+
+class StartupProfiler:
+    r"""
+    Records how long the state files take to be imported & hooked up, and how
+    long the states take to be initialized & loaded. The recorded spans can be
+    ranked through :meth:`report` or opened on a timeline through
+    :meth:`export_chrome_trace`.
+
+    The managers record into their :attr:`StateManager.profiler`, which is set
+    from the ``GAME_STATE_PROFILE`` environment variable by default:
+
+    - ``GAME_STATE_PROFILE=1`` prints the report when the program exits.
+    - ``GAME_STATE_PROFILE=path/to/trace.json`` also writes the Chrome trace to
+      the given path.
+
+    The following spans are recorded, by their category:
+
+    - ``import`` & ``hook`` for the state files of
+      :meth:`StateManager.connect_state_hook`.
+    - ``init`` for initializing a state.
+    - ``on_load`` & ``global_on_load`` for the load listeners.
+
+    .. versionadded:: 2.5
+
+    .. code-block:: python
+
+        manager.profiler = StartupProfiler()
+        manager.connect_state_hook("states.game")
+        print(manager.profiler.report())
+    """
+
+    __slots__: Tuple[str, ...] = ("_origin", "_spans")
+
+    def __init__(self) -> None:
+        self._origin: int = time.perf_counter_ns()
+        self._spans: List[_Span] = []
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def record(self, category: str, name: str, started: int) -> None:
+        r"""
+        Records a span which ends now.
+
+        :param category:
+            | The category of the span, such as ``import`` or ``on_load``.
+        :param name:
+            | The name of the span, such as the name of the state.
+        :param started:
+            | When the span started, from :func:`time.perf_counter_ns`.
+        """
+        # Appending is atomic, so states loaded on an executor can record too.
+        self._spans.append(
+            (
+                category,
+                name,
+                started,
+                time.perf_counter_ns(),
+                threading.get_ident(),
+            )
+        )
+
+    def clear(self) -> None:
+        r"""
+        Removes the recorded spans, such as once the game has started & only the
+        later spans are of interest.
+        """
+        self._spans.clear()
+
+    def report(self, limit: Optional[int] = 20) -> str:
+        r"""
+        Ranks the recorded spans by the total time taken, grouped by their
+        category & name. Nested spans are counted in their parent spans too, so
+        an ``import`` includes the ``init`` of the states made while importing.
+
+        :param limit:
+            | Default ``20``.
+            |
+            | The amount of rows to be included. ``None`` includes every row.
+
+        :rtype: str
+        """
+        totals: Dict[Tuple[str, str], List[int]] = {}
+        for category, name, started, ended, _ in self._spans:
+            total = totals.setdefault((category, name), [0, 0])
+            total[0] += ended - started
+            total[1] += 1
+
+        elapsed = (
+            max(span[3] for span in self._spans)
+            - min(span[2] for span in self._spans)
+            if self._spans
+            else 0
+        )
+        lines = [
+            (
+                f"Startup profile: {elapsed / 1e6:.3f} ms over "
+                f"{len(self._spans)} spans"
+            ),
+            (
+                f"{'rank':>4}  {'total ms':>10}  {'share':>6}  {'count':>5}  "
+                f"{'category':<14}  name"
+            ),
+        ]
+
+        ranked = sorted(
+            totals.items(), key=lambda item: item[1][0], reverse=True
+        )
+        for rank, ((category, name), (total, count)) in enumerate(
+            ranked[:limit], 1
+        ):
+            share = total / elapsed if elapsed else 0.0
+            lines.append(
+                f"{rank:>4}  {total / 1e6:>10.3f}  {share:>6.1%}  {count:>5}  "
+                f"{category:<14}  {name}"
+            )
+
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str) -> None:
+        r"""
+        Writes the recorded spans as Chrome trace-event JSON, which can be opened
+        in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+        :param path:
+            | The file to write the trace to.
+        """
+        process = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (started - self._origin) / 1000,
+                "dur": (ended - started) / 1000,
+                "pid": process,
+                "tid": thread,
+            }
+            for category, name, started, ended, thread in self._spans
+        ]
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+
+    def dump(self, trace_path: Optional[str] = None) -> None:
+        r"""
+        Prints the full :meth:`report` to :data:`sys.stderr`, which is what
+        ``GAME_STATE_PROFILE`` does when the program exits.
+
+        :param trace_path:
+            | Default ``None``.
+            |
+            | The file to also write the Chrome trace to, through
+              :meth:`export_chrome_trace`.
+        """
+        sys.stderr.write(self.report(None) + "\n")
+        if trace_path is not None:
+            self.export_chrome_trace(trace_path)
+
+
+@lru_cache(maxsize=None)  # noqa: UP033
+def _get_environment_profiler() -> Optional[StartupProfiler]:
+    # Made on the first manager, so the variable can be set until then.
+    value = os.environ.get(PROFILE_ENV, "")
+    if value in ("", "0"):
+        return None
+
+    profiler = StartupProfiler()
+    atexit.register(profiler.dump, None if value == "1" else value)
+    return profiler
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from threading import Lock
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import List, Tuple
+
+
+__all__ = ("LatencyHistogram", "TimingStats")
+
+_BUCKETS: int = 64
+
+
+@dataclass(frozen=True)
+class TimingStats:
+    r"""
+    A summary of the timings recorded for an operation or listener. All the
+    timings are in nanoseconds.
+
+    .. versionadded:: 2.5
+
+    :param count:
+        | The amount of times the operation has been timed.
+    :param total_ns:
+        | The total time taken by the operation.
+    :param p50_ns:
+        | The median time taken by the operation.
+    :param p95_ns:
+        | The 95th percentile of the time taken by the operation.
+    :param max_ns:
+        | The longest time taken by the operation.
+    """
+
+    count: int
+    total_ns: int
+    p50_ns: int
+    p95_ns: int
+    max_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        r"""
+        The average time taken by the operation.
+
+        :rtype: float
+        """
+        return self.total_ns / self.count if self.count else 0.0
+
+
+class LatencyHistogram:
+    r"""
+    A fixed-size histogram of timings in nanoseconds. Timings are counted into
+    power of two buckets, so the percentiles are accurate to within a factor of
+    two while recording stays constant in time & memory.
+
+    .. versionadded:: 2.5
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "_buckets",
+        "_lock",
+        "count",
+        "max_ns",
+        "total_ns",
+    )
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.max_ns: int = 0
+        self._buckets: List[int] = [0] * _BUCKETS
+        self._lock: Lock = Lock()
+
+    def record(self, elapsed_ns: int) -> None:
+        r"""
+        Records a timing into the histogram.
+
+        :param elapsed_ns:
+            | The timing to be recorded in nanoseconds.
+        """
+        with self._lock:
+            self.count += 1
+            self.total_ns += elapsed_ns
+            self.max_ns = max(elapsed_ns, self.max_ns)
+            self._buckets[min(elapsed_ns.bit_length(), _BUCKETS - 1)] += 1
+
+    def percentile(self, percent: float) -> int:
+        r"""
+        Estimates the given percentile of the recorded timings. The upper bound of
+        the bucket holding the percentile is returned, capped by the longest recorded
+        timing.
+
+        :param percent:
+            | The percentile to estimate, between ``0`` & ``100``.
+
+        :rtype: int
+        """
+        if self.count == 0:
+            return 0
+
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index, amount in enumerate(self._buckets):
+            seen += amount
+            if seen >= rank:
+                return min((1 << index) - 1, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> TimingStats:
+        r"""
+        Summarizes the recorded timings.
+
+        :rtype: TimingStats
+        """
+        return TimingStats(
+            count=self.count,
+            total_ns=self.total_ns,
+            p50_ns=self.percentile(50),
+            p95_ns=self.percentile(95),
+            max_ns=self.max_ns,
+        )
@@ -1,4 +1,11 @@
 from .manager import StateManager
+from .pool import StateManagerPool
+from .regions import RegionManager
 from .state import State
 
-__all__ = ("State", "StateManager")
+__all__ = (
+    "RegionManager",
+    "State",
+    "StateManager",
+    "StateManagerPool",
+)
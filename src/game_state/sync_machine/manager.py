@@ -3,13 +3,35 @@ from __future__ import annotations
 import importlib
 import inspect
 import logging
-from typing import TYPE_CHECKING, Generic, TypeVar
-
+import pickle
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
+from enum import IntEnum
+from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from src.game_state.discovery import (
+    _discover_state_hooks,  # pyright: ignore[reportPrivateUsage]
+)
 from src.game_state.errors import StateError, StateLoadError
+from src.game_state.history import TransitionHistory
+from src.game_state.profiling import (
+    _get_environment_profiler,  # pyright: ignore[reportPrivateUsage]
+)
+from src.game_state.stats import LatencyHistogram
 from src.game_state.sync_machine.state import State
+from src.game_state.utils import (
+    MISSING,
+    _read_snapshot,  # pyright: ignore[reportPrivateUsage]
+    _remove_snapshot,  # pyright: ignore[reportPrivateUsage]
+    _write_snapshot,  # pyright: ignore[reportPrivateUsage]
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+    from concurrent.futures import Executor, Future
     from inspect import Signature
     from typing import (
         Any,
@@ -17,12 +39,25 @@ if TYPE_CHECKING:
         List,
         NoReturn,
         Optional,
+        Set,
         Tuple,
         Type,
+        Union,
     )
 
+    from src.game_state.profiling import StartupProfiler
+    from src.game_state.stats import TimingStats
+    from src.game_state.tracing import Tracer
     from src.game_state.utils import StateArgs
 
+    # The state followed by its (label, hook) pairs called while leaving
+    # & entering the state respectively.
+    _DispatchPlan = Tuple[
+        Any,
+        Tuple[Tuple[str, Callable[[Any], Any]], ...],
+        Tuple[Tuple[str, Callable[[Any], Any]], ...],
+    ]
+
 
 __all__ = ("StateManager",)
 logger = logging.getLogger(__name__)
@@ -34,9 +69,47 @@ _GLOBAL_ON_ENTER_ARGS: int = 2
 _GLOBAL_ON_LEAVE_ARGS: int = 2
 _GLOBAL_ON_LOAD_ARGS: int = 2
 _GLOBAL_ON_UNLOAD_ARGS: int = 2
+# The events of ``add_listener`` & the amount of arguments their listeners take.
+_GLOBAL_LISTENER_ARGS: Dict[str, int] = {
+    "global_on_enter": _GLOBAL_ON_ENTER_ARGS,
+    "global_on_leave": _GLOBAL_ON_LEAVE_ARGS,
+    "global_on_load": _GLOBAL_ON_LOAD_ARGS,
+    "global_on_unload": _GLOBAL_ON_UNLOAD_ARGS,
+}
+# Bumped whenever the layout of the data returned by ``snapshot`` changes.
+_SNAPSHOT_VERSION: int = 1
 _KW_CONSIDER: Tuple[str, str] = ("VAR_KEYWORD", "KEYWORD_ONLY")
 
 
+def _is_overridden(state: State[Any], listener: str) -> bool:
+    return listener in state.__dict__ or getattr(
+        type(state), listener
+    ) is not getattr(State, listener)
+
+
+class _PendingLoad(Generic[S]):
+    __slots__: Tuple[str, ...] = (
+        "instance",
+        "loader",
+        "progress",
+        "state_name",
+        "switch",
+    )
+
+    def __init__(
+        self,
+        state_name: str,
+        instance: Optional[S],
+        loader: Optional[Iterator[Optional[float]]],
+        switch: bool,
+    ) -> None:
+        self.state_name: str = state_name
+        self.instance: Optional[S] = instance
+        self.loader: Optional[Iterator[Optional[float]]] = loader
+        self.progress: float = 0.0 if loader else 1.0
+        self.switch: bool = switch
+
+
 class StateManager(Generic[S]):
     r"""
     The State Manager used for managing multiple State(s).
@@ -44,6 +117,20 @@ class StateManager(Generic[S]):
     :param bound_state_type:
         | The base state class which all states inherits from.
     :type bound_state_type: type[State]
+    :param instance_binding:
+        | Default ``False``.
+        |
+        | Binds the manager & the keyword arguments to every state instance made by
+          the manager instead of ``bound_state_type``. This allows multiple managers
+          to share the same state classes.
+
+        .. versionadded:: 2.5
+
+        .. note::
+          States marked with ``eager_load`` or ``lazy_load`` aren't picked up by
+          managers using instance binding. Pass them to :meth:`load_states` or
+          :meth:`add_lazy_states` instead.
+
     :param \**kwargs:
         | The keyword arguments to bind to ``bound_state_type``.
 
@@ -52,35 +139,152 @@ class StateManager(Generic[S]):
             .. versionadded:: 2.0
 
             A bool for controlling the game loop. ``True`` by default.
+
+        auto_prefetch: :class:`bool`
+            .. versionadded:: 2.5
+
+            Whether to :meth:`prefetch` the lazy :attr:`State.neighbours` of a state
+            in the background once it has been entered. ``False`` by default.
+
+        max_resident_states: :class:`int` | :class:`None`
+            .. versionadded:: 2.5
+
+            The maximum amount of states to be kept loaded. Once exceeded, the least
+            recently entered states are unloaded and added back as lazy states with
+            their original :class:`StateArgs`. ``None`` (no limit) by default.
+
+        memory_budget: :class:`int` | :class:`None`
+            .. versionadded:: 2.5
+
+            The maximum total size (as estimated by :meth:`State.estimate_size`) of the
+            loaded states. Once exceeded, the least recently entered states are
+            unloaded the same way as with ``max_resident_states``. ``None`` (no
+            limit) by default.
+
+        .. note::
+
+            The limits are enforced every time a state is entered. The current state
+            and the states pinned through :meth:`pin_state` are never unloaded.
+
+        deferred_transitions: :class:`bool`
+            .. versionadded:: 2.5
+
+            Whether :meth:`change_state`, :meth:`push_state` & :meth:`pop_state` only
+            queue the transition to be applied by :meth:`apply_transitions`, which
+            :meth:`run` calls after the events & after the updates of every frame.
+            ``False`` by default.
+
+        parent: :class:`StateManager` | :class:`None`
+            .. versionadded:: 2.5
+
+            The manager which made this manager through :meth:`create_child`.
+            ``None`` by default.
+
+        hibernation_dir: :class:`str` | :class:`None`
+            .. versionadded:: 2.5
+
+            The directory to write the snapshots of hibernated states to. When set,
+            :meth:`unload_state` calls :meth:`State.on_hibernate` & keeps the states
+            which return a snapshot as lazy states. Switching back to them restores
+            the snapshot through :meth:`State.on_resume` instead of loading them
+            again. ``None`` (no hibernation) by default.
+
+        hibernation_codec: :class:`typing.Any` | :class:`None`
+            .. versionadded:: 2.5
+
+            An object with ``dumps(snapshot) -> bytes`` & ``loads(data) -> snapshot``
+            methods used to encode the snapshots instead of :mod:`pickle`. ``None``
+            by default.
+
+        profiler: :class:`~game_state.profiling.StartupProfiler` | :class:`None`
+            .. versionadded:: 2.5
+
+            The profiler to record the imports, hooks, initialization & loading of
+            the states into. Set from the ``GAME_STATE_PROFILE`` environment
+            variable by default, otherwise ``None``.
     """
 
     def __init__(
         self,
         *,
         bound_state_type: Type[S] = State,
+        instance_binding: bool = False,
         **kwargs: Any,
     ) -> None:
         self.bound_state_type: Type[S] = bound_state_type
-        self.bound_state_type.manager = self  # pyright: ignore[reportAttributeAccessIssue]
+        self._bindings: Optional[Dict[str, Any]] = None
+
+        if instance_binding:
+            self._bindings = {"manager": self, **kwargs}
+        else:
+            self.bound_state_type.manager = self  # pyright: ignore[reportAttributeAccessIssue]
 
-        for name, value in kwargs.items():
-            setattr(self.bound_state_type, name, value)
+            for name, value in kwargs.items():
+                setattr(self.bound_state_type, name, value)
 
         self.is_running: bool = True
+        self.auto_prefetch: bool = False
+        self.max_resident_states: Optional[int] = None
+        self.memory_budget: Optional[int] = None
+        self.deferred_transitions: bool = False
+        self.hibernation_dir: Optional[str] = None
+        self.hibernation_codec: Optional[Any] = None
+        self.profiler: Optional[StartupProfiler] = _get_environment_profiler()
+        self.parent: Optional[StateManager[Any]] = None
 
         # fmt: off
         self._global_on_enter: Optional[Callable[[S, Optional[S]], None]] = None
         self._global_on_leave: Optional[Callable[[Optional[S], S], None]] = None
         self._global_on_load: Optional[Callable[[S, bool], None]] = None
+        self._global_on_unload: Optional[Callable[[S, bool], None]] = None
         # fmt: on
 
         self._lazy_states: Dict[
             str, Tuple[Type[S], Optional[List[StateArgs]]]
         ] = {}
         self._states: Dict[str, S] = {}
+        self._lazy_state_view: Mapping[
+            str, Tuple[Type[S], Optional[List[StateArgs]]]
+        ] = MappingProxyType(self._lazy_states)
+        self._state_view: Mapping[str, S] = MappingProxyType(self._states)
         self._current_state: Optional[S] = None
         self._last_state: Optional[S] = None
+        self._state_stack: List[S] = []
+        # The transitions queued by ``_transition`` along with their arguments.
+        self._queued_transitions: List[
+            Tuple[Callable[[Any], Any], Optional[Union[str, int]]]
+        ] = []
+        self._transitioning: bool = False
+        self._children: Dict[str, StateManager[Any]] = {}
+        self._initial_state: Optional[str] = None
         self._is_reloading: bool = False
+        self._prefetching: Dict[str, Future[S]] = {}
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_load: Optional[_PendingLoad[S]] = None
+        self._state_args: Dict[str, Optional[StateArgs]] = {}
+        self._recently_entered: Dict[str, None] = {}
+        self._pinned_states: Set[str] = set()
+        self._dispatch_plans: Dict[str, _DispatchPlan] = {}
+        self._handles: Dict[str, int] = {}
+        self._handle_view: Mapping[str, int] = MappingProxyType(self._handles)
+        self._handle_names: List[str] = []
+        self._handle_table: List[Optional[S]] = []
+        self._stats: Optional[Dict[str, LatencyHistogram]] = None
+        self._tracer: Optional[Tracer] = None
+        self._history: Optional[TransitionHistory] = None
+        # Whether the stats or the tracer are enabled.
+        self._timing: bool = False
+        self._hibernated: Dict[str, str] = {}
+        self._snapshot_cache: Dict[str, bytes] = {}
+        self._state_hooks: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # The priority & listener of everything added through ``add_listener``
+        # by event, and the listeners of every event in the order they're called.
+        self._global_listeners: Dict[
+            str, List[Tuple[int, Callable[..., Any]]]
+        ] = {event: [] for event in _GLOBAL_LISTENER_ARGS}
+        self._listener_chains: Dict[str, Tuple[Callable[..., Any], ...]] = (
+            dict.fromkeys(_GLOBAL_LISTENER_ARGS, ())
+        )
 
     def _get_kw_args(self, signature: Signature) -> int:
         amount = 0
@@ -141,15 +345,45 @@ class StateManager(Generic[S]):
         msg = "Cannot overwrite the last state."
         raise ValueError(msg)
 
+    @property
+    def state_stack(self) -> Tuple[S, ...]:
+        r"""
+        The states covered by the states pushed with :meth:`push_state`, from the
+        bottom of the stack to the top, followed by the current state. Empty if no
+        state has been entered.
+
+        .. versionadded:: 2.5
+
+        :type: typing.Tuple[State, ...]
+
+        .. note::
+
+            This is a read-only attribute. To change the stack use
+            :meth:`push_state` & :meth:`pop_state` instead.
+        """
+        if self._current_state is None:
+            return ()
+        return (*self._state_stack, self._current_state)
+
+    @state_stack.setter
+    def state_stack(self, _: Any) -> NoReturn:
+        msg = "Cannot overwrite the state stack. Use `StateManager.push_state` & `StateManager.pop_state` instead."
+        raise ValueError(msg)
+
     @property
     def lazy_state_map(
         self,
-    ) -> Dict[str, Tuple[Type[S], Optional[List[StateArgs]]]]:
+    ) -> Mapping[str, Tuple[Type[S], Optional[List[StateArgs]]]]:
         r"""
-        A dictionary copy of all the added lazy state names mapped to their respective
-        type and state args.
+        A read-only live view of all the added lazy state names mapped to their
+        respective type and state args. Use :meth:`copy_lazy_state_map` for a
+        dictionary copy.
+
+        :type: typing.Mapping[str, tuple[type[State], None | list[StateArgs]]]
 
-        :type: dict[str, tuple[type[State], None | list[StateArgs]]]
+        .. versionchanged:: 2.5
+
+            | Returns a read-only view instead of a dictionary copy.
 
         .. versionadded:: 2.2
 
@@ -162,7 +396,7 @@ class StateManager(Generic[S]):
             Once the lazy state has been fully initialized, it will be removed from the
             lazy state map.
         """
-        return self._lazy_states.copy()
+        return self._lazy_state_view
 
     @lazy_state_map.setter
     def lazy_state_map(self, _: Any) -> NoReturn:
@@ -170,11 +404,16 @@ class StateManager(Generic[S]):
         raise ValueError(msg)
 
     @property
-    def state_map(self) -> Dict[str, S]:
+    def state_map(self) -> Mapping[str, S]:
         r"""
-        A dictionary copy of all the state names mapped to their respective instance.
+        A read-only live view of all the state names mapped to their respective
+        instance. Use :meth:`copy_state_map` for a dictionary copy.
+
+        :type: typing.Mapping[str, State]
+
+        .. versionchanged:: 2.5
 
-        :type: dict[str, State]
+            | Returns a read-only view instead of a dictionary copy.
 
         .. versionchanged:: 2.0
 
@@ -186,13 +425,37 @@ class StateManager(Generic[S]):
 
             This is a read-only attribute.
         """
-        return self._states.copy()
+        return self._state_view
 
     @state_map.setter
     def state_map(self, _: Any) -> NoReturn:
         msg = "Cannot overwrite the state map."
         raise ValueError(msg)
 
+    def copy_state_map(self) -> Dict[str, S]:
+        r"""
+        Returns a dictionary copy of all the state names mapped to their respective
+        instance.
+
+        .. versionadded:: 2.5
+
+        :rtype: dict[str, State]
+        """
+        return self._states.copy()
+
+    def copy_lazy_state_map(
+        self,
+    ) -> Dict[str, Tuple[Type[S], Optional[List[StateArgs]]]]:
+        r"""
+        Returns a dictionary copy of all the added lazy state names mapped to their
+        respective type and state args.
+
+        .. versionadded:: 2.5
+
+        :rtype: dict[str, tuple[type[State], None | list[StateArgs]]]
+        """
+        return self._lazy_states.copy()
+
     @property
     def global_on_enter(
         self,
@@ -202,6 +465,10 @@ class StateManager(Generic[S]):
 
         :type: None | typing.Callable[[State, typing.Optional[State]], None]
 
+        .. versionchanged:: 2.5
+
+            | More listeners can be added through :meth:`add_listener`.
+
         .. versionchanged:: 2.0.3
 
             | Global listeners can accept :class:`None` now.
@@ -257,6 +524,7 @@ class StateManager(Generic[S]):
                 )
 
         self._global_on_enter = value
+        self._compile_listeners("global_on_enter")
 
     @property
     def global_on_leave(
@@ -267,6 +535,10 @@ class StateManager(Generic[S]):
 
         :type: None | typing.Callable[[typing.Optional[State], State], None]
 
+        .. versionchanged:: 2.5
+
+            | More listeners can be added through :meth:`add_listener`.
+
         .. versionchanged:: 2.0.3
 
             | Global listeners can accept :class:`None` now.
@@ -322,6 +594,7 @@ class StateManager(Generic[S]):
                 )
 
         self._global_on_leave = value
+        self._compile_listeners("global_on_leave")
 
     @property
     def global_on_load(self) -> Optional[Callable[[S, bool], None]]:
@@ -330,6 +603,10 @@ class StateManager(Generic[S]):
 
         :type: None | typing.Callable[[State, bool], None]
 
+        .. versionchanged:: 2.5
+
+            | More listeners can be added through :meth:`add_listener`.
+
         .. versionadded:: 2.3
 
         .. note::
@@ -380,14 +657,20 @@ class StateManager(Generic[S]):
                 )
 
         self._global_on_load = value
+        self._compile_listeners("global_on_load")
 
     @property
     def global_on_unload(self) -> Optional[Callable[[S, bool], None]]:
         r"""
-        The global :meth:`State.on_unload` function for all states.
+        The global :meth:`State.on_unload` function for all states. It's called by
+        :meth:`unload_state` before the state is torn down.
 
         :type: None | typing.Callable[[State, bool], None]
 
+        .. versionchanged:: 2.5
+
+            | More listeners can be added through :meth:`add_listener`.
+
         .. versionadded:: 2.3
 
         .. note::
@@ -411,7 +694,7 @@ class StateManager(Generic[S]):
 
             your_manager_instance.global_on_unload = global_on_unload
         """
-        return self._global_on_load
+        return self._global_on_unload
 
     @global_on_unload.setter
     def global_on_unload(
@@ -423,7 +706,7 @@ class StateManager(Generic[S]):
             kw_args = self._get_kw_args(on_unload_signature)
 
             if (
-                len(on_unload_signature.parameters) != _GLOBAL_ON_LOAD_ARGS
+                len(on_unload_signature.parameters) != _GLOBAL_ON_UNLOAD_ARGS
                 or kw_args != 0
             ):
                 raise TypeError(
@@ -437,252 +720,1945 @@ class StateManager(Generic[S]):
                     )
                 )
 
-        self._global_on_load = value
+        self._global_on_unload = value
+        self._compile_listeners("global_on_unload")
 
-    def change_state(self, state_name: str) -> None:
+    def add_listener(
+        self,
+        event: str,
+        listener: Callable[..., None],
+        *,
+        priority: int = 0,
+    ) -> None:
         r"""
-        Changes the current state and updates the last state. This method executes
-        the :meth:`State.on_leave` & :meth:`State.on_enter` state & global listeners
-        (:meth:`global_on_leave` & :meth:`global_on_enter`).
+        Adds another listener to a global listener, letting several listeners
+        share an event without wrapping each other. The listeners are called
+        with the same arguments as the global listener they are added to.
 
-        .. versionadded:: 1.0
+        The listeners of an event are called from the highest priority to the
+        lowest. The one assigned to the global listener itself has the priority
+        ``0`` & runs first among the listeners of the same priority, and the
+        rest run in the order they were added.
 
-        :param state_name:
-            | The name of the state you want to switch to.
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            your_manager_instance.add_listener("global_on_enter", reset_input)
+            your_manager_instance.add_listener(
+                "global_on_enter", record_analytics, priority=-10
+            )
+
+        :param event:
+            | The global listener to add to. Either ``global_on_enter``,
+              ``global_on_leave``, ``global_on_load`` or ``global_on_unload``.
+        :param listener:
+            | The listener to be added.
+        :param priority:
+            | Default ``0``.
+            |
+            | The priority of the listener.
 
         :raises:
-            :exc:`game_state.errors.StateError`
-                | Raised when the state name doesn't exist in the manager.
+            :exc:`ValueError`
+                | Raised when the event isn't a global listener.
+            :exc:`TypeError`
+                | Raised when the listener doesn't take the arguments of the event.
         """
-        if state_name not in self._states:
-            if state_name in self._lazy_states:
-                logger.debug("Loading lazy state: %s", state_name)
-
-                fetched_lazy_state, lazy_state_args = self._lazy_states[
-                    state_name
-                ]
-                self.load_states(
-                    fetched_lazy_state, state_args=lazy_state_args
+        try:
+            expected_args = _GLOBAL_LISTENER_ARGS[event]
+        except KeyError:
+            msg = f"`{event}` isn't a global listener to add to."
+            raise ValueError(msg) from None
+
+        signature = inspect.signature(listener)
+        pos_args = self._get_pos_args(signature)
+        kw_args = self._get_kw_args(signature)
+        if len(signature.parameters) != expected_args or kw_args != 0:
+            raise TypeError(
+                f"Expected {expected_args} positional argument(s) only "
+                f"for the function to be added to {event}. "
+                f"Instead got {pos_args} positional argument(s)"
+                + (
+                    f" and {kw_args} keyword argument(s)."
+                    if kw_args > 0
+                    else "."
                 )
-                del self._lazy_states[state_name]
+            )
 
-            else:
-                state_keys = self.state_map.keys()
-                lazy_state_keys = self.lazy_state_map.keys()
-                message = (
-                    f"State `{state_name}` isn't present from the available"
-                )
+        self._global_listeners[event].append((priority, listener))
+        self._compile_listeners(event)
 
-                if len(state_keys) == 0 and len(lazy_state_keys) == 0:
-                    message = "No states have been loaded to change to."
+    def remove_listener(
+        self, event: str, listener: Callable[..., None]
+    ) -> None:
+        r"""
+        Removes a listener added through :meth:`add_listener`. If the listener was
+        added more than once, the earliest one is removed.
 
-                if len(state_keys) > 0:
-                    message += f" states: `{', '.join(self.state_map.keys())}`"
+        .. versionadded:: 2.5
 
-                if len(lazy_state_keys) > 0:
-                    if len(state_keys) > 0:
-                        message += " and "
-                    message += f"from the available lazy states: `{', '.join(self.lazy_state_map.keys())}`"
+        :param event:
+            | The global listener the listener was added to.
+        :param listener:
+            | The listener to be removed.
 
-                raise StateError(
-                    message,
-                    last_state=self._last_state,
-                )
+        :raises:
+            :exc:`ValueError`
+                | Raised when the listener wasn't added to the event.
+        """
+        listeners = self._global_listeners.get(event, [])
+        for index, entry in enumerate(listeners):
+            if entry[1] == listener:
+                del listeners[index]
+                self._compile_listeners(event)
+                return
+
+        msg = f"The listener wasn't added to `{event}`."
+        raise ValueError(msg)
 
-        logger.debug(
-            "Changing from state %s to %s",
-            getattr(self.current_state, "state_name", "None"),
-            state_name,
+    def _compile_listeners(self, event: str) -> None:
+        # Flattens the listeners of the event into the order they're called in,
+        # which is only redone when they change.
+        assigned = getattr(self, f"_{event}")
+        entries = self._global_listeners[event]
+        if assigned is not None:
+            entries = [(0, assigned), *entries]
+
+        self._listener_chains[event] = tuple(
+            listener
+            for _, listener in sorted(entries, key=lambda entry: -entry[0])
         )
+        if event not in ("global_on_load", "global_on_unload"):
+            self._dispatch_plans.clear()
 
-        self._last_state = self._current_state
-        self._current_state = self._states[state_name]
-        if self._global_on_leave:
-            logger.debug("Calling global_on_leave")
-            self._global_on_leave(self._last_state, self._current_state)
+    def change_state(self, state_name: Union[str, int]) -> None:
+        r"""
+        Changes the current state and updates the last state. This method executes
+        the :meth:`State.on_leave` & :meth:`State.on_enter` state & global listeners
+        (:meth:`global_on_leave` & :meth:`global_on_enter`).
 
-        if self._last_state:
-            logger.debug("Calling %s.on_leave", self._last_state.state_name)
-            self._last_state.on_leave(self._current_state)
+        If called while another switch is calling its listeners, or while
+        :attr:`deferred_transitions` is enabled, the switch is queued to be applied by
+        :meth:`apply_transitions` instead. Only the last of the switches queued in a
+        row is applied.
 
-        if self._global_on_enter:
-            logger.debug("Calling global_on_enter")
-            self._global_on_enter(self._current_state, self._last_state)
-        self._current_state.on_enter(self._last_state)
+        .. versionchanged:: 2.5
 
-    def connect_state_hook(self, path: str, **kwargs: Any) -> None:
-        r"""
-        Calls the hook function of the state file.
+            | Method now accepts state handles.
 
         .. versionadded:: 1.0
 
-        :param path:
-            | The path to the state file containing the hook function to be called.
-        :param \**kwargs:
-            | The keyword arguments to be passed to the hook function.
+        :param state_name:
+            | The name or the handle (see :meth:`get_handle`) of the state you want to
+              switch to.
 
         :raises:
             :exc:`game_state.errors.StateError`
-                | Raised when the hook function was not found in the state file to be loaded.
+                | Raised when the state name or handle doesn't exist in the manager.
         """
-        state = importlib.import_module(path)
-        if "hook" not in state.__dict__:
-            msg = (
-                "\nAn error occurred in loading state path-\n"
-                f"`{path}`\n"
-                "`hook` function was not found in state file to load.\n"
-            )
-            raise StateError(
-                msg,
-                last_state=self._last_state,
-                **kwargs,
-            )
-
-        logger.debug("Hooking up state: %s", state.__name__)
-        state.__dict__["hook"](**kwargs)
+        self._transition(self._change_state, state_name)
 
-    def add_lazy_states(
-        self,
-        *lazy_states: Type[S],
-        force: bool = False,
-        state_args: Optional[Iterable[StateArgs]] = None,
-    ) -> None:
+    def apply_transitions(self) -> None:
         r"""
-        Lazily adds the States into the StateManager.
-        Unlike :meth:`load_states`, it only initializes the state when required
-        i.e. when :meth:`change_state` switches to the lazy state.
-
-        .. versionadded:: 2.2
-
-        :param lazy_states:
-            | The states to be loaded into the manager as lazy states.
-        :type lazy_states: State
-
-        :param force:
-            | Default ``False``.
-            |
-            | Loads the state regardless of whether the state has already been loaded or not
-            | without raising any internal error.
+        Applies the transitions queued by :meth:`change_state`, :meth:`push_state`
+        & :meth:`pop_state` in the order they were requested. Of the switches
+        queued in a row only the last one is applied, so the states requested in
+        between are never entered. If a transition raises, the rest are discarded.
 
-            .. warning::
-              If set to ``True`` it may lead to unexpected behavior.
+        This is called by :meth:`run` when :attr:`deferred_transitions` is enabled,
+        and should be called at a safe point of every frame otherwise.
 
-        :param state_args:
-            | The data to be passed to the subclassed states upon their initialization in the manager.
+        .. versionadded:: 2.5
 
         :raises:
-            :exc:`game_state.errors.StateLoadError`
-                | Raised when the state has already been loaded.
-                | Only raised when ``force`` is set to ``False``.
+            :exc:`game_state.errors.StateError`
+                | Raised when the queued state name or handle doesn't exist in the
+                  manager.
         """
-        args_cache: Dict[str, Optional[StateArgs]] = {}
-        all_states: List[Type[S]] = self.bound_state_type._lazy_states.copy()  # pyright: ignore[reportPrivateUsage, reportAssignmentType]
-        all_states.extend(lazy_states)
-        self.bound_state_type._lazy_states.clear()  # pyright: ignore[reportPrivateUsage]
-
-        if state_args:
-            for argument in state_args:
-                args_cache[argument.state_name] = argument
+        queue = self._queued_transitions
+        try:
+            while queue:
+                transition, state_name = queue.pop(0)
+                transition(state_name)
+        finally:
+            queue.clear()
 
-        for lazy_state in all_states:
+    def _transition(
+        self,
+        transition: Callable[[Any], Any],
+        state_name: Optional[Union[str, int]],
+    ) -> Any:
+        if self.deferred_transitions or self._transitioning:
+            queue = self._queued_transitions
             if (
-                not force
-                and lazy_state.state_name in self._states
-                or lazy_state.state_name in self._lazy_states
+                transition == self._change_state
+                and queue
+                and queue[-1][0] == self._change_state
             ):
-                msg = f"State: {lazy_state.state_name} has already been added."
-                raise StateLoadError(
-                    msg,
-                    last_state=self._last_state,
-                )
+                queue[-1] = (transition, state_name)
+            else:
+                queue.append((transition, state_name))
+            return None
 
-            lazy_state_arg: Optional[List[StateArgs]] = (  # pyright: ignore[reportAssignmentType]
-                None
-                if args_cache.get(lazy_state.state_name) is None
-                else [args_cache[lazy_state.state_name]]
+        try:
+            result = transition(state_name)
+        except BaseException:
+            # Drops the transitions queued by the listeners which didn't finish.
+            self._queued_transitions.clear()
+            raise
+
+        self.apply_transitions()
+        return result
+
+    def _change_state(self, state_name: Union[str, int]) -> None:
+        timing = self._timing
+        history = self._history
+        if timing or history is not None:
+            started = time.perf_counter_ns()
+
+        state_name, state = self._resolve_state(state_name)
+        if self._state_stack and state in self._state_stack:
+            msg = f"State `{state_name}` is covered in the state stack, use `pop_state` to return to it."
+            raise StateError(msg, last_state=self._last_state)
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        last_state = self._current_state
+        if debug:
+            logger.debug(
+                "Changing from state %s to %s",
+                getattr(last_state, "state_name", "None"),
+                state_name,
             )
-            self._lazy_states[lazy_state.state_name] = (
-                lazy_state,
-                lazy_state_arg,
+
+        self._last_state = last_state
+        self._current_state = state
+        self._transitioning = True
+
+        if last_state is None:
+            leave_hooks = tuple(
+                (
+                    "global_on_leave",
+                    self._timed_hook(
+                        "global_on_leave", partial(listener, None)
+                    ),
+                )
+                for listener in self._listener_chains["global_on_leave"]
             )
-            logger.debug("Added lazy state: %s", lazy_state.state_name)
+        else:
+            leave_hooks = self._get_dispatch_plan(last_state)[1]
 
-    def load_states(
-        self,
-        *states: Type[S],
-        force: bool = False,
-        state_args: Optional[Iterable[StateArgs]] = None,
-    ) -> None:
+        try:
+            for label, hook in leave_hooks:
+                if debug:
+                    logger.debug("Calling %s", label)
+                hook(state)
+
+            for label, hook in self._get_dispatch_plan(state)[2]:
+                if debug:
+                    logger.debug("Calling %s", label)
+                hook(last_state)
+        finally:
+            self._transitioning = False
+
+        self._mark_entered(state_name, state)
+
+        if history is not None:
+            self._record_transition(history, last_state, state, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        if timing:
+            self._record_timing(f"{state_name}.change_state", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
+    def push_state(self, state_name: Union[str, int]) -> None:
         r"""
-        Loads the States into the StateManager.
+        Enters a state on top of the current state without leaving it, such as a pause
+        menu over the game. Only the enter listeners (:meth:`State.on_enter` &
+        :meth:`global_on_enter`) of the pushed state are called, and the covered
+        state is kept as it is until the pushed state is popped with
+        :meth:`pop_state`.
 
-        .. versionchanged:: 2.1
-
-            | Method now accepts ``state_args``.
-
-        .. versionadded:: 1.0
-
-        :param states:
-            | The States to be loaded into the manager.
-        :type states: State
+        The covered states stay loaded while they're in the stack. Their updates &
+        renders in :meth:`run` are controlled by the :attr:`State.update_below` &
+        :attr:`State.render_below` attributes of the states above them. Calling
+        :meth:`change_state` replaces the state on top of the stack.
 
-        :param force:
-            | Default ``False``.
-            |
-            | Loads the state regardless of whether the state has already been loaded or not
-            | without raising any internal error.
+        Like :meth:`change_state`, the push is queued when called while another
+        transition is calling its listeners or while :attr:`deferred_transitions` is
+        enabled.
 
-            .. warning::
-              If set to ``True`` it may lead to unexpected behavior.
+        .. versionadded:: 2.5
 
-        :param state_args:
-            | The data to be passed to the subclassed states upon their initialization in the manager.
+        :param state_name:
+            | The name or the handle (see :meth:`get_handle`) of the state to be pushed.
 
         :raises:
-            :exc:`game_state.errors.StateLoadError`
-                | Raised when the state has already been loaded.
-                | Only raised when ``force`` is set to ``False``.
+            :exc:`game_state.errors.StateError`
+                | Raised when no state has been entered, when the state name or handle
+                  doesn't exist in the manager or when the state is already in the
+                  stack.
         """
-        args_cache: Dict[str, Dict[str, Any]] = {}
-        all_states: List[Type[S]] = self.bound_state_type._eager_states.copy()  # pyright: ignore[reportPrivateUsage, reportAssignmentType]
-        all_states.extend(states)
-        self.bound_state_type._eager_states.clear()  # pyright: ignore[reportPrivateUsage]
-
-        if state_args:
-            for argument in state_args:
-                args_cache[argument.state_name] = argument.get_data()
+        self._transition(self._push_state, state_name)
+
+    def _push_state(self, state_name: Union[str, int]) -> None:
+        covered_state = self._current_state
+        if covered_state is None:
+            msg = "A state has to be entered before pushing another state."
+            raise StateError(msg, last_state=self._last_state)
+
+        state_name, state = self._resolve_state(state_name)
+        if state is covered_state or state in self._state_stack:
+            msg = f"State `{state_name}` is already in the state stack."
+            raise StateError(msg, last_state=self._last_state)
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Pushing state %s over %s",
+                state_name,
+                covered_state.state_name,
+            )
 
-        for state in all_states:
-            final_state_args = args_cache.get(state.state_name, {})
+        history = self._history
+        if history is not None:
+            started = time.perf_counter_ns()
 
-            if not force and state.state_name in self._states:
-                msg = f"State: {state.state_name} has already been loaded."
-                raise StateLoadError(
-                    msg,
-                    last_state=self._last_state,
-                    **final_state_args,
-                )
+        self._state_stack.append(covered_state)
+        self._last_state = covered_state
+        self._current_state = state
 
-            self._states[state.state_name] = state(**final_state_args)
-            logger.debug("Loaded state: %s", state.state_name)
+        self._transitioning = True
+        try:
+            for label, hook in self._get_dispatch_plan(state)[2]:
+                if debug:
+                    logger.debug("Calling %s", label)
+                hook(covered_state)
+        finally:
+            self._transitioning = False
 
-            if self._global_on_load:
-                logger.debug("Calling global_on_load")
-                self._global_on_load(
-                    self._states[state.state_name], self._is_reloading
-                )
+        self._mark_entered(state_name, state)
 
-            logger.debug("Calling %s.on_load", state.state_name)
-            self._states[state.state_name].on_load(self._is_reloading)
+        if history is not None:
+            self._record_transition(history, covered_state, state, started)  # pyright: ignore[reportPossiblyUnboundVariable]
 
-    def reload_state(
-        self, state_name: str, force: bool = False, **kwargs: Any
-    ) -> S:
+    def pop_state(self) -> Optional[S]:
         r"""
-        Reloads the specified state. A short hand to :meth:`unload_state` &
-        :meth:`load_states`.
+        Leaves the state on top of the stack & returns to the state it covered. Only
+        the leave listeners (:meth:`State.on_leave` & :meth:`global_on_leave`) of the
+        popped state are called, the state returned to isn't entered again.
 
-        .. versionadded:: 1.0
+        Like :meth:`change_state`, the pop is queued when called while another
+        transition is calling its listeners or while :attr:`deferred_transitions` is
+        enabled.
+
+        .. versionadded:: 2.5
+
+        :rtype: State | None
+
+        :returns:
+            | The popped state, which stays loaded in the manager. ``None`` if the pop
+              was queued.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when there's no state pushed over another.
+        """
+        return self._transition(self._pop_state, None)
+
+    def _pop_state(self, _: Any = None) -> S:
+        if not self._state_stack:
+            msg = "There are no pushed states to be popped."
+            raise StateError(msg, last_state=self._last_state)
+
+        state: S = self._current_state  # pyright: ignore[reportAssignmentType]
+        covered_state = self._state_stack.pop()
+
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Popping state %s back to %s",
+                state.state_name,
+                covered_state.state_name,
+            )
+
+        history = self._history
+        if history is not None:
+            started = time.perf_counter_ns()
+
+        self._last_state = state
+        self._current_state = covered_state
+
+        self._transitioning = True
+        try:
+            for label, hook in self._get_dispatch_plan(state)[1]:
+                if debug:
+                    logger.debug("Calling %s", label)
+                hook(covered_state)
+        finally:
+            self._transitioning = False
+
+        self._recently_entered.pop(covered_state.state_name, None)
+        self._recently_entered[covered_state.state_name] = None
+
+        if history is not None:
+            self._record_transition(history, state, covered_state, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        return state
+
+    def _record_transition(
+        self,
+        history: TransitionHistory,
+        from_state: Optional[S],
+        to_state: S,
+        started: int,
+    ) -> None:
+        history.record(
+            None
+            if from_state is None
+            else self._handles[from_state.state_name],
+            self._handles[to_state.state_name],
+            started,
+            time.perf_counter_ns() - started,
+        )
+
+    def _get_layers(self, attribute: str) -> Tuple[S, ...]:
+        # The current state along with the covered states reached through the
+        # given attribute, from the bottom of the stack to the top.
+        current_state: S = self._current_state  # pyright: ignore[reportAssignmentType]
+        if not self._state_stack or not getattr(current_state, attribute):
+            return (current_state,)
+
+        layers = [current_state]
+        for state in reversed(self._state_stack):
+            layers.append(state)
+            if not getattr(state, attribute):
+                break
+        return tuple(reversed(layers))
+
+    def _resolve_state(self, state_name: Union[str, int]) -> Tuple[str, S]:
+        if isinstance(state_name, int):
+            if not 0 <= state_name < len(self._handle_table):
+                msg = f"State handle `{state_name}` doesn't exist."
+                raise StateError(msg, last_state=self._last_state)
+
+            state = self._handle_table[state_name]
+            state_name = self._handle_names[state_name]
+        else:
+            state = self._states.get(state_name)
+
+        if (
+            self._pending_load is not None
+            and self._pending_load.state_name == state_name
+        ):
+            self._pending_load.switch = False
+            self.finish_loading()
+            state = self._states.get(state_name)
+
+        if state is None:
+            state = self._load_missing_state(state_name)
+
+        return state_name, state
+
+    def _mark_entered(self, state_name: str, state: S) -> None:
+        self._snapshot_cache.pop(state_name, None)
+        self._recently_entered.pop(state_name, None)
+        self._recently_entered[state_name] = None
+        if (
+            self.max_resident_states is not None
+            or self.memory_budget is not None
+        ):
+            self._evict_states()
+
+        if self.auto_prefetch and state.neighbours:
+            self.prefetch(
+                *(
+                    neighbour
+                    for neighbour in state.neighbours
+                    if neighbour in self._lazy_states
+                )
+            )
+
+    def _load_missing_state(self, state_name: str) -> S:
+        if state_name in self._prefetching:
+            self._promote_prefetched_state(state_name)
+
+        elif state_name in self._hibernated:
+            self._resume_state(state_name)
+
+        elif state_name in self._state_hooks:
+            self._connect_discovered_state(state_name)
+            if state_name not in self._states:
+                return self._load_missing_state(state_name)
+
+        elif state_name in self._lazy_states:
+            logger.debug("Loading lazy state: %s", state_name)
+
+            fetched_lazy_state, lazy_state_args = self._lazy_states[state_name]
+            self.load_states(fetched_lazy_state, state_args=lazy_state_args)
+            del self._lazy_states[state_name]
+
+        else:
+            state_keys = self._states.keys()
+            lazy_state_keys = self._lazy_states.keys()
+            message = f"State `{state_name}` isn't present from the available"
+
+            if len(state_keys) == 0 and len(lazy_state_keys) == 0:
+                message = "No states have been loaded to change to."
+
+            if len(state_keys) > 0:
+                message += f" states: `{', '.join(self._states.keys())}`"
+
+            if len(lazy_state_keys) > 0:
+                if len(state_keys) > 0:
+                    message += " and "
+                message += f"from the available lazy states: `{', '.join(self._lazy_states.keys())}`"
+
+            raise StateError(
+                message,
+                last_state=self._last_state,
+            )
+
+        return self._states[state_name]
+
+    def _get_dispatch_plan(self, state: S) -> _DispatchPlan:
+        plan = self._dispatch_plans.get(state.state_name)
+        if plan is not None and plan[0] is state:
+            return plan
+
+        leave_hooks: List[Tuple[str, Callable[[S], Any]]] = []
+        enter_hooks: List[Tuple[str, Callable[[Optional[S]], Any]]] = []
+
+        leave_hooks.extend(
+            ("global_on_leave", partial(listener, state))
+            for listener in self._listener_chains["global_on_leave"]
+        )
+        if _is_overridden(state, "on_leave"):
+            leave_hooks.append(
+                (f"{state.state_name}.on_leave", state.on_leave)
+            )
+
+        enter_hooks.extend(
+            ("global_on_enter", partial(listener, state))
+            for listener in self._listener_chains["global_on_enter"]
+        )
+        if _is_overridden(state, "on_enter"):
+            enter_hooks.append(
+                (f"{state.state_name}.on_enter", state.on_enter)
+            )
+
+        child = self._children.get(state.state_name)
+        if child is not None:
+            leave_hooks.insert(
+                0, (f"{state.state_name}.child", child._leave_from_parent)
+            )
+            enter_hooks.append(
+                (f"{state.state_name}.child", child._enter_from_parent)
+            )
+
+        plan = (
+            state,
+            tuple(
+                (label, self._timed_hook(label, hook))
+                for label, hook in leave_hooks
+            ),
+            tuple(
+                (label, self._timed_hook(label, hook))
+                for label, hook in enter_hooks
+            ),
+        )
+        self._dispatch_plans[state.state_name] = plan
+        return plan
+
+    def dispatch_event(self, event: Any) -> None:
+        r"""
+        Passes an event to the current state. The listeners registered with
+        :func:`~game_state.events.on_event` for the ``type`` of the event are looked
+        up directly, and the ones whose filters match the event are called. If none
+        of them match, the event is passed to :meth:`State.process_event`.
+
+        .. versionadded:: 2.5
+
+        :param event:
+            | The event to be dispatched, such as a ``pygame.event.Event``.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when no state has been entered.
+        """
+        state = self._current_state
+        if state is None:
+            msg = "A state has to be entered before dispatching events."
+            raise StateError(msg, last_state=self._last_state)
+
+        handlers = state._event_handlers.get(getattr(event, "type", None))  # pyright: ignore[reportPrivateUsage]
+        if handlers is not None:
+            handled = False
+            for handler, filters in handlers:
+                for name, value in filters:
+                    if getattr(event, name, MISSING) != value:
+                        break
+                else:
+                    handler(state, event)
+                    handled = True
+
+            if handled:
+                return
+
+        state.process_event(event)
+
+    def dispatch_events(self, events: Iterable[Any]) -> None:
+        r"""
+        Passes a batch of events, such as the ones from ``pygame.event.get()``, to
+        :meth:`dispatch_event` in order. Each event goes to the state which is
+        current at the time, so the events after a state change go to the new state.
+
+        .. versionadded:: 2.5
+
+        :param events:
+            | The events to be dispatched.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when no state has been entered.
+        """
+        for event in events:
+            self.dispatch_event(event)
+
+    def run(
+        self,
+        *,
+        events: Optional[Callable[[], Iterable[Any]]] = None,
+        timestep: float = 1 / 60,
+        max_steps: int = 5,
+        frame_rate: Optional[float] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        r"""
+        Runs the game loop with a fixed timestep until :attr:`is_running` is set to
+        ``False``.
+
+        Every frame each event is passed to :meth:`dispatch_event`, followed by
+        :meth:`State.process_update` with ``timestep`` as many times as needed to
+        catch up with the time passed, and finally :meth:`State.process_render`
+        with how far the simulation is between two updates. Keeping the timestep
+        fixed makes the updates independent of the frame rate. The states covered in
+        the :attr:`state_stack` are updated & rendered before the current state when
+        it has :attr:`State.update_below` or :attr:`State.render_below` enabled.
+
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            manager.change_state("MainMenu")
+            manager.run(events=pygame.event.get, frame_rate=60)
+
+        :param events:
+            | Default ``None``.
+            |
+            | A callable returning the events of the frame, such as
+              ``pygame.event.get``. No events are processed when not passed.
+        :param timestep:
+            | Default ``1 / 60``.
+            |
+            | The time in seconds simulated by each :meth:`State.process_update` call.
+        :param max_steps:
+            | Default ``5``.
+            |
+            | The maximum updates run in a single frame. Once reached, the rest of the
+              time behind is dropped instead of slowing the following frames down.
+        :param frame_rate:
+            | Default ``None``.
+            |
+            | The maximum frames to be run per second. The loop sleeps for the rest of
+              each frame when passed, otherwise it runs as fast as possible.
+        :param clock:
+            | Default :func:`time.perf_counter`.
+            |
+            | The function returning the current time in seconds.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when no state has been entered before running the loop.
+
+            :exc:`ValueError`
+                | Raised when ``timestep`` isn't positive or ``max_steps`` is lesser
+                  than 1.
+        """
+        if timestep <= 0:
+            msg = f"Expected timestep to be positive, instead got {timestep}."
+            raise ValueError(msg)
+        if max_steps < 1:
+            msg = f"Expected max_steps to be at least 1, instead got {max_steps}."
+            raise ValueError(msg)
+        if self._current_state is None:
+            msg = "A state has to be entered before running the game loop."
+            raise StateError(msg, last_state=self._last_state)
+
+        accumulator = 0.0
+        previous = clock()
+
+        while self.is_running:
+            now = clock()
+            accumulator += now - previous
+            previous = now
+
+            if events is not None:
+                self.dispatch_events(events())
+            if self._queued_transitions:
+                self.apply_transitions()
+
+            steps = 0
+            while accumulator >= timestep:
+                if steps == max_steps:
+                    accumulator %= timestep
+                    break
+
+                for layer in self._get_layers("update_below"):
+                    layer.process_update(timestep)
+                accumulator -= timestep
+                steps += 1
+
+            if self._queued_transitions:
+                self.apply_transitions()
+
+            alpha = accumulator / timestep
+            for layer in self._get_layers("render_below"):
+                layer.process_render(alpha)
+
+            if frame_rate is not None:
+                delay = previous + 1 / frame_rate - clock()
+                if delay > 0:
+                    time.sleep(delay)
+
+    def prefetch(
+        self, *state_names: str, executor: Optional[Executor] = None
+    ) -> None:
+        r"""
+        Initializes the given lazy states and calls their :meth:`State.on_load`
+        listeners in the background. The prefetched states are moved from the lazy
+        states into the manager once :meth:`change_state` switches to them, which
+        saves the switch from waiting on the state to load.
+
+        States which have already been loaded or are already being prefetched are
+        ignored. Hibernated states are resumed from their snapshots instead.
+
+        .. versionadded:: 2.5
+
+        :param state_names:
+            | The names of the lazy states to be prefetched.
+
+        :param executor:
+            | Default ``None``.
+            |
+            | The :class:`concurrent.futures.Executor` to load the states on. If not
+            | passed, a single worker thread owned by the manager is used, which is
+            | stopped by :meth:`close`.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the state name isn't present in the lazy states.
+
+        .. note::
+
+            :meth:`global_on_load` is called on the thread calling
+            :meth:`change_state` once the state is moved into the manager.
+
+        .. warning::
+
+            The state's ``__init__`` & :meth:`State.on_load` (or :meth:`State.on_resume`)
+            are run on another thread. Make sure they don't touch anything that's not
+            thread safe.
+        """
+        for state_name in state_names:
+            if state_name in self._states or state_name in self._prefetching:
+                continue
+
+            if state_name not in self._lazy_states:
+                msg = f"State `{state_name}` isn't present in the lazy states to be prefetched."
+                raise StateError(msg, last_state=self._last_state)
+
+            if executor is None:
+                if self._prefetch_executor is None:
+                    self._prefetch_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="game-state-prefetch"
+                    )
+                    # Stops the worker once the manager is garbage collected.
+                    weakref.finalize(
+                        self, self._prefetch_executor.shutdown, wait=False
+                    )
+                executor = self._prefetch_executor
+
+            lazy_state, lazy_state_args = self._lazy_states[state_name]
+            if state_name in self._hibernated:
+                logger.debug("Prefetching hibernated state: %s", state_name)
+                self._prefetching[state_name] = executor.submit(
+                    self._build_resumed_state,
+                    lazy_state,
+                    self._hibernated[state_name],
+                )
+                continue
+
+            logger.debug("Prefetching lazy state: %s", state_name)
+            self._prefetching[state_name] = executor.submit(
+                self._build_state,
+                lazy_state,
+                lazy_state_args[0].get_data() if lazy_state_args else {},
+            )
+
+    def close(self) -> None:
+        r"""
+        Stops the worker thread started by :meth:`prefetch`, waiting for the states
+        it's still loading. Prefetching afterwards starts a new worker.
+
+        Executors passed to :meth:`prefetch` are left to their owners.
+
+        .. versionadded:: 2.5
+        """
+        executor = self._prefetch_executor
+        if executor is not None:
+            self._prefetch_executor = None
+            executor.shutdown(wait=True)
+
+    @property
+    def loading_progress(self) -> Optional[float]:
+        r"""
+        The progress of the state being loaded through :meth:`begin_loading`, ranging
+        from ``0.0`` to ``1.0``. Will be ``None`` if no state is being loaded.
+
+        :type: float | None
+
+        .. versionadded:: 2.5
+
+        .. note::
+
+            This is a read-only attribute.
+        """
+        if self._pending_load is None:
+            return None
+        return self._pending_load.progress
+
+    @loading_progress.setter
+    def loading_progress(self, _: Any) -> NoReturn:
+        msg = "Cannot overwrite the loading progress."
+        raise ValueError(msg)
+
+    def begin_loading(self, state_name: str, *, switch: bool = True) -> None:
+        r"""
+        Starts loading a lazy state over multiple frames. The state is initialized and
+        :meth:`global_on_load` is called right away, while its :meth:`State.on_load`
+        listener is advanced by :meth:`update_loading`.
+
+        Hibernated states are resumed from their snapshots right away instead.
+
+        To spread the loading, :meth:`State.on_load` can be written as a generator
+        which yields at its checkpoints. The yielded value may either be the progress
+        from ``0.0`` to ``1.0`` or ``None`` to leave the progress as is.
+
+        .. code-block:: python
+
+            class Level(State, lazy_load=True):
+                def on_load(self, reload: bool) -> Generator[float, None, None]:
+                    for index, path in enumerate(self.asset_paths):
+                        self.assets.append(load_asset(path))
+                        yield (index + 1) / len(self.asset_paths)
+
+
+            manager.begin_loading("Level")
+
+            # Inside of the game loop-
+            progress = manager.update_loading(budget=1 / 120)
+            if progress is not None:
+                draw_loading_bar(progress)
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state to be loaded.
+
+        :param switch:
+            | Default ``True``.
+            |
+            | Whether to :meth:`change_state` to the state once it has been loaded.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when another state is already being loaded or the state name
+                | doesn't exist in the manager.
+        """
+        if self._pending_load is not None:
+            msg = f"State `{self._pending_load.state_name}` is already being loaded."
+            raise StateError(msg, last_state=self._last_state)
+
+        if (
+            state_name in self._hibernated
+            and state_name not in self._prefetching
+        ):
+            # Resuming only reads the snapshot, so it isn't spread over the frames.
+            self._resume_state(state_name)
+
+        if state_name in self._states or state_name in self._prefetching:
+            self._pending_load = _PendingLoad(state_name, None, None, switch)
+            return
+
+        if state_name not in self._lazy_states:
+            msg = f"State `{state_name}` isn't present in the lazy states to be loaded."
+            raise StateError(msg, last_state=self._last_state)
+
+        lazy_state, lazy_state_args = self._lazy_states[state_name]
+        instance = self._create_state(
+            lazy_state,
+            lazy_state_args[0].get_data() if lazy_state_args else {},
+        )
+        logger.debug("Loading lazy state incrementally: %s", state_name)
+
+        self._call_global_on_load(instance)
+
+        logger.debug("Calling %s.on_load", state_name)
+        loader = instance.on_load(self._is_reloading)
+        self._pending_load = _PendingLoad(
+            state_name,
+            instance,
+            loader,
+            switch,
+        )
+
+    def update_loading(self, budget: float) -> Optional[float]:
+        r"""
+        Advances the loading started by :meth:`begin_loading` until either the state
+        has finished loading or the time budget has been used up. The loader is always
+        advanced at least once.
+
+        Once the state has finished loading, it's moved into the manager and switched
+        to if ``switch`` was set in :meth:`begin_loading`.
+
+        .. versionadded:: 2.5
+
+        :param budget:
+            | The time in seconds that may be spent on loading in this call.
+
+        :rtype: float | None
+
+        :returns:
+            | The loading progress after this call. ``None`` if no state was being loaded.
+
+        .. note::
+
+            If the loader raises, the loading is cancelled & the state is left in the
+            lazy states to be loaded again.
+        """
+        pending = self._pending_load
+        if pending is None:
+            return None
+
+        if pending.loader is not None:
+            deadline = time.perf_counter() + budget
+            try:
+                for progress in pending.loader:
+                    if progress is not None:
+                        pending.progress = min(max(progress, 0.0), 1.0)
+
+                    if time.perf_counter() >= deadline:
+                        return pending.progress
+            except BaseException:
+                # The state hasn't left the lazy states, so it can be loaded again.
+                self._pending_load = None
+                raise
+
+        self._complete_loading()
+        return 1.0
+
+    def finish_loading(self) -> None:
+        r"""
+        Finishes the loading started by :meth:`begin_loading` without any time budget.
+        Does nothing if no state is being loaded.
+
+        .. versionadded:: 2.5
+        """
+        pending = self._pending_load
+        if pending is None:
+            return
+
+        if pending.loader is not None:
+            try:
+                for _ in pending.loader:
+                    pass
+            except BaseException:
+                self._pending_load = None
+                raise
+
+        self._complete_loading()
+
+    def _complete_loading(self) -> None:
+        pending = self._pending_load
+        assert pending is not None
+        self._pending_load = None
+
+        if pending.instance is not None:
+            _, lazy_state_args = self._lazy_states.pop(pending.state_name)
+            self._register_state(pending.instance, lazy_state_args)
+            logger.debug("Loaded state: %s", pending.state_name)
+
+        if pending.switch:
+            self.change_state(pending.state_name)
+
+    def _create_state(self, state: Type[S], state_args: Dict[str, Any]) -> S:
+        profiler = self.profiler
+        if profiler is not None:
+            started = time.perf_counter_ns()
+
+        if self._bindings is None:
+            instance = state(**state_args)
+        else:
+            instance = state.__new__(state)
+            vars(instance).update(self._bindings)
+            instance.__init__(**state_args)
+
+        if profiler is not None:
+            profiler.record("init", state.state_name, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        return instance
+
+    def _resume_state(self, state_name: str) -> None:
+        timing = self._timing
+        if timing:
+            started = time.perf_counter_ns()
+
+        cls_ref, lazy_state_args = self._lazy_states[state_name]
+        instance = self._build_resumed_state(
+            cls_ref, self._hibernated[state_name]
+        )
+
+        del self._lazy_states[state_name]
+        self._register_state(instance, lazy_state_args)
+        logger.debug("Resumed hibernated state: %s", state_name)
+
+        if timing:
+            self._record_timing(f"{state_name}.on_resume", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
+    def _build_resumed_state(self, state: Type[S], snapshot_path: str) -> S:
+        snapshot = _read_snapshot(snapshot_path, self.hibernation_codec)
+        return self._create_resumed_state(state, snapshot)
+
+    def _create_resumed_state(self, state: Type[S], snapshot: Any) -> S:
+        # Resumed states skip ``__init__``, so the bindings are set up here.
+        instance = state.__new__(state)
+        if self._bindings is not None:
+            vars(instance).update(self._bindings)
+
+        logger.debug("Calling %s.on_resume", state.state_name)
+        instance.on_resume(snapshot)
+        return instance
+
+    def _discard_snapshot(self, state_name: str) -> None:
+        snapshot_path = self._hibernated.pop(state_name, None)
+        if snapshot_path is not None:
+            _remove_snapshot(snapshot_path)
+
+    def _register_state(
+        self, instance: S, state_args: Optional[List[StateArgs]]
+    ) -> None:
+        self._states[instance.state_name] = instance
+        self._discard_snapshot(instance.state_name)
+        self._snapshot_cache.pop(instance.state_name, None)
+        self._state_args[instance.state_name] = (
+            state_args[0] if state_args else None
+        )
+        self._handle_table[self._get_or_create_handle(instance.state_name)] = (
+            instance
+        )
+
+    def _get_or_create_handle(self, state_name: str) -> int:
+        handle = self._handles.get(state_name)
+        if handle is None:
+            handle = self._handles[state_name] = len(self._handle_names)
+            self._handle_names.append(state_name)
+            self._handle_table.append(None)
+        return handle
+
+    @property
+    def state_handles(self) -> Mapping[str, int]:
+        r"""
+        A read-only live view of all the state names mapped to their handles. Both
+        the loaded & lazy states have handles. The states which have since been
+        unloaded or removed keep theirs too, see :meth:`get_handle`.
+
+        :type: typing.Mapping[str, int]
+
+        .. versionadded:: 2.5
+
+        .. note::
+
+            This is a read-only attribute.
+        """
+        return self._handle_view
+
+    @state_handles.setter
+    def state_handles(self, _: Any) -> NoReturn:
+        msg = "Cannot overwrite the state handles."
+        raise ValueError(msg)
+
+    def get_handle(self, state_name: str) -> int:
+        r"""
+        Returns the handle of a loaded or lazy state. A handle is a small integer
+        which can be passed to :meth:`change_state` in place of the state name to skip
+        the name lookups.
+
+        Handles are given out in the order the states are added into the manager and
+        stay the same for as long as the manager exists, even if the state is
+        unloaded & loaded again. They're never reused, so the handle of a state
+        which has been unloaded or removed stays reserved for it & switching to it
+        raises :exc:`game_state.errors.StateError` until the state is added again.
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state.
+
+        :rtype: int
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the state name doesn't exist in the manager.
+        """
+        try:
+            return self._handles[state_name]
+        except KeyError:
+            msg = f"State `{state_name}` doesn't have a handle."
+            raise StateError(msg, last_state=self._last_state) from None
+
+    def create_handle_enum(self, name: str = "StateHandle") -> Type[IntEnum]:
+        r"""
+        Creates an :class:`enum.IntEnum` of all the state handles given out so far,
+        with the state names as the member names.
+
+        .. code-block:: python
+
+            Handles = manager.create_handle_enum()
+            manager.change_state(Handles.MainMenu)
+
+        .. versionadded:: 2.5
+
+        :param name:
+            | Default ``"StateHandle"``.
+            |
+            | The name of the created enum.
+
+        :rtype: typing.Type[enum.IntEnum]
+        """
+        return cast(
+            "Type[IntEnum]", IntEnum(name, list(self._handles.items()))
+        )
+
+    def create_child(
+        self,
+        state_name: str,
+        *,
+        bound_state_type: Type[Any] = State,
+        initial_state: Optional[str] = None,
+        **kwargs: Any,
+    ) -> StateManager[Any]:
+        r"""
+        Makes a child manager owned by a state of this manager, such as the
+        exploration & combat states of a gameplay state. The child manager has its own
+        states & uses instance binding, so its states are bound to it instead of this
+        manager.
+
+        The child follows the state owning it. When the state is entered, the child
+        enters ``initial_state``, and when the state is left, the child pops its
+        pushed states & leaves its current state with the state this manager is
+        switching to passed as the next state. The transitions within the child
+        don't call any of the listeners of this manager.
+
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            combat = manager.create_child("Gameplay", initial_state="Exploration")
+            combat.load_states(Exploration, Combat)
+
+
+            class Gameplay(State):
+                def process_update(self, dt: float) -> None:
+                    child = self.manager.get_child(self.state_name)
+                    child.current_state.process_update(dt)
+
+        :param state_name:
+            | The name of the state owning the child manager.
+        :param bound_state_type:
+            | The base state class of the child's states.
+        :param initial_state:
+            | Default ``None``.
+            |
+            | The state the child enters whenever the owning state is entered. The
+              child isn't switched automatically when not passed.
+        :param \**kwargs:
+            | The keyword arguments to bind to the child's states.
+
+        :rtype: StateManager
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the state already owns a child manager.
+        """
+        if state_name in self._children:
+            msg = f"State `{state_name}` already has a child manager."
+            raise StateError(msg, last_state=self._last_state)
+
+        child = type(self)(
+            bound_state_type=bound_state_type,
+            instance_binding=True,
+            **kwargs,
+        )
+        child.parent = self
+        child._initial_state = initial_state
+        self._children[state_name] = child
+        self._dispatch_plans.pop(state_name, None)
+        return child
+
+    def get_child(self, state_name: str) -> Optional[StateManager[Any]]:
+        r"""
+        Gets the child manager owned by a state.
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state owning the child manager.
+
+        :rtype: StateManager | None
+
+        :returns:
+            | The child manager or ``None`` if the state doesn't own one.
+        """
+        return self._children.get(state_name)
+
+    def remove_child(self, state_name: str) -> Optional[StateManager[Any]]:
+        r"""
+        Detaches the child manager owned by a state. The child no longer follows the
+        state being entered or left.
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state owning the child manager.
+
+        :rtype: StateManager | None
+
+        :returns:
+            | The detached child manager or ``None`` if the state didn't own one.
+        """
+        child = self._children.pop(state_name, None)
+        if child is not None:
+            child.parent = None
+            self._dispatch_plans.pop(state_name, None)
+        return child
+
+    def _enter_from_parent(self, _: Any) -> None:
+        if self._initial_state is not None:
+            self.change_state(self._initial_state)
+
+    def _leave_from_parent(self, next_state: Any) -> None:
+        # The pushed states are popped first, so every layer of the stack leaves
+        # through its own listeners before the bottom one leaves.
+        while self._state_stack:
+            self._pop_state()
+
+        state = self._current_state
+        if state is None:
+            return
+
+        self._last_state = state
+        self._current_state = None
+
+        for label, hook in self._get_dispatch_plan(state)[1]:
+            logger.debug("Calling %s", label)
+            hook(next_state)
+
+    def pin_state(self, state_name: str) -> None:
+        r"""
+        Pins the state so that it's never unloaded for staying within the
+        :attr:`max_resident_states` & :attr:`memory_budget` limits.
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state to be pinned.
+        """
+        self._pinned_states.add(state_name)
+
+    def unpin_state(self, state_name: str) -> None:
+        r"""
+        Unpins a state pinned by :meth:`pin_state`. Does nothing if the state wasn't
+        pinned.
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state to be unpinned.
+        """
+        self._pinned_states.discard(state_name)
+
+    def _evict_states(self) -> None:
+        candidates = [
+            state_name
+            for state_name in self._states
+            if state_name not in self._recently_entered
+        ]
+        candidates.extend(self._recently_entered)
+
+        resident = len(self._states)
+        size = (
+            0
+            if self.memory_budget is None
+            else sum(state.estimate_size() for state in self._states.values())
+        )
+
+        for state_name in candidates:
+            if (
+                self.max_resident_states is None
+                or resident <= self.max_resident_states
+            ) and (self.memory_budget is None or size <= self.memory_budget):
+                break
+
+            if (
+                state_name in self._pinned_states
+                or state_name not in self._states
+                or self._states[state_name] is self._current_state
+                or self._states[state_name] in self._state_stack
+            ):
+                continue
+
+            if self.memory_budget is not None:
+                size -= self._states[state_name].estimate_size()
+            resident -= 1
+
+            lazy_state_args = self._state_args.get(state_name)
+            logger.debug("Evicting state: %s", state_name)
+            cls_ref = self.unload_state(state_name)
+            self._lazy_states[state_name] = (
+                cls_ref,
+                None if lazy_state_args is None else [lazy_state_args],
+            )
+
+    def _call_global_on_load(self, state: S) -> None:
+        listeners = self._listener_chains["global_on_load"]
+        if not listeners:
+            return
+
+        logger.debug("Calling global_on_load")
+        timing = self._timing
+        profiler = self.profiler
+        if timing or profiler is not None:
+            started = time.perf_counter_ns()
+
+        reloading = self._is_reloading
+        for listener in listeners:
+            listener(state, reloading)
+
+        if timing:
+            self._record_timing("global_on_load", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        if profiler is not None:
+            profiler.record("global_on_load", state.state_name, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
+    def _call_global_on_unload(self, state: S) -> None:
+        listeners = self._listener_chains["global_on_unload"]
+        if not listeners:
+            return
+
+        logger.debug("Calling global_on_unload")
+        timing = self._timing
+        profiler = self.profiler
+        if timing or profiler is not None:
+            started = time.perf_counter_ns()
+
+        reloading = self._is_reloading
+        for listener in listeners:
+            listener(state, reloading)
+
+        if timing:
+            self._record_timing("global_on_unload", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        if profiler is not None:
+            profiler.record("global_on_unload", state.state_name, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
+    def _call_on_load(self, state: S) -> None:
+        logger.debug("Calling %s.on_load", state.state_name)
+        timing = self._timing
+        profiler = self.profiler
+        if timing or profiler is not None:
+            started = time.perf_counter_ns()
+
+        loader = state.on_load(self._is_reloading)
+        if loader is not None:
+            for _ in loader:
+                pass
+
+        if timing:
+            self._record_timing(f"{state.state_name}.on_load", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        if profiler is not None:
+            profiler.record("on_load", state.state_name, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
+    def _promote_prefetched_state(self, state_name: str) -> None:
+        instance = self._prefetching.pop(state_name).result()
+        _, lazy_state_args = self._lazy_states.pop(state_name)
+        # Like any resumed state, a prefetched hibernated state isn't loaded again.
+        resumed = state_name in self._hibernated
+        self._register_state(instance, lazy_state_args)
+        logger.debug("Loaded prefetched state: %s", state_name)
+
+        if not resumed:
+            self._call_global_on_load(instance)
+
+    def enable_stats(self) -> None:
+        r"""
+        Starts timing the transitions, loads, unloads & reloads of the states along
+        with their listeners. The timings can be retrieved with :meth:`stats`.
+
+        Calling this while the stats are already enabled does nothing.
+
+        .. versionadded:: 2.5
+        """
+        if self._stats is None:
+            self._stats = {}
+            self._update_timing()
+
+    def disable_stats(self) -> None:
+        r"""
+        Stops timing the manager & discards the recorded timings. The manager has no
+        timing overhead while the stats are disabled, which is the default.
+
+        .. versionadded:: 2.5
+        """
+        if self._stats is not None:
+            self._stats = None
+            self._update_timing()
+
+    def enable_history(self, capacity: int = 1024) -> TransitionHistory:
+        r"""
+        Starts recording the transitions of :meth:`change_state`,
+        :meth:`push_state` & :meth:`pop_state` into a
+        :class:`~game_state.history.TransitionHistory`, which keeps the given
+        amount of the most recent transitions.
+
+        Calling this while the history is already enabled replaces it.
+
+        .. versionadded:: 2.5
+
+        :param capacity:
+            | Default ``1024``.
+            |
+            | The amount of transitions to be kept.
+
+        :rtype: ~game_state.history.TransitionHistory
+
+        :returns:
+            | The history, which is also available as :attr:`history`.
+
+        :raises:
+            :exc:`ValueError`
+                | Raised when the capacity isn't positive.
+        """
+        self._history = TransitionHistory(capacity, self._handle_names)
+        return self._history
+
+    def disable_history(self) -> None:
+        r"""
+        Stops recording the transitions & discards the history. The manager has no
+        overhead from the history while it's disabled, which is the default.
+
+        .. versionadded:: 2.5
+        """
+        self._history = None
+
+    @property
+    def history(self) -> Optional[TransitionHistory]:
+        r"""
+        The history of the recent transitions made by :meth:`enable_history`.
+        ``None`` while the history is disabled.
+
+        :type: ~game_state.history.TransitionHistory | None
+
+        .. versionadded:: 2.5
+
+        .. note::
+
+            This is a read-only attribute.
+        """
+        return self._history
+
+    @history.setter
+    def history(self, _: Any) -> NoReturn:
+        msg = "Cannot overwrite the history, use `enable_history` instead."
+        raise ValueError(msg)
+
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        r"""
+        The :class:`~game_state.tracing.Tracer` recording the transitions, loads,
+        unloads & reloads of the states along with their listeners as spans.
+        ``None`` (no tracing) by default.
+
+        The spans are named after the keys of :meth:`stats` & the manager has no
+        tracing overhead while this is ``None``.
+
+        .. versionadded:: 2.5
+
+        :type: ~game_state.tracing.Tracer | None
+        """
+        return self._tracer
+
+    @tracer.setter
+    def tracer(self, tracer: Optional[Tracer]) -> None:
+        self._tracer = tracer
+        self._update_timing()
+
+    def _update_timing(self) -> None:
+        self._timing = self._stats is not None or self._tracer is not None
+        # The listeners are wrapped to be timed when the dispatch plans are made.
+        self._dispatch_plans.clear()
+
+    def stats(self) -> Dict[str, TimingStats]:
+        r"""
+        Summarizes the timings recorded since :meth:`enable_stats` was called.
+
+        The timings are keyed by:
+
+        - ``load_states`` for every call to :meth:`load_states`.
+        - ``<state_name>.change_state``, ``<state_name>.unload_state`` &
+          ``<state_name>.reload_state`` for switching to, unloading & reloading a
+          state respectively.
+        - ``<state_name>.on_enter``, ``<state_name>.on_leave``,
+          ``<state_name>.on_load``, ``<state_name>.on_unload`` &
+          ``<state_name>.on_resume`` for the listeners of a state.
+        - ``global_on_enter``, ``global_on_leave``, ``global_on_load`` &
+          ``global_on_unload`` for the global listeners.
+        - ``snapshot`` for every call to :meth:`snapshot`.
+
+        Only the operations which completed without raising an error are timed.
+
+        .. versionadded:: 2.5
+
+        :rtype: typing.Dict[str, TimingStats]
+
+        :returns:
+            | The timings summarized by their key. Empty when the stats are disabled.
+        """
+        if self._stats is None:
+            return {}
+        return {
+            key: histogram.summary() for key, histogram in self._stats.items()
+        }
+
+    def _get_histogram(self, key: str) -> LatencyHistogram:
+        assert self._stats is not None
+        histogram = self._stats.get(key)
+        if histogram is None:
+            histogram = self._stats[key] = LatencyHistogram()
+        return histogram
+
+    def _record_timing(self, key: str, started: int) -> None:
+        ended = time.perf_counter_ns()
+        if self._stats is not None:
+            self._get_histogram(key).record(ended - started)
+        if self._tracer is not None:
+            self._tracer.record(key, started, ended)
+
+    def _timed_hook(
+        self, label: str, hook: Callable[[Any], Any]
+    ) -> Callable[[Any], Any]:
+        if not self._timing:
+            return hook
+
+        histogram = None if self._stats is None else self._get_histogram(label)
+        tracer = self._tracer
+
+        def timed(argument: Any) -> None:
+            started = time.perf_counter_ns()
+            hook(argument)
+            ended = time.perf_counter_ns()
+            if histogram is not None:
+                histogram.record(ended - started)
+            if tracer is not None:
+                tracer.record(label, started, ended)
+
+        return timed
+
+    def connect_state_hook(self, path: str, **kwargs: Any) -> None:
+        r"""
+        Calls the hook function of the state file.
+
+        .. versionadded:: 1.0
+
+        :param path:
+            | The path to the state file containing the hook function to be called.
+        :param \**kwargs:
+            | The keyword arguments to be passed to the hook function.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the hook function was not found in the state file to be loaded.
+        """
+        profiler = self.profiler
+        if profiler is not None:
+            started = time.perf_counter_ns()
+
+        state = importlib.import_module(path)
+        if profiler is not None:
+            profiler.record("import", path, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        if "hook" not in state.__dict__:
+            msg = (
+                "\nAn error occurred in loading state path-\n"
+                f"`{path}`\n"
+                "`hook` function was not found in state file to load.\n"
+            )
+            raise StateError(
+                msg,
+                last_state=self._last_state,
+                **kwargs,
+            )
+
+        logger.debug("Hooking up state: %s", state.__name__)
+        if profiler is not None:
+            started = time.perf_counter_ns()
+
+        state.__dict__["hook"](**kwargs)
+        if profiler is not None:
+            profiler.record("hook", path, started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
+    def discover_state_hooks(
+        self,
+        package: str,
+        *,
+        index_path: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Tuple[int, ...]:
+        r"""
+        Finds the state files of a package without importing them. The states are
+        added to the manager like lazy states, and the hook function of their file
+        is called through :meth:`connect_state_hook` the first time
+        :meth:`change_state` switches to one of them.
+
+        The files are parsed instead of imported: every class defined at the top
+        level of a file which has a ``hook`` function is taken to be a state when it
+        subclasses ``bound_state_type``, and is named by its ``state_name``
+        argument or its class name. Its bases are resolved through the imports of
+        the file, so they have to be either defined within the package or imported
+        before the discovery.
+
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            manager.discover_state_hooks("states", index_path="states.json")
+            manager.change_state("MainMenu")  # Imports `states.main_menu` here.
+
+        :param package:
+            | The package containing the state files. Only its parent packages are
+              imported.
+        :param index_path:
+            | Default ``None``.
+            |
+            | The file to cache the scanned files in, keyed by their modification time
+              & size. Only the files which changed since are parsed again.
+        :param \**kwargs:
+            | The keyword arguments to be passed to the hook functions.
+
+        :rtype: typing.Tuple[int, ...]
+
+        :returns:
+            | The handles (see :meth:`get_handle`) of the discovered states. States
+              which have already been added are skipped.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the package doesn't exist.
+        """
+        handles: List[int] = []
+        for state_name, module in _discover_state_hooks(
+            package, index_path, self.bound_state_type
+        ).items():
+            if (
+                state_name in self._states
+                or state_name in self._lazy_states
+                or state_name in self._state_hooks
+            ):
+                continue
+
+            self._state_hooks[state_name] = (module, kwargs)
+            handles.append(self._get_or_create_handle(state_name))
+            logger.debug("Discovered state %s in %s", state_name, module)
+
+        return tuple(handles)
+
+    def _connect_discovered_state(self, state_name: str) -> None:
+        module, kwargs = self._state_hooks[state_name]
+        # The hook of a file adds all of its states at once.
+        for discovered_state in [
+            discovered_state
+            for discovered_state, (
+                discovered_module,
+                _,
+            ) in self._state_hooks.items()
+            if discovered_module == module
+        ]:
+            del self._state_hooks[discovered_state]
+
+        self.connect_state_hook(module, **kwargs)
+
+    def add_lazy_states(
+        self,
+        *lazy_states: Type[S],
+        force: bool = False,
+        state_args: Optional[Iterable[StateArgs]] = None,
+    ) -> Tuple[int, ...]:
+        r"""
+        Lazily adds the States into the StateManager.
+        Unlike :meth:`load_states`, it only initializes the state when required
+        i.e. when :meth:`change_state` switches to the lazy state.
+
+        .. versionchanged:: 2.5
+
+            | Method now returns the handles of the added states.
+
+        .. versionadded:: 2.2
+
+        :param lazy_states:
+            | The states to be loaded into the manager as lazy states.
+        :type lazy_states: State
+
+        :param force:
+            | Default ``False``.
+            |
+            | Loads the state regardless of whether the state has already been loaded or not
+            | without raising any internal error.
+
+            .. warning::
+              If set to ``True`` it may lead to unexpected behavior.
+
+        :param state_args:
+            | The data to be passed to the subclassed states upon their initialization in the manager.
+
+        :rtype: typing.Tuple[int, ...]
+
+        :returns:
+            | The handles (see :meth:`get_handle`) of the added lazy states in the
+              order they were added.
+
+        :raises:
+            :exc:`game_state.errors.StateLoadError`
+                | Raised when the state has already been loaded.
+                | Only raised when ``force`` is set to ``False``.
+        """
+        args_cache: Dict[str, Optional[StateArgs]] = {}
+        all_states: List[Type[S]] = []
+        if self._bindings is None:
+            all_states.extend(self.bound_state_type._lazy_states)  # pyright: ignore[reportPrivateUsage, reportArgumentType]
+            self.bound_state_type._lazy_states.clear()  # pyright: ignore[reportPrivateUsage]
+        all_states.extend(lazy_states)
+
+        if state_args:
+            for argument in state_args:
+                args_cache[argument.state_name] = argument
+
+        for lazy_state in all_states:
+            if (
+                not force
+                and lazy_state.state_name in self._states
+                or lazy_state.state_name in self._lazy_states
+            ):
+                msg = f"State: {lazy_state.state_name} has already been added."
+                raise StateLoadError(
+                    msg,
+                    last_state=self._last_state,
+                )
+
+            lazy_state_arg: Optional[List[StateArgs]] = (  # pyright: ignore[reportAssignmentType]
+                None
+                if args_cache.get(lazy_state.state_name) is None
+                else [args_cache[lazy_state.state_name]]
+            )
+            self._lazy_states[lazy_state.state_name] = (
+                lazy_state,
+                lazy_state_arg,
+            )
+            logger.debug("Added lazy state: %s", lazy_state.state_name)
+
+        return tuple(
+            self._get_or_create_handle(lazy_state.state_name)
+            for lazy_state in all_states
+        )
+
+    def load_states(
+        self,
+        *states: Type[S],
+        force: bool = False,
+        state_args: Optional[Iterable[StateArgs]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Tuple[int, ...]:
+        r"""
+        Loads the States into the StateManager.
+
+        .. versionchanged:: 2.5
+
+            | Method now accepts ``executor`` & returns the handles of the loaded
+              states.
+
+        .. versionchanged:: 2.1
+
+            | Method now accepts ``state_args``.
+
+        .. versionadded:: 1.0
+
+        :param states:
+            | The States to be loaded into the manager.
+        :type states: State
+
+        :param force:
+            | Default ``False``.
+            |
+            | Loads the state regardless of whether the state has already been loaded or not
+            | without raising any internal error.
+
+            .. warning::
+              If set to ``True`` it may lead to unexpected behavior.
+
+        :param state_args:
+            | The data to be passed to the subclassed states upon their initialization in the manager.
+
+        :param executor:
+            | Default ``None``.
+            |
+            | A :class:`concurrent.futures.Executor` to initialize the states and call their
+            | :meth:`State.on_load` listeners on in parallel. Once every state has been
+            | loaded, they're registered into the manager on the calling thread in the
+            | order they were passed, and :meth:`global_on_load` is called for each of
+            | them right after it has been registered.
+            |
+            | If any of the states fail to load, none of the states are registered and the
+            | error of the first failed state is re-raised.
+
+            .. note::
+              Unlike the sequential loading, :meth:`global_on_load` is called after
+              :meth:`State.on_load` when an executor is passed. This keeps the global
+              listener on the calling thread.
+
+        :rtype: typing.Tuple[int, ...]
+
+        :returns:
+            | The handles (see :meth:`get_handle`) of the loaded states in the order they
+              were loaded.
+
+        :raises:
+            :exc:`game_state.errors.StateLoadError`
+                | Raised when the state has already been loaded.
+                | Only raised when ``force`` is set to ``False``.
+        """
+        timing = self._timing
+        if timing:
+            started = time.perf_counter_ns()
+
+        args_cache: Dict[str, Dict[str, Any]] = {}
+        args_objects: Dict[str, StateArgs] = {}
+        all_states: List[Type[S]] = []
+        if self._bindings is None:
+            all_states.extend(self.bound_state_type._eager_states)  # pyright: ignore[reportPrivateUsage, reportArgumentType]
+            self.bound_state_type._eager_states.clear()  # pyright: ignore[reportPrivateUsage]
+        all_states.extend(states)
+
+        if state_args:
+            for argument in state_args:
+                args_cache[argument.state_name] = argument.get_data()
+                args_objects[argument.state_name] = argument
+
+        if executor is not None:
+            self._load_states_parallel(
+                all_states, args_cache, args_objects, force, executor
+            )
+            if timing:
+                self._record_timing("load_states", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+            return tuple(
+                self._handles[state.state_name] for state in all_states
+            )
+
+        for state in all_states:
+            final_state_args = args_cache.get(state.state_name, {})
+
+            if not force and state.state_name in self._states:
+                msg = f"State: {state.state_name} has already been loaded."
+                raise StateLoadError(
+                    msg,
+                    last_state=self._last_state,
+                    **final_state_args,
+                )
+
+            self._register_state(
+                self._create_state(state, final_state_args),
+                None
+                if state.state_name not in args_objects
+                else [args_objects[state.state_name]],
+            )
+            logger.debug("Loaded state: %s", state.state_name)
+
+            self._call_global_on_load(self._states[state.state_name])
+
+            self._call_on_load(self._states[state.state_name])
+
+        if timing:
+            self._record_timing("load_states", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        return tuple(self._handles[state.state_name] for state in all_states)
+
+    def _build_state(self, state: Type[S], state_args: Dict[str, Any]) -> S:
+        instance = self._create_state(state, state_args)
+        self._call_on_load(instance)
+        return instance
+
+    def _load_states_parallel(
+        self,
+        states: List[Type[S]],
+        args_cache: Dict[str, Dict[str, Any]],
+        args_objects: Dict[str, StateArgs],
+        force: bool,
+        executor: Executor,
+    ) -> None:
+        if not force:
+            seen: Set[str] = set()
+            for state in states:
+                if (
+                    state.state_name in self._states
+                    or state.state_name in seen
+                ):
+                    msg = f"State: {state.state_name} has already been loaded."
+                    raise StateLoadError(
+                        msg,
+                        last_state=self._last_state,
+                        **args_cache.get(state.state_name, {}),
+                    )
+                seen.add(state.state_name)
+
+        futures = [
+            executor.submit(
+                self._build_state, state, args_cache.get(state.state_name, {})
+            )
+            for state in states
+        ]
+        wait(futures)
+
+        # Raises the error of the first failed state before anything is registered.
+        instances = [future.result() for future in futures]
+
+        for instance in instances:
+            self._register_state(
+                instance,
+                None
+                if instance.state_name not in args_objects
+                else [args_objects[instance.state_name]],
+            )
+            logger.debug("Loaded state: %s", instance.state_name)
+
+            self._call_global_on_load(instance)
+
+    def reload_state(
+        self, state_name: str, force: bool = False, **kwargs: Any
+    ) -> S:
+        r"""
+        Reloads the specified state. A short hand to :meth:`unload_state` &
+        :meth:`load_states`.
+
+        .. versionadded:: 1.0
 
         :param state_name:
             | The state name to be reloaded.
@@ -710,8 +2686,8 @@ class StateManager(Generic[S]):
                 | Only raised when ``force`` is set to ``False``.
         """
         if state_name not in self._states:
-            state_keys = self.state_map.keys()
-            lazy_state_keys = self.lazy_state_map.keys()
+            state_keys = self._states.keys()
+            lazy_state_keys = self._lazy_states.keys()
 
             message = f"State: `{state_name}` doesn't exist to be unloaded"
 
@@ -736,6 +2712,9 @@ class StateManager(Generic[S]):
             )
 
         logger.debug("Reloading state: %s", state_name)
+        timing = self._timing
+        if timing:
+            started = time.perf_counter_ns()
 
         self._is_reloading = True
         deleted_cls = self.unload_state(
@@ -744,6 +2723,8 @@ class StateManager(Generic[S]):
         self.load_states(deleted_cls, force=force, **kwargs)
         self._is_reloading = False
 
+        if timing:
+            self._record_timing(f"{state_name}.reload_state", started)  # pyright: ignore[reportPossiblyUnboundVariable]
         return self._states[state_name]
 
     def remove_lazy_state(
@@ -769,6 +2750,17 @@ class StateManager(Generic[S]):
         try:
             cls_ref = self._lazy_states[state_name]
             del self._lazy_states[state_name]
+            self._discard_snapshot(state_name)
+
+            prefetching = self._prefetching.pop(state_name, None)
+            if prefetching is not None:
+                prefetching.cancel()
+
+            if (
+                self._pending_load is not None
+                and self._pending_load.state_name == state_name
+            ):
+                self._pending_load = None
             logger.debug("Successfully removed lazy state: %s", state_name)
         except KeyError:
             logger.exception("Failed to remove lazy state: %s", state_name)
@@ -782,6 +2774,12 @@ class StateManager(Generic[S]):
         r"""
         Unloads the specified state from the :class:`StateManager`.
 
+        .. versionchanged:: 2.5
+
+            | The state is hibernated when :attr:`hibernation_dir` is set & its
+              :meth:`State.on_hibernate` returns a snapshot. Hibernated states are
+              kept as lazy states & resumed from their snapshot once switched to.
+
         .. versionadded:: 1.0
 
         :param state_name:
@@ -813,8 +2811,8 @@ class StateManager(Generic[S]):
                 | Only raised when ``force`` is set to ``False``.
         """
         if state_name not in self._states:
-            state_keys = self.state_map.keys()
-            lazy_state_keys = self.lazy_state_map.keys()
+            state_keys = self._states.keys()
+            lazy_state_keys = self._lazy_states.keys()
 
             message = f"State: `{state_name}` doesn't exist to be unloaded"
 
@@ -850,11 +2848,273 @@ class StateManager(Generic[S]):
                 **kwargs,
             )
 
+        if not force and self._states[state_name] in self._state_stack:
+            msg = "Cannot unload a state covered in the state stack."
+            raise StateError(
+                msg,
+                last_state=self._last_state,
+                **kwargs,
+            )
+
+        timing = self._timing
+        if timing:
+            started = time.perf_counter_ns()
+
+        self._call_global_on_unload(self._states[state_name])
+
+        snapshot_path: Optional[str] = None
+        if self.hibernation_dir is not None and not self._is_reloading:
+            logger.debug("Calling %s.on_hibernate", state_name)
+            snapshot = self._states[state_name].on_hibernate()
+            if snapshot is not None:
+                snapshot_path = _write_snapshot(
+                    self.hibernation_dir,
+                    state_name,
+                    snapshot,
+                    self.hibernation_codec,
+                )
+
         logger.debug("Calling %s.on_unload", state_name)
+        if timing:
+            unload_started = time.perf_counter_ns()
         self._states[state_name].on_unload(self._is_reloading)
+        if timing:
+            self._record_timing(f"{state_name}.on_unload", unload_started)  # pyright: ignore[reportPossiblyUnboundVariable]
 
         cls_ref = self._states[state_name].__class__
         del self._states[state_name]
+        state_args = self._state_args.pop(state_name, None)
+        self._recently_entered.pop(state_name, None)
+        self._snapshot_cache.pop(state_name, None)
+        self._dispatch_plans.pop(state_name, None)
+        self._handle_table[self._handles[state_name]] = None
         logger.debug("Successfully unloaded state: %s", state_name)
 
+        if snapshot_path is not None:
+            self._hibernated[state_name] = snapshot_path
+            self._lazy_states[state_name] = (
+                cls_ref,
+                None if state_args is None else [state_args],
+            )
+            logger.debug("Hibernated state: %s", state_name)
+
+        if timing:
+            self._record_timing(f"{state_name}.unload_state", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+
         return cls_ref
+
+    def snapshot(self) -> bytes:
+        r"""
+        Captures the loaded & lazy states of the manager along with the current
+        state, the last state & the :attr:`state_stack`, to be restored later
+        through :meth:`restore`.
+
+        Every loaded state is saved with its :class:`StateArgs` & the snapshot
+        returned by its :meth:`State.on_hibernate` listener. The encoded states are
+        cached, so calling this again only re-encodes the states which have been
+        loaded, entered or marked through :meth:`mark_dirty` since, along with the
+        states in the :attr:`state_stack`. This keeps frequent autosaves cheap.
+
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            with open("save.bin", "wb") as file:
+                file.write(manager.snapshot())
+
+        .. note::
+
+            The states & their snapshots are pickled, so the state classes have to
+            be importable by their qualified names. Hibernated states are saved as
+            loaded states.
+
+        :rtype: bytes
+
+        :returns:
+            | The snapshot of the manager.
+        """
+        timing = self._timing
+        if timing:
+            started = time.perf_counter_ns()
+
+        cache = self._snapshot_cache
+        live_states = {state.state_name for state in self.state_stack}
+        states: List[Tuple[str, bytes]] = []
+
+        for state_name, state in self._states.items():
+            data = cache.get(state_name)
+            if data is None:
+                data = pickle.dumps(
+                    (
+                        type(state),
+                        self._state_args.get(state_name),
+                        state.on_hibernate(),
+                    ),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                # The states in the stack keep changing, so they're never cached.
+                if state_name not in live_states:
+                    cache[state_name] = data
+            states.append((state_name, data))
+
+        for state_name, snapshot_path in self._hibernated.items():
+            data = cache.get(state_name)
+            if data is None:
+                cls_ref, lazy_state_args = self._lazy_states[state_name]
+                data = cache[state_name] = pickle.dumps(
+                    (
+                        cls_ref,
+                        lazy_state_args[0] if lazy_state_args else None,
+                        _read_snapshot(
+                            snapshot_path, self.hibernation_codec, copy=True
+                        ),
+                    ),
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            states.append((state_name, data))
+
+        data = pickle.dumps(
+            (
+                _SNAPSHOT_VERSION,
+                tuple(self._handle_names),
+                tuple(states),
+                tuple(
+                    (state_name, cls_ref, lazy_state_args)
+                    for state_name, (
+                        cls_ref,
+                        lazy_state_args,
+                    ) in self._lazy_states.items()
+                    if state_name not in self._hibernated
+                ),
+                tuple(state.state_name for state in self._state_stack),
+                getattr(self._current_state, "state_name", None),
+                None
+                if self._last_state is None
+                or self._last_state.state_name not in self._states
+                else self._last_state.state_name,
+            ),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+        if timing:
+            self._record_timing("snapshot", started)  # pyright: ignore[reportPossiblyUnboundVariable]
+        return data
+
+    def mark_dirty(self, state_name: str) -> None:
+        r"""
+        Marks a state to be encoded again by the next :meth:`snapshot`. Needed for
+        states which change while they aren't in the :attr:`state_stack`.
+
+        .. versionadded:: 2.5
+
+        :param state_name:
+            | The name of the state.
+        """
+        self._snapshot_cache.pop(state_name, None)
+
+    @classmethod
+    def restore(
+        cls,
+        data: bytes,
+        *,
+        bound_state_type: Type[S] = State,
+        instance_binding: bool = False,
+        **kwargs: Any,
+    ) -> StateManager[S]:
+        r"""
+        Makes a new manager from the data returned by :meth:`snapshot`.
+
+        The states with a snapshot are restored through :meth:`State.on_resume` &
+        the rest are initialized with their :class:`StateArgs` & loaded through
+        :meth:`State.on_load`. The current state, the last state & the
+        :attr:`state_stack` are then set back without calling any enter or leave
+        listeners.
+
+        .. versionadded:: 2.5
+
+        .. code-block:: python
+
+            with open("save.bin", "rb") as file:
+                manager = StateManager.restore(
+                    file.read(), bound_state_type=MyBaseState, window=window
+                )
+
+        .. warning::
+
+            The data is unpickled, so only restore data you trust.
+
+        :param data:
+            | The data returned by :meth:`snapshot`.
+        :param bound_state_type:
+            | The base state class which all states inherits from.
+        :param instance_binding:
+            | Default ``False``.
+            |
+            | Whether the manager uses instance binding.
+        :param \**kwargs:
+            | The keyword arguments to bind to the states.
+
+        :rtype: StateManager
+
+        :returns:
+            | The restored manager.
+
+        :raises:
+            :exc:`game_state.errors.StateLoadError`
+                | Raised when the data was made by an unsupported version.
+        """
+        (
+            version,
+            handle_names,
+            states,
+            lazy_states,
+            state_stack,
+            current_state,
+            last_state,
+        ) = pickle.loads(data)  # noqa: S301
+        if version != _SNAPSHOT_VERSION:
+            msg = f"Unsupported snapshot version: {version}."
+            raise StateLoadError(msg)
+
+        manager = cls(
+            bound_state_type=bound_state_type,
+            instance_binding=instance_binding,
+            **kwargs,
+        )
+
+        for state_name in handle_names:
+            manager._get_or_create_handle(state_name)
+
+        for state_name, cls_ref, lazy_state_args in lazy_states:
+            manager._lazy_states[state_name] = (cls_ref, lazy_state_args)
+
+        for state_name, state_data in states:
+            cls_ref, state_args, snapshot = pickle.loads(state_data)  # noqa: S301
+            if snapshot is None:
+                instance = manager._create_state(
+                    cls_ref,
+                    {} if state_args is None else state_args.get_data(),
+                )
+                manager._call_on_load(instance)
+            else:
+                instance = manager._create_resumed_state(cls_ref, snapshot)
+
+            manager._register_state(
+                instance, None if state_args is None else [state_args]
+            )
+            manager._snapshot_cache[state_name] = state_data
+            logger.debug("Restored state: %s", state_name)
+
+        manager._state_stack = [
+            manager._states[state_name] for state_name in state_stack
+        ]
+        if current_state is not None:
+            manager._current_state = manager._states[current_state]
+            manager._recently_entered[current_state] = None
+        if last_state is not None:
+            manager._last_state = manager._states[last_state]
+
+        for state in manager.state_stack:
+            manager._snapshot_cache.pop(state.state_name, None)
+
+        return manager
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from src.game_state.errors import StateError
+from src.game_state.sync_machine.manager import StateManager
+from src.game_state.sync_machine.state import State
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any, Dict, List, Set, Type
+
+
+__all__ = ("StateManagerPool",)
+
+
+S = TypeVar("S", bound="State[Any]")
+
+
+class StateManagerPool(Generic[S]):
+    r"""
+    Allocates independent :class:`StateManager` sessions sharing the same
+    state classes.
+
+    Every session manager uses instance binding, meaning the manager & the keyword
+    arguments are bound to the state instances instead of the state classes. This
+    allows any number of sessions to run the same states side by side.
+
+    .. versionadded:: 2.5
+
+    .. note::
+        States marked with ``eager_load`` or ``lazy_load`` are claimed by the pool
+        when it's created and are added to every session it allocates.
+
+    :param bound_state_type:
+        | The base state class which all states inherits from.
+    :type bound_state_type: type[State]
+    :param states:
+        | The states to be loaded into every session.
+    :param lazy_states:
+        | The states to be lazily loaded into every session.
+    :param \**kwargs:
+        | The keyword arguments to bind to the states of every session.
+    """
+
+    def __init__(
+        self,
+        *,
+        bound_state_type: Type[S] = State,
+        states: Iterable[Type[S]] = (),
+        lazy_states: Iterable[Type[S]] = (),
+        **kwargs: Any,
+    ) -> None:
+        self.bound_state_type: Type[S] = bound_state_type
+
+        self._states: List[Type[S]] = [
+            *cast("List[Type[S]]", bound_state_type._eager_states),  # pyright: ignore[reportPrivateUsage]
+            *states,
+        ]
+        self._lazy_states: List[Type[S]] = [
+            *cast("List[Type[S]]", bound_state_type._lazy_states),  # pyright: ignore[reportPrivateUsage]
+            *lazy_states,
+        ]
+        bound_state_type._eager_states.clear()  # pyright: ignore[reportPrivateUsage]
+        bound_state_type._lazy_states.clear()  # pyright: ignore[reportPrivateUsage]
+
+        self._kwargs: Dict[str, Any] = kwargs
+        self._sessions: Set[StateManager[S]] = set()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def acquire(self, **kwargs: Any) -> StateManager[S]:
+        r"""
+        Allocates a new session manager with the pool's states loaded into it.
+
+        .. versionadded:: 2.5
+
+        :param \**kwargs:
+            | The keyword arguments to bind to the states of this session, overriding
+              the ones passed to the pool.
+
+        :returns:
+            | The manager of the session.
+        :rtype: StateManager
+        """
+        manager = StateManager(
+            bound_state_type=self.bound_state_type,
+            instance_binding=True,
+            **{**self._kwargs, **kwargs},
+        )
+        manager.add_lazy_states(*self._lazy_states)
+        manager.load_states(*self._states)
+
+        self._sessions.add(manager)
+        return manager
+
+    def release(self, manager: StateManager[S]) -> None:
+        r"""
+        Unloads every state of a session & removes it from the pool. Any lazy
+        states still waiting to be prefetched are cancelled & the prefetch worker
+        of the session is stopped.
+
+        .. versionadded:: 2.5
+
+        :param manager:
+            | The manager of the session as returned by :meth:`acquire`.
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the manager doesn't belong to the pool.
+        """
+        if manager not in self._sessions:
+            msg = "The manager doesn't belong to this pool."
+            raise StateError(msg, last_state=manager.last_state)
+
+        self._sessions.remove(manager)
+        manager.is_running = False
+        for state_name in tuple(manager.lazy_state_map):
+            manager.remove_lazy_state(state_name)
+        for state_name in tuple(manager.state_map):
+            manager.unload_state(state_name, force=True)
+        manager.close()
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from concurrent.futures import wait
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from src.game_state.errors import StateError
+from src.game_state.sync_machine.manager import StateManager
+from src.game_state.sync_machine.state import State
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from concurrent.futures import Executor
+    from typing import Any, Dict, Optional, Type
+
+
+__all__ = ("RegionManager",)
+
+
+S = TypeVar("S", bound="State[Any]")
+
+
+class RegionManager(Generic[S]):
+    r"""
+    Runs several independent regions side by side, such as the HUD, the world &
+    the ambience of a game. Every region is a :class:`StateManager` of its own with
+    its own current state, and :meth:`update` steps all of them together.
+
+    The region managers use instance binding, so the regions can share the same
+    state classes.
+
+    .. versionadded:: 2.5
+
+    .. code-block:: python
+
+        regions = RegionManager(executor=ThreadPoolExecutor())
+        regions.add_region("hud").load_states(Hud)
+        regions.add_region("world").load_states(Overworld, Dungeon)
+
+        regions["hud"].change_state("Hud")
+        regions["world"].change_state("Overworld")
+
+        regions.update(dt)
+
+    :param bound_state_type:
+        | The base state class which all states inherits from.
+    :type bound_state_type: type[State]
+    :param executor:
+        | Default ``None``.
+        |
+        | A :class:`concurrent.futures.Executor` to update the regions on in parallel.
+          The regions are updated one after another on the calling thread when not
+          passed.
+    :param \**kwargs:
+        | The keyword arguments to bind to the states of every region.
+    """
+
+    def __init__(
+        self,
+        *,
+        bound_state_type: Type[S] = State,
+        executor: Optional[Executor] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.bound_state_type: Type[S] = bound_state_type
+        self.executor: Optional[Executor] = executor
+
+        self._kwargs: Dict[str, Any] = kwargs
+        self._regions: Dict[str, StateManager[S]] = {}
+        self._region_view: Mapping[str, StateManager[S]] = MappingProxyType(
+            self._regions
+        )
+
+    def __getitem__(self, name: str) -> StateManager[S]:
+        return self._regions[name]
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    @property
+    def regions(self) -> Mapping[str, StateManager[S]]:
+        r"""
+        A read-only view of the region managers by their names.
+
+        .. versionadded:: 2.5
+
+        :type: typing.Mapping[str, StateManager]
+        """
+        return self._region_view
+
+    def add_region(self, name: str, **kwargs: Any) -> StateManager[S]:
+        r"""
+        Adds a new region.
+
+        .. versionadded:: 2.5
+
+        :param name:
+            | The name of the region.
+        :param \**kwargs:
+            | The keyword arguments to bind to the states of this region, overriding
+              the ones passed to the :class:`RegionManager`.
+
+        :returns:
+            | The manager of the region.
+        :rtype: StateManager
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when a region with the same name already exists.
+        """
+        if name in self._regions:
+            msg = f"Region `{name}` already exists."
+            raise StateError(msg)
+
+        manager = StateManager(
+            bound_state_type=self.bound_state_type,
+            instance_binding=True,
+            **{**self._kwargs, **kwargs},
+        )
+        self._regions[name] = manager
+        return manager
+
+    def remove_region(self, name: str) -> StateManager[S]:
+        r"""
+        Removes a region. Its states are left loaded in the returned manager.
+
+        .. versionadded:: 2.5
+
+        :param name:
+            | The name of the region.
+
+        :returns:
+            | The manager of the removed region.
+        :rtype: StateManager
+
+        :raises:
+            :exc:`game_state.errors.StateError`
+                | Raised when the region doesn't exist.
+        """
+        try:
+            return self._regions.pop(name)
+        except KeyError:
+            msg = f"Region `{name}` doesn't exist."
+            raise StateError(msg) from None
+
+    def update(self, dt: float) -> None:
+        r"""
+        Calls :meth:`State.process_update` of the current state of every region.
+        Regions without a current state are skipped.
+
+        When an :attr:`executor` is set, the regions are updated in parallel & the
+        call returns once all of them are done. The error of the first failed
+        region, if any, is then re-raised.
+
+        .. versionadded:: 2.5
+
+        :param dt:
+            | The time to advance the states by in seconds.
+        """
+        states = [
+            manager.current_state
+            for manager in self._regions.values()
+            if manager.current_state is not None
+        ]
+
+        if self.executor is None:
+            for state in states:
+                state.process_update(dt)
+            return
+
+        futures = [
+            self.executor.submit(state.process_update, dt) for state in states
+        ]
+        wait(futures)
+        for future in futures:
+            future.result()
@@ -3,11 +3,14 @@ from __future__ import annotations
 from abc import ABC
 from typing import TYPE_CHECKING, Generic, TypeVar, overload
 
+from src.game_state.events import _compile_event_handlers  # pyright: ignore[reportPrivateUsage]
 from src.game_state.utils import MISSING
 
 if TYPE_CHECKING:
-    from typing import Any, List, Literal, Optional, Type
+    from collections.abc import Generator
+    from typing import Any, Dict, List, Literal, Optional, Tuple, Type
 
+    from src.game_state.events import _EventHandler  # pyright: ignore[reportPrivateUsage]
     from src.game_state.sync_machine.manager import StateManager
 
 
@@ -30,11 +33,37 @@ class State(ABC, Generic[S]):
             The manager to which the state is binded to.
 
             .. versionadded:: 1.0
+
+        neighbours: :class:`tuple` [:class:`str`, ...]
+            The names of the states likely to be switched to from this state. They're
+            prefetched in the background once this state has been entered when
+            :attr:`StateManager.auto_prefetch` is enabled.
+
+            .. versionadded:: 2.5
+
+        update_below: :class:`bool`
+            Whether the state covered by this state in the
+            :attr:`StateManager.state_stack` keeps being updated by
+            :meth:`StateManager.run`. ``False`` by default.
+
+            .. versionadded:: 2.5
+
+        render_below: :class:`bool`
+            Whether the state covered by this state in the
+            :attr:`StateManager.state_stack` keeps being rendered by
+            :meth:`StateManager.run`, such as a game drawn behind a pause menu.
+            ``False`` by default.
+
+            .. versionadded:: 2.5
     """
 
     state_name: str = MISSING
     manager: StateManager[State[S]] = MISSING
+    neighbours: Tuple[str, ...] = ()
+    update_below: bool = False
+    render_below: bool = False
 
+    _event_handlers: Dict[Any, Tuple[_EventHandler, ...]] = {}
     _eager_states: List[Type[State[S]]] = []
     _lazy_states: List[Type[State[S]]] = []
 
@@ -106,6 +135,7 @@ class State(ABC, Generic[S]):
             enable one (or none) of them.
         """
         cls.state_name = state_name or cls.__name__
+        cls._event_handlers = _compile_event_handlers(cls)
 
         if lazy_load and eager_load:
             msg = (
@@ -120,13 +150,20 @@ class State(ABC, Generic[S]):
         elif lazy_load:
             cls._lazy_states.append(cls)
 
-    def on_load(self, reload: bool) -> None:
+    def on_load(
+        self, reload: bool
+    ) -> Optional[Generator[Optional[float], None, None]]:
         r"""
         Called when the state is loaded into the :class:`StateManager`.
 
         This listener is invoked both during the initial load of the state and
         when the state is reloaded.
 
+        .. versionchanged:: 2.5
+
+            | The listener can be a generator yielding its loading progress to be
+              loaded over multiple frames with :meth:`StateManager.begin_loading`.
+
         .. versionadded:: 2.3.0
 
         .. note::
@@ -157,6 +194,61 @@ class State(ABC, Generic[S]):
               the first time (``False``) or reloaded (``True``).
         """
 
+    def estimate_size(self) -> int:
+        r"""
+        Estimates the memory used by the state in bytes. Used by the
+        :class:`StateManager` to keep the loaded states within its
+        :attr:`StateManager.memory_budget`.
+
+        Returns ``0`` by default.
+
+        .. versionadded:: 2.5
+
+        :rtype: int
+        """
+        return 0
+
+    def on_hibernate(self) -> Any:
+        r"""
+        Called before the state is unloaded when the :class:`StateManager` has a
+        :attr:`StateManager.hibernation_dir`. The returned snapshot is written to
+        disk & passed to :meth:`on_resume` the next time the state is switched to,
+        instead of initializing & loading the state again.
+
+        Returns ``None`` by default, which unloads the state as usual.
+
+        The snapshot is also saved by :meth:`StateManager.snapshot`, so this may be called
+        without the state being unloaded.
+
+        .. versionadded:: 2.5
+
+        .. note::
+
+            Snapshots are pickled unless the manager has a
+            :attr:`StateManager.hibernation_codec`. Large buffers such as
+            :class:`bytearray` or :class:`memoryview` can be wrapped in
+            :class:`pickle.PickleBuffer` to be written & read back without copies.
+            They're read back as read-only :class:`memoryview` objects of the snapshot
+            file, which stays mapped until they're released. Copy them, such as
+            through ``bytearray(buffer)``, to modify them. On Windows, where a mapped
+            file can't be removed, they're read back as copies instead.
+
+        :returns:
+            | The snapshot of the state or ``None``.
+        """
+        return None
+
+    def on_resume(self, snapshot: Any) -> None:
+        r"""
+        Called instead of ``__init__`` & :meth:`on_load` when a hibernated state is
+        switched to, with the snapshot returned by :meth:`on_hibernate`.
+
+        .. versionadded:: 2.5
+
+        :param snapshot:
+            | The snapshot of the state.
+        """
+
     def on_enter(self, previous_state: Optional[S]) -> None:
         r"""
         This listener is called once when a state has been switched and is
@@ -189,3 +281,38 @@ class State(ABC, Generic[S]):
             | The next state that is going to be applied.
         :type next_state: State
         """
+
+    def process_event(self, event: Any) -> None:
+        r"""
+        Called by :meth:`StateManager.dispatch_event` for the events which aren't
+        handled by any of the state's listeners registered with
+        :func:`~game_state.events.on_event`.
+
+        .. versionadded:: 2.5
+
+        :param event:
+            | The event to be processed.
+        """
+
+    def process_update(self, dt: float) -> None:
+        r"""
+        Called by :meth:`StateManager.run` to advance the state by a fixed timestep
+        while it's running.
+
+        .. versionadded:: 2.5
+
+        :param dt:
+            | The time to advance the state by in seconds.
+        """
+
+    def process_render(self, alpha: float) -> None:
+        r"""
+        Called by :meth:`StateManager.run` once every frame after the updates while
+        the state is running.
+
+        .. versionadded:: 2.5
+
+        :param alpha:
+            | How far the frame is between the last & the next update, from ``0`` up
+              to ``1``. Useful for interpolating the positions drawn.
+        """
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+__all__ = ("Tracer",)
+
+
+class Tracer:
+    r"""
+    Records the transitions of a manager & the listeners called within them as
+    spans, which can be exported as trace-event JSON & opened on a timeline in
+    https://ui.perfetto.dev or ``chrome://tracing``.
+
+    The spans are kept in a ring buffer allocated upfront, so once it's full the
+    oldest spans are overwritten. Recording a span claims its slot without taking
+    a lock, which keeps the tracer cheap on the hot path & safe to share between
+    threads.
+
+    The spans are named after the keys of :meth:`StateManager.stats`, such as
+    ``Game.change_state`` & ``Game.on_enter``. Spans recorded by an
+    :class:`AsyncStateManager` are placed on the track of the task they ran in,
+    and the rest on the track of their thread.
+
+    .. versionadded:: 2.5
+
+    .. code-block:: python
+
+        tracer = Tracer()
+        manager.tracer = tracer
+
+        while manager.is_running:
+            started = time.perf_counter_ns()
+            ...
+            tracer.record("frame", started, time.perf_counter_ns())
+
+        tracer.export("trace.json")
+
+    :param capacity:
+        | Default ``65536``.
+        |
+        | The amount of spans to be kept.
+
+    :raises:
+        :exc:`ValueError`
+            | Raised when the capacity isn't positive.
+    """
+
+    __slots__: Tuple[str, ...] = (
+        "_counter",
+        "_ends",
+        "_names",
+        "_origin",
+        "_starts",
+        "_track_names",
+        "_tracks",
+        "capacity",
+    )
+
+    def __init__(self, capacity: int = 65536) -> None:
+        if capacity <= 0:
+            msg = "The capacity must be positive."
+            raise ValueError(msg)
+
+        self.capacity: int = capacity
+        self._origin: int = time.perf_counter_ns()
+        self._counter: Iterator[int] = itertools.count()
+        self._names: List[Optional[str]] = [None] * capacity
+        self._starts: array[int] = array("q", bytes(8 * capacity))
+        self._ends: array[int] = array("q", bytes(8 * capacity))
+        self._tracks: array[int] = array("Q", bytes(8 * capacity))
+        self._track_names: Dict[int, str] = {}
+
+    def record(
+        self,
+        name: str,
+        started: int,
+        ended: int,
+        task: Optional[Task[Any]] = None,
+    ) -> None:
+        r"""
+        Records a span. Spans which start & end within another span on the same
+        track are shown nested under it.
+
+        :param name:
+            | The name of the span.
+        :param started:
+            | When the span started, from :func:`time.perf_counter_ns`.
+        :param ended:
+            | When the span ended, from :func:`time.perf_counter_ns`.
+        :param task:
+            | Default ``None``.
+            |
+            | The task the span ran in. The span is placed on the track of the
+              calling thread when not passed.
+        """
+        if task is None:
+            track = threading.get_ident()
+        else:
+            track = id(task)
+            if track not in self._track_names:
+                self._track_names[track] = task.get_name()
+
+        # Advancing the counter is atomic, so every span gets a slot of its own.
+        index = next(self._counter) % self.capacity
+        self._names[index] = name
+        self._starts[index] = started
+        self._ends[index] = ended
+        self._tracks[index] = track
+
+    def clear(self) -> None:
+        r"""
+        Removes the recorded spans, such as before reproducing a hitch to keep the
+        trace short.
+        """
+        self._counter = itertools.count()
+        self._names[:] = [None] * self.capacity
+        self._track_names.clear()
+
+    def events(self) -> List[Dict[str, Any]]:
+        r"""
+        Converts the recorded spans into trace events, ordered by their start.
+
+        .. note::
+
+            Spans recorded while the events are being made may be left out.
+
+        :rtype: typing.List[typing.Dict[str, typing.Any]]
+        """
+        process = os.getpid()
+        # Names the tracks of the tasks, the threads are named by the viewer.
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": process,
+                "tid": track,
+                "args": {"name": track_name},
+            }
+            for track, track_name in list(self._track_names.items())
+        ]
+
+        spans = sorted(
+            (self._starts[index], index)
+            for index, name in enumerate(self._names)
+            if name is not None
+        )
+        events.extend(
+            {
+                "name": self._names[index],
+                "cat": "game_state",
+                "ph": "X",
+                "ts": (started - self._origin) / 1000,
+                "dur": (self._ends[index] - started) / 1000,
+                "pid": process,
+                "tid": self._tracks[index],
+            }
+            for started, index in spans
+        )
+        return events
+
+    def export(self, path: str) -> None:
+        r"""
+        Writes the recorded spans as trace-event JSON.
+
+        :param path:
+            | The file to write the trace to.
+        """
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"traceEvents": self.events(), "displayTimeUnit": "ms"}, file
+            )
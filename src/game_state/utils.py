@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import logging
+import mmap
 import os
+import pickle
+import struct
 import sys
+import tempfile
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Tuple
+    from typing import Any, Dict, List, Tuple
 
 
 __all__ = ("MISSING", "StateArgs", "setup_logging")
@@ -216,3 +220,96 @@ def setup_logging(
     handler.setFormatter(formatter)
     logger.setLevel(level)
     logger.addHandler(handler)  # pyright: ignore[reportUnknownArgumentType]
+
+
+# Below here are the helpers for hibernating states. A snapshot file starts with the
+# amount of chunks & their lengths, followed by the chunks aligned to 64 bytes. The
+# first chunk is the encoded snapshot and the rest are its out-of-band buffers when
+# it's pickled.
+
+_SNAPSHOT_ALIGNMENT: int = 64
+_SNAPSHOT_COUNT = struct.Struct("<Q")
+# A mapped file can't be removed on Windows, so the buffers are copied out there.
+_SNAPSHOT_MAPPED_BUFFERS: bool = os.name != "nt"
+
+
+def _write_snapshot(  # pyright: ignore[reportUnusedFunction]
+    directory: str, state_name: str, snapshot: Any, codec: Any
+) -> str:
+    if codec is None:
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(
+            snapshot, protocol=5, buffer_callback=buffers.append
+        )
+        chunks = [memoryview(data), *(buffer.raw() for buffer in buffers)]
+    else:
+        chunks = [memoryview(codec.dumps(snapshot))]
+
+    os.makedirs(directory, exist_ok=True)
+    descriptor, path = tempfile.mkstemp(
+        suffix=".snapshot", prefix=f"{state_name}-", dir=directory
+    )
+    with os.fdopen(descriptor, "wb") as file:
+        offset = file.write(
+            struct.pack(
+                f"<{len(chunks) + 1}Q",
+                len(chunks),
+                *(chunk.nbytes for chunk in chunks),
+            )
+        )
+        for chunk in chunks:
+            offset += file.write(b"\0" * (-offset % _SNAPSHOT_ALIGNMENT))
+            offset += file.write(chunk)
+
+    return path
+
+
+def _read_snapshot(  # pyright: ignore[reportUnusedFunction]
+    path: str, codec: Any, *, copy: bool = False
+) -> Any:
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    (count,) = _SNAPSHOT_COUNT.unpack_from(view)
+    lengths = struct.unpack_from(f"<{count}Q", view, _SNAPSHOT_COUNT.size)
+
+    offset = _SNAPSHOT_COUNT.size * (count + 1)
+    chunks: List[memoryview] = []
+    for length in lengths:
+        offset += -offset % _SNAPSHOT_ALIGNMENT
+        chunks.append(view[offset : offset + length])
+        offset += length
+
+    if (
+        codec is None
+        and len(chunks) > 1
+        and _SNAPSHOT_MAPPED_BUFFERS
+        and not copy
+    ):
+        # The out-of-band buffers are read straight from the mapped file, so they're
+        # restored as read-only views which keep it mapped until they're released.
+        return pickle.loads(chunks[0], buffers=chunks[1:])  # noqa: S301
+
+    try:
+        if codec is None:
+            # Copied buffers can be pickled again & don't keep the file mapped.
+            buffers = [bytearray(chunk) for chunk in chunks[1:]]
+            return pickle.loads(chunks[0], buffers=buffers)  # noqa: S301
+        return codec.loads(bytes(chunks[0]))
+    finally:
+        # Nothing restored refers to the mapped file, so it's unmapped right away.
+        for chunk in chunks:
+            chunk.release()
+        view.release()
+        mapped.close()
+
+
+def _remove_snapshot(path: str) -> None:  # pyright: ignore[reportUnusedFunction]
+    try:
+        os.remove(path)
+    except OSError:
+        # The file can't be removed while it's mapped on some platforms.
+        logging.getLogger(__name__).debug(
+            "Could not remove snapshot file: %s", path
+        )
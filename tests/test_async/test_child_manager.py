@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[AsyncStateManager[AsyncState[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Base(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+        async def on_leave(
+            self, next_state: Optional[AsyncState[Any]]
+        ) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+    class Menu(Base): ...
+
+    class Gameplay(Base): ...
+
+    class Exploration(Base): ...
+
+    class Combat(Base): ...
+
+    manager = AsyncStateManager[AsyncState["Any"]](bound_state_type=Base)
+    manager.add_lazy_states(Menu, Gameplay)
+
+    async def global_on_enter(
+        state: AsyncState[Any], _: Optional[AsyncState[Any]]
+    ) -> None:
+        calls.append(f"global_on_enter {state.state_name}")
+
+    manager.global_on_enter = global_on_enter
+
+    child = manager.create_child(
+        Gameplay.state_name, bound_state_type=Base, initial_state="Exploration"
+    )
+    child.add_lazy_states(Exploration, Combat)
+
+    return manager, calls
+
+
+@pytest.mark.asyncio
+async def test_child_manager(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    child = manager.get_child("Gameplay")
+
+    assert child is not None
+    assert child.parent is manager, "Expected the child to know its parent"
+
+    with pytest.raises(StateError):
+        manager.create_child("Gameplay")
+
+    await manager.change_state("Menu")
+    calls.clear()
+    await manager.change_state("Gameplay")
+
+    assert calls == [
+        "Menu.on_leave",
+        "global_on_enter Gameplay",
+        "Gameplay.on_enter",
+        "Exploration.on_enter",
+    ], f"Expected the child to enter its initial state: {calls}"
+    assert child.current_state is not None
+    assert child.current_state.manager is child, (
+        "Expected the child's states to be bound to the child"
+    )
+
+    calls.clear()
+    await child.change_state("Combat")
+
+    assert calls == ["Exploration.on_leave", "Combat.on_enter"], (
+        f"Expected the child's transitions to skip the parent's hooks: {calls}"
+    )
+
+    calls.clear()
+    await manager.change_state("Menu")
+
+    assert calls == [
+        "Combat.on_leave",
+        "Gameplay.on_leave",
+        "global_on_enter Menu",
+        "Menu.on_enter",
+    ], f"Expected the child to leave before its owner: {calls}"
+    assert child.current_state is None, "Expected the child to be idle"
+
+    assert manager.remove_child("Gameplay") is child
+    assert child.parent is None
+
+
+@pytest.mark.asyncio
+async def test_child_manager_stack(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    child = manager.get_child("Gameplay")
+    assert child is not None
+
+    async def global_on_leave(
+        state: Optional[AsyncState[Any]], next_state: AsyncState[Any]
+    ) -> None:
+        if state is not None:
+            calls.append(
+                f"global_on_leave {state.state_name} {next_state.state_name}"
+            )
+
+    child.global_on_leave = global_on_leave
+    await manager.change_state("Gameplay")
+    assert child.current_state is not None
+    task = child.current_state.create_task(asyncio.Event().wait())
+    await child.push_state("Combat")
+    calls.clear()
+    await manager.change_state("Menu")
+
+    assert calls == [
+        "global_on_leave Combat Exploration",
+        "Combat.on_leave",
+        "global_on_leave Exploration Menu",
+        "Exploration.on_leave",
+        "Gameplay.on_leave",
+        "global_on_enter Menu",
+        "Menu.on_enter",
+    ], f"Expected every layer of the child's stack to leave: {calls}"
+    assert child.state_stack == (), "Expected the child's stack to be empty"
+    assert task.cancelled(), (
+        "Expected the covered state's task to be cancelled"
+    )
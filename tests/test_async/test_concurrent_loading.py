@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.errors import StateLoadError
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Type
+
+
+def make_states(
+    count: int, log: List[str], delay: float = 0.01
+) -> List[Type[AsyncState[Any]]]:
+    states: List[Type[AsyncState[Any]]] = []
+
+    for index in range(count):
+
+        class SlowState(AsyncState["Any"], state_name=f"Slow {index}"):
+            async def on_load(self, reload: bool) -> None:
+                log.append(f"start {self.state_name}")
+                await asyncio.sleep(delay)
+                log.append(f"end {self.state_name}")
+
+        states.append(SlowState)
+
+    return states
+
+
+@pytest.mark.asyncio
+async def test_concurrent_load_order() -> None:
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    log: List[str] = []
+    states = make_states(4, log)
+
+    await manager.load_states(*states, concurrent=True)
+
+    assert list(manager.state_map) == [state.state_name for state in states], (
+        "Expected states to be registered in the order they were passed."
+    )
+    assert all(entry.startswith("start") for entry in log[:4]), (
+        f"Expected all load listeners to start before any finished: {log}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_load_limit() -> None:
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    log: List[str] = []
+    states = make_states(4, log)
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await manager.load_states(*states, concurrent=True, max_concurrency=0)
+
+    await manager.load_states(*states, concurrent=True, max_concurrency=1)
+
+    assert log == [
+        f"{step} {state.state_name}"
+        for state in states
+        for step in ("start", "end")
+    ], f"Expected load listeners to run one at a time: {log}"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_load_errors() -> None:
+    class Broken(AsyncState["Any"]):
+        async def on_load(self, reload: bool) -> None:
+            raise RuntimeError
+
+    class AlsoBroken(AsyncState["Any"]):
+        async def on_load(self, reload: bool) -> None:
+            raise KeyError
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    with pytest.raises(RuntimeError):
+        await manager.load_states(Broken, concurrent=True)
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    with pytest.raises(StateLoadError) as info:
+        await manager.load_states(
+            Broken, AlsoBroken, concurrent=True, fail_fast=False
+        )
+
+    errors: Dict[str, BaseException] = vars(info.value)["errors"]
+    assert set(errors) == {"Broken", "AlsoBroken"}, (
+        f"Expected errors of both states to be collected, instead got {errors}"
+    )
+
+    with pytest.raises(StateLoadError):
+        await manager.load_states(Broken, concurrent=True)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional
+
+
+@pytest.mark.asyncio
+async def test_dispatch_order(caplog: pytest.LogCaptureFixture) -> None:
+    calls: List[str] = []
+
+    class StateOne(AsyncState["Any"]):
+        async def on_leave(self, next_state: AsyncState[Any]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+    class StateTwo(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+    async def global_on_enter(
+        state: AsyncState[Any], _previous_state: Optional[AsyncState[Any]]
+    ) -> None:
+        calls.append(f"global_on_enter {state.state_name}")
+
+    async def global_on_leave(
+        _state: Optional[AsyncState[Any]], next_state: AsyncState[Any]
+    ) -> None:
+        calls.append(f"global_on_leave {next_state.state_name}")
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    await manager.load_states(StateOne, StateTwo)
+    await manager.change_state("StateOne")
+    await manager.change_state("StateTwo")
+
+    assert calls == ["StateOne.on_leave", "StateTwo.on_enter"], (
+        f"Expected only the overridden listeners to be called: {calls}"
+    )
+
+    calls.clear()
+    manager.global_on_enter = global_on_enter
+    manager.global_on_leave = global_on_leave
+
+    with caplog.at_level(logging.DEBUG):
+        await manager.change_state("StateOne")
+        await manager.change_state("StateTwo")
+
+    assert calls == [
+        "global_on_leave StateOne",
+        "global_on_enter StateOne",
+        "global_on_leave StateTwo",
+        "StateOne.on_leave",
+        "global_on_enter StateTwo",
+        "StateTwo.on_enter",
+    ], f"Expected global listeners to be called once assigned: {calls}"
+    assert "Calling StateOne.on_leave" in caplog.messages, (
+        "Expected the listener calls to be logged."
+    )
+
+    calls.clear()
+    manager.global_on_enter = None
+    manager.global_on_leave = None
+    await manager.change_state("StateOne")
+
+    assert calls == [], f"Expected global listeners to be removed: {calls}"
+
+
+@pytest.mark.asyncio
+async def test_dispatch_instance_listener() -> None:
+    calls: List[Optional[AsyncState[Any]]] = []
+
+    class StateOne(AsyncState["Any"]): ...
+
+    async def record(previous_state: Optional[AsyncState[Any]]) -> None:
+        calls.append(previous_state)
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    await manager.load_states(StateOne)
+    manager.state_map["StateOne"].on_enter = record
+    await manager.change_state("StateOne")
+
+    assert calls == [None], (
+        "Expected listeners assigned to the instance to be called."
+    )
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager, utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Dict, List, Tuple
+
+
+@pytest.fixture
+def scenario(
+    tmp_path: Path,
+) -> Tuple[AsyncStateManager[AsyncState[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Menu(AsyncState["Any"]): ...
+
+    class Level(AsyncState["Any"]):
+        def __init__(self) -> None:
+            calls.append("__init__")
+            self.tiles: bytearray = bytearray(b"tiles")
+            self.score: int = 0
+
+        async def on_load(self, reload: bool) -> None:
+            calls.append("on_load")
+
+        async def on_hibernate(self) -> Dict[str, Any]:
+            calls.append("on_hibernate")
+            return {
+                "tiles": pickle.PickleBuffer(self.tiles),
+                "score": self.score,
+            }
+
+        async def on_resume(self, snapshot: Dict[str, Any]) -> None:
+            calls.append("on_resume")
+            self.readonly: bool = memoryview(snapshot["tiles"]).readonly
+            self.tiles = bytearray(snapshot["tiles"])
+            self.score = snapshot["score"]
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    manager.hibernation_dir = str(tmp_path)
+    manager.add_lazy_states(Menu, Level)
+
+    return manager, calls
+
+
+async def _load_states(manager: AsyncStateManager[AsyncState[Any]]) -> None:
+    # The fixture can't await, so the lazy states are loaded by the tests.
+    await manager.load_states(
+        *(
+            manager.lazy_state_map[state_name][0]
+            for state_name in ("Menu", "Level")
+        )
+    )
+    manager.remove_lazy_state("Menu")
+    manager.remove_lazy_state("Level")
+
+
+@pytest.mark.asyncio
+async def test_hibernate_resume(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+    tmp_path: Path,
+) -> None:
+    manager, calls = scenario
+    await _load_states(manager)
+    level: Any = manager.state_map["Level"]
+    level.score = 10
+    await manager.unload_state("Level")
+
+    assert "Level" in manager.lazy_state_map, (
+        "Expected the hibernated state to be kept as a lazy state"
+    )
+    assert len(list(tmp_path.iterdir())) == 1, (
+        "Expected the snapshot to be written to the hibernation directory"
+    )
+
+    await manager.change_state("Level")
+    level = manager.state_map["Level"]
+
+    assert calls == ["__init__", "on_load", "on_hibernate", "on_resume"], (
+        "Expected the state to be resumed without being loaded again"
+    )
+    assert (level.tiles, level.score) == (bytearray(b"tiles"), 10), (
+        "Expected the state to be restored from its snapshot"
+    )
+    assert level.readonly, (
+        "Expected the buffers to be read back as read-only views"
+    )
+    assert level.manager is manager, "Expected the state to be bound"
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected the snapshot to be removed"
+    )
+
+
+@pytest.mark.asyncio
+async def test_hibernation_codec(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    class Codec:
+        def dumps(self, snapshot: Any) -> bytes:
+            return json.dumps(snapshot).encode()
+
+        def loads(self, data: bytes) -> Any:
+            return json.loads(data)
+
+    class Counter(AsyncState["Any"]):
+        count: int = 0
+
+        async def on_hibernate(self) -> Dict[str, Any]:
+            return {"count": 3}
+
+        async def on_resume(self, snapshot: Dict[str, Any]) -> None:
+            self.count = snapshot["count"]
+
+    manager, _ = scenario
+    await _load_states(manager)
+    manager.hibernation_codec = Codec()
+    await manager.load_states(Counter)
+    await manager.unload_state("Counter")
+    await manager.change_state("Counter")
+
+    counter: Any = manager.state_map["Counter"]
+    assert counter.count == 3, (
+        "Expected the snapshot to be restored through the codec"
+    )
+
+
+@pytest.mark.asyncio
+async def test_hibernation_skipped(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+    tmp_path: Path,
+) -> None:
+    manager, calls = scenario
+    await _load_states(manager)
+    await manager.reload_state("Level")
+    await manager.unload_state("Menu")
+
+    assert "on_hibernate" not in calls, (
+        "Expected reloading a state not to hibernate it"
+    )
+    assert "Menu" not in manager.lazy_state_map, (
+        "Expected a state without a snapshot to be unloaded as usual"
+    )
+
+    await manager.unload_state("Level")
+    manager.remove_lazy_state("Level")
+
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected removing a hibernated state to remove its snapshot"
+    )
+
+
+@pytest.mark.asyncio
+async def test_begin_loading_hibernated(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+    tmp_path: Path,
+) -> None:
+    manager, calls = scenario
+    await _load_states(manager)
+    level: Any = manager.state_map["Level"]
+    level.score = 10
+    await manager.unload_state("Level")
+    await manager.begin_loading("Level")
+    await manager.finish_loading()
+    level = manager.current_state
+
+    assert calls == ["__init__", "on_load", "on_hibernate", "on_resume"], (
+        "Expected the state to be resumed without being loaded again"
+    )
+    assert level.score == 10, "Expected the state to be restored"
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected the snapshot to be removed"
+    )
+
+
+@pytest.mark.asyncio
+async def test_prefetch_hibernated(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    await _load_states(manager)
+    level: Any = manager.state_map["Level"]
+    level.score = 10
+    await manager.unload_state("Level")
+    manager.prefetch("Level")
+    await asyncio.sleep(0)
+
+    assert calls == ["__init__", "on_load", "on_hibernate", "on_resume"], (
+        "Expected the prefetched state to be resumed without being loaded again"
+    )
+    assert "Level" not in manager.state_map, (
+        "Expected the prefetched state to stay lazy until it is switched to"
+    )
+
+    await manager.change_state("Level")
+    level = manager.current_state
+
+    assert level.score == 10, "Expected the state to be restored"
+
+
+@pytest.mark.asyncio
+async def test_hibernation_copied(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(utils, "_SNAPSHOT_MAPPED_BUFFERS", False)
+    manager, _ = scenario
+    await _load_states(manager)
+    await manager.unload_state("Level")
+    await manager.change_state("Level")
+    level: Any = manager.current_state
+
+    assert level.tiles == bytearray(b"tiles"), (
+        "Expected the state to be restored"
+    )
+    assert not level.readonly, "Expected the buffers to be copied"
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected the snapshot to be removed"
+    )
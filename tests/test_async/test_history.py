@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+
+if TYPE_CHECKING:
+    from typing import Any  # noqa: F401
+
+
+@pytest.mark.asyncio
+async def test_history() -> None:
+    class Menu(AsyncState["Any"]): ...
+
+    class Game(AsyncState["Any"]): ...
+
+    class Pause(AsyncState["Any"]): ...
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    await manager.load_states(Menu, Game, Pause)
+
+    assert manager.history is None, "Expected the history to be disabled"
+    history = manager.enable_history(3)
+
+    await manager.change_state("Menu")
+    await manager.change_state("Game")
+    await manager.push_state("Pause")
+    await manager.pop_state()
+    await manager.change_state("Menu")
+
+    assert len(history) == 3, "Expected the history to be bounded"
+    assert history.total == 5, "Expected every transition to be counted"
+    assert [
+        (transition.from_state, transition.to_state)
+        for transition in history.last(5)
+    ] == [("Game", "Pause"), ("Pause", "Game"), ("Game", "Menu")], (
+        "Expected the most recent transitions, oldest first"
+    )
+
+    manager.disable_history()
+    await manager.change_state("Game")
+
+    assert history.total == 5, "Expected the history to be disabled"
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from typing import Any, Tuple, Type
+
+STEPS: int = 4
+
+
+@pytest.fixture
+def scenario() -> Tuple[
+    AsyncStateManager[AsyncState[Any]], Type[AsyncState[Any]]
+]:
+    class Level(AsyncState["Any"]):
+        async def on_load(self, reload: bool) -> AsyncIterator[float]:  # pyright: ignore[reportIncompatibleMethodOverride]
+            for step in range(STEPS):
+                yield (step + 1) / STEPS
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    manager.add_lazy_states(Level)
+
+    return manager, Level
+
+
+@pytest.mark.asyncio
+async def test_incremental_loading(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], Type[AsyncState[Any]]],
+) -> None:
+    manager, level = scenario
+
+    assert await manager.update_loading(0) is None, "Expected nothing to load."
+
+    await manager.begin_loading(level.state_name)
+
+    with pytest.raises(StateError):
+        await manager.begin_loading(level.state_name)
+
+    progress = [await manager.update_loading(0) for _ in range(STEPS + 2)]
+
+    assert progress == [0.25, 0.5, 0.75, 1.0, 1.0, None], (
+        f"Expected loading to advance once per update, instead got {progress}"
+    )
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == level.state_name, (
+        "Expected the manager to switch to the loaded state."
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_loading_interrupted(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], Type[AsyncState[Any]]],
+) -> None:
+    manager, level = scenario
+
+    await manager.begin_loading(level.state_name, switch=False)
+    await manager.update_loading(0)
+    assert manager.loading_progress == 1 / STEPS
+
+    await manager.change_state(level.state_name)
+
+    assert manager.loading_progress is None, "Expected loading to finish."
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == level.state_name, (
+        "Expected change_state to finish loading and switch to the state."
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_loading_failed() -> None:
+    class Level(AsyncState["Any"]):
+        async def on_load(self, reload: bool) -> AsyncIterator[float]:  # pyright: ignore[reportIncompatibleMethodOverride]
+            yield 0.5
+            msg = "Missing asset."
+            raise OSError(msg)
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    manager.add_lazy_states(Level)
+    await manager.begin_loading("Level")
+
+    with pytest.raises(OSError, match="Missing asset"):
+        await manager.finish_loading()
+
+    assert manager.loading_progress is None, (
+        "Expected loading to be cancelled."
+    )
+    assert await manager.update_loading(0) is None, "Expected nothing to load."
+    assert "Level" in manager.lazy_state_map, (
+        "Expected the state to be left in the lazy states."
+    )
+    assert "Level" not in manager.state_map, (
+        "Expected the half loaded state not to be registered."
+    )
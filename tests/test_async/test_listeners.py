@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional
+
+
+@pytest.mark.asyncio
+async def test_listener_order() -> None:
+    calls: List[str] = []
+
+    class StateOne(AsyncState["Any"]): ...
+
+    def make_listener(name: str) -> Any:
+        async def listener(
+            state: AsyncState[Any], _previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            calls.append(f"{name} {state.state_name}")
+
+        return listener
+
+    first = make_listener("first")
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    await manager.load_states(StateOne)
+    manager.add_listener("global_on_enter", make_listener("last"), priority=-1)
+    manager.add_listener("global_on_enter", first, priority=1)
+    manager.global_on_enter = make_listener("assigned")
+    await manager.change_state("StateOne")
+
+    assert calls == ["first StateOne", "assigned StateOne", "last StateOne"], (
+        f"Expected the listeners to be called by their priority: {calls}"
+    )
+
+    calls.clear()
+    manager.remove_listener("global_on_enter", first)
+    await manager.change_state("StateOne")
+
+    assert calls == ["assigned StateOne", "last StateOne"], (
+        f"Expected the removed listener not to be called: {calls}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_independent_listeners() -> None:
+    ready = asyncio.Event()
+    calls: List[str] = []
+
+    class StateOne(AsyncState["Any"]): ...
+
+    async def waiting(state: AsyncState[Any], _reload: bool) -> None:
+        # Only finishes if the next listener runs concurrently.
+        await asyncio.wait_for(ready.wait(), 1)
+        calls.append(f"waiting {state.state_name}")
+
+    async def setting(state: AsyncState[Any], _reload: bool) -> None:
+        ready.set()
+        calls.append(f"setting {state.state_name}")
+
+    async def after(state: AsyncState[Any], _reload: bool) -> None:
+        calls.append(f"after {state.state_name}")
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    manager.add_listener("global_on_load", waiting, independent=True)
+    manager.add_listener("global_on_load", setting, independent=True)
+    manager.add_listener("global_on_load", after)
+    await manager.load_states(StateOne)
+
+    assert calls == [
+        "setting StateOne",
+        "waiting StateOne",
+        "after StateOne",
+    ], f"Expected the independent listeners to run concurrently: {calls}"
+
+
+@pytest.mark.asyncio
+async def test_global_on_unload() -> None:
+    calls: List[str] = []
+
+    class StateOne(AsyncState["Any"]):
+        async def on_unload(self, reload: bool) -> None:
+            calls.append(f"on_unload {reload}")
+
+    async def global_on_unload(state: AsyncState[Any], reload: bool) -> None:
+        calls.append(f"assigned {state.state_name} {reload}")
+
+    async def added(state: AsyncState[Any], _reload: bool) -> None:
+        calls.append(f"added {state.state_name}")
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    manager.global_on_unload = global_on_unload
+    manager.add_listener("global_on_unload", added)
+    manager.enable_stats()
+    await manager.load_states(StateOne)
+    await manager.unload_state("StateOne")
+
+    assert calls == [
+        "assigned StateOne False",
+        "added StateOne",
+        "on_unload False",
+    ], f"Expected the unload listeners to be called before on_unload: {calls}"
+    assert manager.stats()["global_on_unload"].count == 1, (
+        "Expected the unload listeners to be timed"
+    )
@@ -113,3 +113,43 @@ async def test_change_states(
 
     with pytest.raises(StateError):
         await manager.change_state("Invalid State Name")
+
+
+@pytest.mark.asyncio
+async def test_state_map_views(
+    scenario: Tuple[
+        AsyncStateManager[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        Type[AsyncState[Any]],
+    ],
+) -> None:
+    manager, state_1, state_2 = scenario
+
+    state_map = manager.state_map
+    lazy_state_map = manager.lazy_state_map
+
+    assert manager.state_map is state_map, (
+        "Expected the same view to be returned on every access."
+    )
+
+    await manager.load_states(state_1)
+    manager.add_lazy_states(state_2)
+
+    assert state_1.state_name in state_map, "Expected the view to be live."
+    assert state_2.state_name in lazy_state_map, (
+        "Expected the lazy view to be live."
+    )
+
+    with pytest.raises(TypeError):
+        state_map["New"] = state_map[state_1.state_name]  # pyright: ignore[reportIndexIssue]
+
+    state_copy = manager.copy_state_map()
+    lazy_state_copy = manager.copy_lazy_state_map()
+    await manager.change_state(state_2.state_name)
+
+    assert state_2.state_name not in state_copy, (
+        "Expected the copy to not change with the manager."
+    )
+    assert state_2.state_name in lazy_state_copy, (
+        "Expected the lazy copy to not change with the manager."
+    )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManagerPool
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, List  # noqa: F401
+
+
+# The keyword arguments of the pool & its sessions are bound to the instances.
+class Menu(AsyncState["Any"]):
+    """Records the players it's unloaded for."""
+
+    game: str
+    player: str
+    unloaded: List[str]
+
+    async def on_unload(self, reload: bool) -> None:
+        self.unloaded.append(self.player)
+
+
+@pytest.mark.asyncio
+async def test_sessions() -> None:
+    unloaded: List[str] = []
+    pool = AsyncStateManagerPool[AsyncState["Any"]](
+        states=[Menu], game="Pong", unloaded=unloaded
+    )
+
+    first = await pool.acquire(player="first")
+    second = await pool.acquire(player="second")
+    await first.change_state(Menu.state_name)
+    await second.change_state(Menu.state_name)
+    first_state = first.current_state
+    second_state = second.current_state
+
+    assert len(pool) == 2, f"Expected 2 sessions, got {len(pool)}"
+    assert isinstance(first_state, Menu), "Expected Menu to be entered"
+    assert isinstance(second_state, Menu), "Expected Menu to be entered"
+    assert first_state is not second_state, (
+        "Expected sessions to have their own state instances"
+    )
+    assert first_state.manager is first, (
+        "Expected the session manager to be bound to its state instance"
+    )
+    assert first_state.player == "first", (
+        "Expected the session's keyword arguments to be bound"
+    )
+    assert second_state.game == "Pong", (
+        "Expected the pool's keyword arguments to be bound"
+    )
+    assert not hasattr(Menu, "player"), (
+        "Expected the state class to be left untouched"
+    )
+
+    await pool.release(first)
+
+    assert len(pool) == 1, f"Expected 1 session, got {len(pool)}"
+    assert unloaded == ["first"], (
+        f"Expected only the released session to be unloaded: {unloaded}"
+    )
+    assert not first.state_map, "Expected the released session to be empty"
+
+    with pytest.raises(StateError, match="doesn't belong"):
+        await pool.release(first)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Tuple  # noqa: F401
+
+
+@pytest.mark.asyncio
+async def test_prefetch() -> None:
+    loaded = asyncio.Event()
+
+    class Menu(AsyncState["Any"]): ...
+
+    class Game(AsyncState["Any"]):
+        async def on_load(self, reload: bool) -> None:
+            loaded.set()
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    await manager.load_states(Menu)
+    manager.add_lazy_states(Game)
+
+    with pytest.raises(StateError):
+        manager.prefetch("Unknown")
+
+    manager.prefetch("Game", "Menu")
+    await asyncio.wait_for(loaded.wait(), 1)
+
+    assert "Game" not in manager.state_map, (
+        "Expected prefetched state to stay lazy until it is switched to."
+    )
+
+    await manager.change_state("Game")
+
+    assert "Game" in manager.state_map, "Expected Game to be loaded."
+    assert "Game" not in manager.lazy_state_map, (
+        "Expected Game to be removed from the lazy states."
+    )
+
+
+@pytest.mark.asyncio
+async def test_auto_prefetch() -> None:
+    class Menu(AsyncState["Any"]):
+        neighbours: Tuple[str, ...] = ("Game",)
+
+    class Game(AsyncState["Any"]): ...
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    manager.auto_prefetch = True
+    await manager.load_states(Menu)
+    manager.add_lazy_states(Game)
+
+    await manager.change_state("Menu")
+    assert "Game" in manager._prefetching, (  # pyright: ignore[reportPrivateUsage]
+        "Expected the neighbour of Menu to be prefetched."
+    )
+
+    manager.remove_lazy_state("Game")
+    assert "Game" not in manager._prefetching, (  # pyright: ignore[reportPrivateUsage]
+        "Expected removing a lazy state to drop its prefetch."
+    )
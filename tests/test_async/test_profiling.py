@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.profiling import StartupProfiler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+HOOK = """
+from src.game_state import AsyncState
+
+
+class Shop(AsyncState["Any"]): ...
+
+
+async def hook(manager):
+    await manager.load_states(Shop)
+"""
+
+
+@pytest.mark.asyncio
+async def test_profiler(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "profiled_async_shop.py").write_text(HOOK)
+    monkeypatch.syspath_prepend(  # pyright: ignore[reportUnknownMemberType]
+        str(tmp_path)
+    )
+
+    class Menu(AsyncState["Any"]):
+        async def on_load(self, reload: bool) -> None: ...
+
+    async def global_on_load(state: AsyncState[Any], reload: bool) -> None: ...
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    profiler = manager.profiler = StartupProfiler()
+    manager.global_on_load = global_on_load
+    await manager.load_states(Menu)
+    await manager.connect_state_hook("profiled_async_shop", manager=manager)
+
+    spans = {(span[0], span[1]) for span in profiler._spans}  # pyright: ignore[reportPrivateUsage]
+    assert spans == {
+        ("init", "Menu"),
+        ("on_load", "Menu"),
+        ("global_on_load", "Menu"),
+        ("import", "profiled_async_shop"),
+        ("hook", "profiled_async_shop"),
+        ("init", "Shop"),
+        ("on_load", "Shop"),
+        ("global_on_load", "Shop"),
+    }, "Expected the imports, hooks, initialization & loading to be recorded"
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncRegionManager, AsyncState
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Type
+
+
+@pytest.fixture
+def scenario() -> Type[AsyncState[Any]]:
+    class Ambience(AsyncState["Any"]):
+        updates: Dict[str, float]
+        region: str
+
+        async def process_update(self, dt: float) -> None:
+            self.updates[self.region] = dt
+
+    return Ambience
+
+
+@pytest.mark.asyncio
+async def test_regions(scenario: Type[AsyncState[Any]]) -> None:
+    updates: Dict[str, float] = {}
+
+    regions = AsyncRegionManager[AsyncState["Any"]](updates=updates)
+    await regions.add_region("hud", region="hud").load_states(scenario)
+    await regions.add_region("world", region="world").load_states(scenario)
+    regions.add_region("idle", region="idle")
+
+    with pytest.raises(StateError):
+        regions.add_region("hud")
+
+    await regions["hud"].change_state(scenario.state_name)
+    await regions["world"].change_state(scenario.state_name)
+    await regions.update(0.1)
+
+    assert updates == {"hud": 0.1, "world": 0.1}, (
+        f"Expected every active region to be updated: {updates}"
+    )
+    assert (
+        regions["hud"].current_state is not regions["world"].current_state
+    ), "Expected each region to have its own current state"
+
+    regions.remove_region("idle")
+
+    assert len(regions) == 2, f"Expected 2 regions, got {len(regions)}"
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.errors import StateLoadError
+from src.game_state.utils import StateArgs
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Dict
+
+
+# The states are pickled by reference, so they have to be importable.
+class SaveState(AsyncState["Any"]):
+    """The base of the saved states."""
+
+
+class Title(SaveState):
+    """Saved with its state args."""
+
+    def __init__(self, difficulty: str = "normal") -> None:
+        self.difficulty: str = difficulty
+
+
+class World(SaveState):
+    """Saved with its snapshot."""
+
+    def __init__(self) -> None:
+        self.position: int = 0
+        self.hibernations: int = 0
+
+    async def on_hibernate(self) -> Dict[str, Any]:
+        self.hibernations += 1
+        return {"position": self.position}
+
+    async def on_resume(self, snapshot: Dict[str, Any]) -> None:
+        self.position = snapshot["position"]
+        self.hibernations = 0
+
+
+class Pause(SaveState):
+    """Pushed over the world."""
+
+
+class Credits(SaveState):
+    """Kept as a lazy state."""
+
+
+class Map(SaveState):
+    """Hibernated with an out-of-band buffer."""
+
+    def __init__(self) -> None:
+        self.tiles: bytearray = bytearray(b"tiles")
+
+    async def on_hibernate(self) -> Dict[str, Any]:
+        return {"tiles": pickle.PickleBuffer(self.tiles)}
+
+    async def on_resume(self, snapshot: Dict[str, Any]) -> None:
+        self.tiles = bytearray(snapshot["tiles"])
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restore() -> None:
+    manager = AsyncStateManager[SaveState](bound_state_type=SaveState)
+    await manager.load_states(
+        Title,
+        World,
+        Pause,
+        state_args=[StateArgs(state_name="Title", difficulty="hard")],
+    )
+    manager.add_lazy_states(Credits)
+    await manager.change_state("Title")
+    await manager.change_state("World")
+    world = manager.state_map["World"]
+    assert isinstance(world, World), "Expected World to be loaded"
+    world.position = 5
+    await manager.push_state("Pause")
+
+    restored = await AsyncStateManager[SaveState].restore(
+        await manager.snapshot(), bound_state_type=SaveState
+    )
+
+    assert [state.state_name for state in restored.state_stack] == [
+        "World",
+        "Pause",
+    ], "Expected the state stack to be restored"
+    assert restored.last_state is restored.state_map["World"], (
+        "Expected the last state to be restored"
+    )
+    world = restored.state_map["World"]
+    title = restored.state_map["Title"]
+    assert isinstance(world, World), "Expected World to be restored"
+    assert isinstance(title, Title), "Expected Title to be restored"
+    assert world.position == 5, (
+        "Expected the state to be restored from its snapshot"
+    )
+    assert title.difficulty == "hard", (
+        "Expected the state to be initialized with its state args"
+    )
+    assert "Credits" in restored.lazy_state_map, (
+        "Expected the lazy states to be restored"
+    )
+    assert restored.state_handles == manager.state_handles, (
+        "Expected the handles to be restored"
+    )
+    assert world.manager is restored, (
+        "Expected the states to be bound to the restored manager"
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_snapshot() -> None:
+    manager = AsyncStateManager[SaveState](bound_state_type=SaveState)
+    await manager.load_states(Title, World)
+    await manager.change_state("World")
+    world = manager.state_map["World"]
+    assert isinstance(world, World), "Expected World to be loaded"
+
+    await manager.snapshot()
+    await manager.snapshot()
+
+    assert world.hibernations == 2, (
+        "Expected the current state to be encoded by every snapshot"
+    )
+
+    await manager.change_state("Title")
+    await manager.snapshot()
+    await manager.snapshot()
+
+    assert world.hibernations == 3, (
+        "Expected an unchanged state to be encoded once"
+    )
+
+    manager.mark_dirty("World")
+    await manager.snapshot()
+
+    assert world.hibernations == 4, (
+        "Expected a state marked as dirty to be encoded again"
+    )
+
+
+@pytest.mark.asyncio
+async def test_snapshot_hibernated(tmp_path: Path) -> None:
+    manager = AsyncStateManager[SaveState](bound_state_type=SaveState)
+    manager.hibernation_dir = str(tmp_path)
+    await manager.load_states(Title, Map)
+    await manager.change_state("Title")
+    await manager.unload_state("Map")
+
+    restored = await AsyncStateManager[SaveState].restore(
+        await manager.snapshot(), bound_state_type=SaveState
+    )
+
+    map_state = restored.state_map["Map"]
+    assert isinstance(map_state, Map), "Expected Map to be restored"
+    assert map_state.tiles == bytearray(b"tiles"), (
+        "Expected the hibernated state to be restored from its snapshot"
+    )
+
+
+@pytest.mark.asyncio
+async def test_restore_version() -> None:
+    with pytest.raises(StateLoadError, match="version"):
+        await AsyncStateManager[SaveState].restore(
+            pickle.dumps((0, (), (), (), (), None, None)),
+            bound_state_type=SaveState,
+        )
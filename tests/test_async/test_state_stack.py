@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[AsyncStateManager[AsyncState[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Base(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+        async def on_leave(self, next_state: AsyncState[Any]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+        async def process_update(self, dt: float) -> None:
+            calls.append(f"{self.state_name}.update")
+
+        async def process_render(self, alpha: float) -> None:
+            calls.append(f"{self.state_name}.render")
+
+    class Game(Base): ...
+
+    class Pause(Base):
+        render_below: bool = True
+
+    class Dialog(Base):
+        update_below: bool = True
+        render_below: bool = True
+
+    manager = AsyncStateManager[AsyncState["Any"]](bound_state_type=Base)
+    manager.add_lazy_states(Game, Pause, Dialog)
+
+    return manager, calls
+
+
+@pytest.mark.asyncio
+async def test_push_pop(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+
+    with pytest.raises(StateError):
+        await manager.push_state("Pause")
+
+    await manager.change_state("Game")
+    game = manager.current_state
+    await manager.push_state("Pause")
+    await manager.push_state("Dialog")
+
+    assert [state.state_name for state in manager.state_stack] == [
+        "Game",
+        "Pause",
+        "Dialog",
+    ], f"Unexpected state stack: {manager.state_stack}"
+
+    with pytest.raises(StateError):
+        await manager.push_state("Game")
+    with pytest.raises(StateError):
+        await manager.unload_state("Game")
+
+    frames = iter([[], ["quit"]])
+
+    def events() -> List[str]:
+        frame = next(frames)
+        if frame:
+            manager.is_running = False
+        return frame
+
+    times = iter([0.0, 0.0, 1.0])
+    calls.clear()
+    await manager.run(events=events, timestep=1, clock=times.__next__)
+
+    assert calls == [
+        # The first frame has no time to update with.
+        "Game.render",
+        "Pause.render",
+        "Dialog.render",
+        "Pause.update",
+        "Dialog.update",
+        "Game.render",
+        "Pause.render",
+        "Dialog.render",
+    ], f"Unexpected layers updated & rendered: {calls}"
+
+    calls.clear()
+    popped = await manager.pop_state()
+    await manager.pop_state()
+
+    assert popped is manager.state_map["Dialog"], (
+        f"Unexpected popped state: {popped}"
+    )
+    assert manager.current_state is game, "Expected to return to the game"
+    assert calls == ["Dialog.on_leave", "Pause.on_leave"], (
+        f"Expected only the leave listeners of the popped states: {calls}"
+    )
+
+    with pytest.raises(StateError):
+        await manager.pop_state()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+
+if TYPE_CHECKING:
+    from typing import Any, Tuple, Type
+
+
+@pytest.fixture
+def scenario() -> Tuple[
+    AsyncStateManager[AsyncState[Any]],
+    Type[AsyncState[Any]],
+    Type[AsyncState[Any]],
+]:
+    class StateOne(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: AsyncState[Any] | None
+        ) -> None: ...
+
+    class StateTwo(AsyncState["Any"]): ...
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+
+    return manager, StateOne, StateTwo
+
+
+@pytest.mark.asyncio
+async def test_stats(
+    scenario: Tuple[
+        AsyncStateManager[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        Type[AsyncState[Any]],
+    ],
+) -> None:
+    manager, state_one, state_two = scenario
+
+    await manager.load_states(state_one, state_two)
+    await manager.change_state(state_one.state_name)
+
+    assert manager.stats() == {}, "Expected no timings while disabled"
+
+    manager.enable_stats()
+    await manager.change_state(state_two.state_name)
+    await manager.change_state(state_one.state_name)
+    await manager.reload_state(state_two.state_name)
+
+    stats = manager.stats()
+
+    assert set(stats) == {
+        "StateOne.change_state",
+        "StateOne.on_enter",
+        "StateTwo.change_state",
+        "StateTwo.unload_state",
+        "StateTwo.on_unload",
+        "StateTwo.on_load",
+        "StateTwo.reload_state",
+        "load_states",
+    }, f"Expected only the timed operations & listeners: {set(stats)}"
+    assert stats["StateOne.on_enter"].count == 1, (
+        "Expected the listener to be timed once"
+    )
+
+    manager.disable_stats()
+    await manager.change_state(state_two.state_name)
+
+    assert manager.stats() == {}, "Expected the timings to be discarded"
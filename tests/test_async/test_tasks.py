@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple, Type
+
+
+@pytest.fixture
+def scenario() -> Tuple[
+    AsyncStateManager[AsyncState[Any]],
+    Type[AsyncState[Any]],
+    Type[AsyncState[Any]],
+    List[str],
+]:
+    cancelled: List[str] = []
+
+    async def poll(name: str) -> None:
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+
+    class Lobby(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            self.create_task(poll(self.state_name))
+
+    class Game(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            self.create_task(poll(self.state_name))
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+
+    return manager, Lobby, Game, cancelled
+
+
+@pytest.mark.asyncio
+async def test_tasks(
+    scenario: Tuple[
+        AsyncStateManager[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        List[str],
+    ],
+) -> None:
+    manager, lobby, game, cancelled = scenario
+
+    await manager.load_states(lobby, game)
+    await manager.change_state(lobby.state_name)
+    await asyncio.sleep(0)
+
+    assert manager.current_state is not None
+    assert len(manager.current_state._tasks or ()) == 1, (  # pyright: ignore[reportPrivateUsage]
+        "Expected the task to be owned by the state"
+    )
+
+    await manager.change_state(game.state_name)
+
+    assert cancelled == ["Lobby"], (
+        f"Expected the task of the left state to be cancelled: {cancelled}"
+    )
+    assert not manager.state_map[lobby.state_name]._tasks, (  # pyright: ignore[reportPrivateUsage]
+        "Expected the cancelled task to be removed from the state"
+    )
+
+    await asyncio.sleep(0)
+    await manager.unload_state(game.state_name, force=True)
+
+    assert cancelled == ["Lobby", "Game"], (
+        f"Expected the task of the unloaded state to be cancelled: {cancelled}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_cancels_tasks(
+    scenario: Tuple[
+        AsyncStateManager[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        List[str],
+    ],
+) -> None:
+    manager, lobby, _, cancelled = scenario
+    frames = iter([[], ["quit"]])
+
+    def events() -> List[str]:
+        frame = next(frames)
+        if frame:
+            manager.is_running = False
+        return frame
+
+    await manager.load_states(lobby)
+    await manager.change_state(lobby.state_name)
+    await manager.run(events=events)
+
+    assert cancelled == ["Lobby"], (
+        f"Expected the tasks to be cancelled once the loop stops: {cancelled}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_error_cancels_tasks(
+    scenario: Tuple[
+        AsyncStateManager[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        Type[AsyncState[Any]],
+        List[str],
+    ],
+) -> None:
+    manager, lobby, game, cancelled = scenario
+
+    def events() -> List[str]:
+        msg = "Lost the connection."
+        raise ConnectionError(msg)
+
+    await manager.load_states(lobby, game)
+    await manager.change_state(lobby.state_name)
+    await manager.push_state(game.state_name)
+    await asyncio.sleep(0)
+
+    with pytest.raises(ConnectionError, match="Lost the connection"):
+        await manager.run(events=events)
+
+    assert cancelled == ["Game", "Lobby"], (
+        f"Expected the tasks of the stack to be cancelled on errors: {cancelled}"
+    )
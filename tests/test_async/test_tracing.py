@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+from src.game_state.tracing import Tracer
+
+if TYPE_CHECKING:
+    from typing import Any, Optional
+
+
+@pytest.mark.asyncio
+async def test_tracer() -> None:
+    class StateOne(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None: ...
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    tracer = manager.tracer = Tracer()
+
+    async def switch() -> None:
+        await manager.load_states(StateOne)
+        await manager.change_state("StateOne")
+
+    await asyncio.create_task(switch(), name="switcher")
+    events = tracer.events()
+
+    tracks = {event["tid"]: event for event in events if event["ph"] == "M"}
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+
+    assert set(spans) == {
+        "StateOne.on_load",
+        "load_states",
+        "StateOne.on_enter",
+        "StateOne.change_state",
+    }, "Expected the operations & listeners to be traced"
+    assert len(tracks) == 1, "Expected a single track for the task"
+    assert all(span["tid"] in tracks for span in spans.values()), (
+        "Expected the spans to be on the track of their task"
+    )
+    assert next(iter(tracks.values()))["args"]["name"] == "switcher", (
+        "Expected the track to be named after the task"
+    )
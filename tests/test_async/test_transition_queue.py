@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import AsyncState, AsyncStateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[AsyncStateManager[AsyncState[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Base(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+        async def on_leave(self, next_state: AsyncState[Any]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+    class StateA(Base): ...
+
+    class StateB(Base): ...
+
+    class StateC(Base): ...
+
+    class Redirect(Base):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            await super().on_enter(previous_state)
+            await self.manager.change_state("StateC")
+            calls.append("Redirect.on_enter finished")
+
+    manager = AsyncStateManager[AsyncState["Any"]](bound_state_type=Base)
+    manager.add_lazy_states(StateA, StateB, StateC, Redirect)
+
+    return manager, calls
+
+
+@pytest.mark.asyncio
+async def test_deferred_transitions(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    await manager.change_state("StateA")
+    manager.deferred_transitions = True
+    calls.clear()
+
+    await manager.change_state("StateB")
+    await manager.change_state("StateC")
+
+    assert calls == [], f"Expected the switches to be queued: {calls}"
+
+    await manager.apply_transitions()
+
+    assert calls == ["StateA.on_leave", "StateC.on_enter"], (
+        f"Expected the queued switches to be coalesced: {calls}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_reentrant_transitions(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    await manager.change_state("StateA")
+    calls.clear()
+
+    await manager.change_state("Redirect")
+
+    assert calls == [
+        "StateA.on_leave",
+        "Redirect.on_enter",
+        "Redirect.on_enter finished",
+        "Redirect.on_leave",
+        "StateC.on_enter",
+    ], f"Expected the nested switch to run after the first one: {calls}"
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == "StateC"
+
+
+@pytest.mark.asyncio
+async def test_reentrant_stack_transitions() -> None:
+    calls: List[str] = []
+
+    class Game(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            await self.manager.push_state("Pause")
+            calls.append("Game.on_enter finished")
+
+    class Pause(AsyncState["Any"]):
+        async def on_enter(
+            self, previous_state: Optional[AsyncState[Any]]
+        ) -> None:
+            popped = await self.manager.pop_state()
+            calls.append(f"Pause.on_enter finished {popped}")
+
+        async def on_leave(self, next_state: AsyncState[Any]) -> None:
+            calls.append(f"Pause.on_leave {next_state.state_name}")
+
+    manager = AsyncStateManager[AsyncState["Any"]]()
+    await manager.load_states(Game, Pause)
+    await manager.change_state("Game")
+
+    assert calls == [
+        "Game.on_enter finished",
+        "Pause.on_enter finished None",
+        "Pause.on_leave Game",
+    ], f"Expected the nested push & pop to be queued: {calls}"
+    assert manager.state_stack == (manager.state_map["Game"],)
+
+
+@pytest.mark.asyncio
+async def test_failed_transition_clears_queue(
+    scenario: Tuple[AsyncStateManager[AsyncState[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+
+    async def global_on_enter(
+        state: AsyncState[Any], _previous_state: Optional[AsyncState[Any]]
+    ) -> None:
+        if state.state_name == "StateB":
+            await manager.change_state("StateC")
+            msg = "Broken listener."
+            raise RuntimeError(msg)
+
+    manager.global_on_enter = global_on_enter
+    await manager.change_state("StateA")
+
+    with pytest.raises(RuntimeError, match="Broken listener"):
+        await manager.change_state("StateB")
+
+    calls.clear()
+    await manager.apply_transitions()
+
+    assert calls == [], f"Expected the queued switch to be dropped: {calls}"
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[StateManager[State[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Base(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+        def on_leave(self, next_state: Optional[State[Any]]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+    class Menu(Base): ...
+
+    class Gameplay(Base): ...
+
+    class Exploration(Base): ...
+
+    class Combat(Base): ...
+
+    manager = StateManager[State["Any"]](bound_state_type=Base)
+    manager.load_states(Menu, Gameplay)
+    manager.global_on_enter = lambda state, _: calls.append(
+        f"global_on_enter {state.state_name}"
+    )
+
+    child = manager.create_child(
+        Gameplay.state_name, bound_state_type=Base, initial_state="Exploration"
+    )
+    child.load_states(Exploration, Combat)
+
+    return manager, calls
+
+
+def test_child_manager(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    child = manager.get_child("Gameplay")
+
+    assert child is not None
+    assert child.parent is manager, "Expected the child to know its parent"
+
+    with pytest.raises(StateError):
+        manager.create_child("Gameplay")
+
+    manager.change_state("Menu")
+    calls.clear()
+    manager.change_state("Gameplay")
+
+    assert calls == [
+        "Menu.on_leave",
+        "global_on_enter Gameplay",
+        "Gameplay.on_enter",
+        "Exploration.on_enter",
+    ], f"Expected the child to enter its initial state: {calls}"
+    assert child.current_state is not None
+    assert child.current_state.manager is child, (
+        "Expected the child's states to be bound to the child"
+    )
+
+    calls.clear()
+    child.change_state("Combat")
+
+    assert calls == ["Exploration.on_leave", "Combat.on_enter"], (
+        f"Expected the child's transitions to skip the parent's hooks: {calls}"
+    )
+
+    calls.clear()
+    manager.change_state("Menu")
+
+    assert calls == [
+        "Combat.on_leave",
+        "Gameplay.on_leave",
+        "global_on_enter Menu",
+        "Menu.on_enter",
+    ], f"Expected the child to leave before its owner: {calls}"
+    assert child.current_state is None, "Expected the child to be idle"
+
+    assert manager.remove_child("Gameplay") is child
+    assert child.parent is None
+
+
+def test_child_manager_stack(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    child = manager.get_child("Gameplay")
+    assert child is not None
+
+    def global_on_leave(
+        state: Optional[State[Any]], next_state: State[Any]
+    ) -> None:
+        if state is not None:
+            calls.append(
+                f"global_on_leave {state.state_name} {next_state.state_name}"
+            )
+
+    child.global_on_leave = global_on_leave
+    manager.change_state("Gameplay")
+    child.push_state("Combat")
+    calls.clear()
+    manager.change_state("Menu")
+
+    assert calls == [
+        "global_on_leave Combat Exploration",
+        "Combat.on_leave",
+        "global_on_leave Exploration Menu",
+        "Exploration.on_leave",
+        "Gameplay.on_leave",
+        "global_on_enter Menu",
+        "Menu.on_enter",
+    ], f"Expected every layer of the child's stack to leave: {calls}"
+    assert child.state_stack == (), "Expected the child's stack to be empty"
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager, discovery
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, List
+
+
+MENU = """
+from src.game_state import State
+
+
+class Menu(State["Any"], state_name="MainMenu"): ...
+
+
+class Options(State["Any"]): ...
+
+
+def hook(manager):
+    manager.load_states(Menu, Options)
+"""
+
+GAME = """
+from collections import namedtuple
+
+from src.game_state import State
+
+from .helpers import Saveable, Screen
+
+
+class Game(State["Any"]): ...
+
+
+class Credits(Saveable, Screen): ...
+
+
+class Slot(Saveable): ...
+
+
+class Point(namedtuple("Point", "x y")): ...
+
+
+def hook(manager):
+    manager.add_lazy_states(Game, Credits)
+"""
+
+HELPERS = """
+from src.game_state import State
+
+
+class Helper(object): ...
+
+
+class Saveable: ...
+
+
+class Screen(State["Any"]): ...
+"""
+
+LEVEL = """
+from src.game_state import State
+from tests.test_sync.test_discovery import Bound
+
+
+class Level(Bound): ...
+
+
+class Overlay(State["Any"]): ...
+
+
+def hook(manager):
+    manager.load_states(Level)
+"""
+
+
+class Bound(State["Any"]):
+    """The base of the discovered states."""
+
+
+def _make_package(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str
+) -> Path:
+    package = tmp_path / name
+    package.mkdir()
+    (package / "menu.py").write_text(MENU)
+    (package / "game.py").write_text(GAME)
+    (package / "helpers.py").write_text(HELPERS)
+    monkeypatch.syspath_prepend(  # pyright: ignore[reportUnknownMemberType]
+        str(tmp_path)
+    )
+    return package
+
+
+def test_discover_state_hooks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_package(tmp_path, monkeypatch, "discovered_sync")
+    manager = StateManager[State["Any"]]()
+
+    handles = manager.discover_state_hooks("discovered_sync", manager=manager)
+
+    assert len(handles) == 4, "Expected the states of the hooks to be found"
+    for name in ("Screen", "Saveable", "Slot", "Point", "Helper"):
+        with pytest.raises(StateError, match=name):
+            manager.get_handle(name)
+    assert "discovered_sync.menu" not in sys.modules, (
+        "Expected the state files not to be imported"
+    )
+
+    manager.change_state("MainMenu")
+
+    assert set(manager.state_map) == {"MainMenu", "Options"}, (
+        "Expected the hook to be called on the first switch"
+    )
+    assert "discovered_sync.game" not in sys.modules, (
+        "Expected the other state files not to be imported"
+    )
+
+    manager.change_state("Game")
+
+    assert manager.current_state is manager.state_map["Game"], (
+        "Expected states added lazily by the hook to be switched to"
+    )
+
+
+def test_discovery_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = _make_package(tmp_path, monkeypatch, "indexed_sync")
+    index_path = str(tmp_path / "index.json")
+    scanned: List[str] = []
+    scan_module = discovery._scan_module  # pyright: ignore[reportPrivateUsage]
+
+    def counted_scan(path: str, module: str) -> Any:
+        scanned.append(path)
+        return scan_module(path, module)
+
+    monkeypatch.setattr(discovery, "_scan_module", counted_scan)
+
+    StateManager[State["Any"]]().discover_state_hooks(
+        "indexed_sync", index_path=index_path
+    )
+    assert len(scanned) == 3, "Expected every file to be scanned once"
+
+    (package / "game.py").write_text(GAME + "\n")
+    manager = StateManager[State["Any"]]()
+    manager.discover_state_hooks("indexed_sync", index_path=index_path)
+
+    assert scanned[3:] == [str(package / "game.py")], (
+        "Expected only the changed file to be scanned again"
+    )
+
+
+def test_corrupt_discovery_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_package(tmp_path, monkeypatch, "corrupt_sync")
+    index_path = tmp_path / "index.json"
+    index_path.write_text('{"version": 2, "modules": {"menu.py": []}}')
+
+    handles = StateManager[State["Any"]]().discover_state_hooks(
+        "corrupt_sync", index_path=str(index_path)
+    )
+
+    assert len(handles) == 4, (
+        "Expected the modules to be scanned again when the index is corrupt"
+    )
+
+
+def test_discovery_bound_state_type(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    package = _make_package(tmp_path, monkeypatch, "bound_sync")
+    (package / "level.py").write_text(LEVEL)
+    manager = StateManager[Bound](bound_state_type=Bound)
+
+    handles = manager.discover_state_hooks("bound_sync")
+
+    assert len(handles) == 1, (
+        "Expected only the subclasses of the bound state type to be found"
+    )
+    with pytest.raises(StateError, match="Overlay"):
+        manager.get_handle("Overlay")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from src.game_state import State, StateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional
+
+    import pytest
+
+
+def test_dispatch_order(caplog: pytest.LogCaptureFixture) -> None:
+    calls: List[str] = []
+
+    class StateOne(State["Any"]):
+        def on_leave(self, next_state: State[Any]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+    class StateTwo(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+    def global_on_enter(
+        state: State[Any], _previous_state: Optional[State[Any]]
+    ) -> None:
+        calls.append(f"global_on_enter {state.state_name}")
+
+    def global_on_leave(
+        _state: Optional[State[Any]], next_state: State[Any]
+    ) -> None:
+        calls.append(f"global_on_leave {next_state.state_name}")
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(StateOne, StateTwo)
+    manager.change_state("StateOne")
+    manager.change_state("StateTwo")
+
+    assert calls == ["StateOne.on_leave", "StateTwo.on_enter"], (
+        f"Expected only the overridden listeners to be called: {calls}"
+    )
+
+    calls.clear()
+    manager.global_on_enter = global_on_enter
+    manager.global_on_leave = global_on_leave
+
+    with caplog.at_level(logging.DEBUG):
+        manager.change_state("StateOne")
+        manager.change_state("StateTwo")
+
+    assert calls == [
+        "global_on_leave StateOne",
+        "global_on_enter StateOne",
+        "global_on_leave StateTwo",
+        "StateOne.on_leave",
+        "global_on_enter StateTwo",
+        "StateTwo.on_enter",
+    ], f"Expected global listeners to be called once assigned: {calls}"
+    assert "Calling StateOne.on_leave" in caplog.messages, (
+        "Expected the listener calls to be logged."
+    )
+
+    calls.clear()
+    manager.global_on_enter = None
+    manager.global_on_leave = None
+    manager.change_state("StateOne")
+
+    assert calls == [], f"Expected global listeners to be removed: {calls}"
+
+
+def test_dispatch_instance_listener() -> None:
+    calls: List[Optional[State[Any]]] = []
+
+    class StateOne(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(StateOne)
+    manager.state_map["StateOne"].on_enter = calls.append  # pyright: ignore[reportAttributeAccessIssue]
+    manager.change_state("StateOne")
+
+    assert calls == [None], (
+        "Expected listeners assigned to the instance to be called."
+    )
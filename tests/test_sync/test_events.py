@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.events import on_event
+
+if TYPE_CHECKING:
+    from typing import Any, List, Tuple, Type
+
+QUIT = 1
+KEYDOWN = 2
+K_W = 119
+K_S = 115
+
+
+@dataclass
+class Event:
+    """A minimal stand-in for ``pygame.event.Event``."""
+
+    type: int
+    key: int = 0
+
+
+@pytest.fixture
+def scenario() -> Tuple[
+    StateManager[State[Any]], Type[State[Any]], Type[State[Any]], List[str]
+]:
+    calls: List[str] = []
+
+    class Menu(State["Any"]):
+        @on_event(KEYDOWN, key=K_W)
+        def start(self, event: Event) -> None:
+            calls.append("start")
+            self.manager.change_state("Game")
+
+        @on_event(QUIT)
+        @on_event(KEYDOWN, key=K_S)
+        def quit(self, event: Event) -> None:
+            calls.append("quit")
+
+        def process_event(self, event: Event) -> None:
+            calls.append(f"menu fallback {event.type}")
+
+    class Game(Menu):
+        def start(self, event: Event) -> None:
+            calls.append("not registered")
+
+    manager = StateManager[State["Any"]]()
+
+    return manager, Menu, Game, calls
+
+
+def test_dispatch_events(
+    scenario: Tuple[
+        StateManager[State[Any]], Type[State[Any]], Type[State[Any]], List[str]
+    ],
+) -> None:
+    manager, menu, game, calls = scenario
+
+    assert set(game._event_handlers) == {QUIT, KEYDOWN}, (  # pyright: ignore[reportPrivateUsage]
+        "Expected the listeners to be inherited"
+    )
+
+    manager.load_states(menu, game)
+    manager.change_state(menu.state_name)
+    manager.dispatch_events(
+        [
+            Event(KEYDOWN, K_S),
+            Event(KEYDOWN, key=0),
+            Event(KEYDOWN, K_W),
+            # Handled by the Game state from here.
+            Event(KEYDOWN, K_W),
+            Event(QUIT),
+        ]
+    )
+
+    assert calls == [
+        "quit",
+        f"menu fallback {KEYDOWN}",
+        "start",
+        f"menu fallback {KEYDOWN}",
+        "quit",
+    ], f"Unexpected listeners called: {calls}"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.game_state import State, StateManager
+from src.game_state.utils import StateArgs
+
+if TYPE_CHECKING:
+    from typing import Any, List  # noqa: F401
+
+
+def test_max_resident_states() -> None:
+    unloaded: List[str] = []
+
+    class BaseState(State["Any"]):
+        def on_unload(self, reload: bool) -> None:
+            unloaded.append(self.state_name)
+
+    class StateOne(BaseState):
+        def __init__(self, data: int) -> None:
+            self.data: int = data
+
+    class StateTwo(BaseState): ...
+
+    class StateThree(BaseState): ...
+
+    manager = StateManager[State["Any"]]()
+    manager.max_resident_states = 2
+    args = StateArgs(state_name="StateOne", data=1)
+    manager.load_states(StateOne, StateTwo, StateThree, state_args=[args])
+
+    manager.change_state("StateOne")
+
+    assert unloaded == ["StateTwo"], (
+        f"Expected a never entered state to be evicted first: {unloaded}"
+    )
+
+    manager.change_state("StateTwo")
+
+    assert unloaded == ["StateTwo", "StateThree"], (
+        f"Expected a never entered state to be evicted first: {unloaded}"
+    )
+
+    manager.change_state("StateThree")
+
+    assert unloaded == ["StateTwo", "StateThree", "StateOne"], (
+        f"Expected the least recently entered state to be evicted: {unloaded}"
+    )
+    assert manager.lazy_state_map["StateOne"] == (StateOne, [args]), (
+        "Expected the evicted state to be added back with its state args."
+    )
+
+    manager.change_state("StateOne")
+    state_one = manager.state_map["StateOne"]
+    assert isinstance(state_one, StateOne), "Expected StateOne to be loaded."
+    assert state_one.data == 1, (
+        "Expected the evicted state to be reloaded with its state args."
+    )
+
+
+def test_memory_budget() -> None:
+    class Heavy(State["Any"]):
+        def estimate_size(self) -> int:
+            return 100
+
+    class Pinned(Heavy): ...
+
+    class Light(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+    manager.memory_budget = 150
+    manager.load_states(Heavy, Pinned, Light)
+    manager.pin_state("Pinned")
+
+    manager.change_state("Light")
+
+    assert set(manager.state_map) == {"Pinned", "Light"}, (
+        f"Expected only Heavy to be evicted: {list(manager.state_map)}"
+    )
+
+    manager.unpin_state("Pinned")
+    manager.change_state("Heavy")
+
+    assert set(manager.state_map) == {"Heavy", "Light"}, (
+        f"Expected Pinned to be evicted once unpinned: {list(manager.state_map)}"
+    )
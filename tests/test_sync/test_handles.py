@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Tuple, Type
+
+
+@pytest.fixture
+def scenario() -> Tuple[
+    StateManager[State[Any]], Type[State[Any]], Type[State[Any]]
+]:
+    class StateOne(State["Any"]): ...
+
+    class StateTwo(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+
+    return manager, StateOne, StateTwo
+
+
+def test_handles(
+    scenario: Tuple[
+        StateManager[State[Any]], Type[State[Any]], Type[State[Any]]
+    ],
+) -> None:
+    manager, eager_state, lazy_state = scenario
+
+    (eager_handle,) = manager.load_states(eager_state)
+    (lazy_handle,) = manager.add_lazy_states(lazy_state)
+
+    assert (eager_handle, lazy_handle) == (0, 1), (
+        f"Expected handles in the order of adding: {eager_handle, lazy_handle}"
+    )
+    assert manager.get_handle(lazy_state.state_name) == lazy_handle
+    assert dict(manager.state_handles) == {
+        eager_state.state_name: eager_handle,
+        lazy_state.state_name: lazy_handle,
+    }
+
+    manager.change_state(lazy_handle)
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == lazy_state.state_name, (
+        "Expected the lazy state to be loaded through its handle."
+    )
+
+    handle_enum = manager.create_handle_enum()
+    manager.change_state(handle_enum[eager_state.state_name])
+    assert manager.current_state.state_name == eager_state.state_name, (
+        "Expected the enum member to switch to its state."
+    )
+
+    manager.unload_state(lazy_state.state_name)
+    manager.load_states(lazy_state)
+    assert manager.get_handle(lazy_state.state_name) == lazy_handle, (
+        "Expected the handle to stay the same after reloading."
+    )
+
+    with pytest.raises(StateError):
+        manager.change_state(-1)
+
+    with pytest.raises(StateError):
+        manager.get_handle("Unknown")
+
+
+def test_unloaded_handles() -> None:
+    class Menu(State["Any"]): ...
+
+    class Game(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+    menu, game = manager.load_states(Menu, Game)
+    manager.change_state(menu)
+    manager.unload_state("Game")
+
+    assert manager.state_handles["Game"] == game, (
+        "Expected the unloaded state to keep its handle."
+    )
+    with pytest.raises(StateError, match="isn't present"):
+        manager.change_state(game)
+
+    manager.load_states(Game)
+    manager.change_state(game)
+
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == "Game", (
+        "Expected the handle to work again once the state is loaded."
+    )
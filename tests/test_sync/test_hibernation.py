@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager, utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Dict, List, Tuple
+
+
+@pytest.fixture
+def scenario(
+    tmp_path: Path,
+) -> Tuple[StateManager[State[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Menu(State["Any"]): ...
+
+    class Level(State["Any"]):
+        def __init__(self) -> None:
+            calls.append("__init__")
+            self.tiles: bytearray = bytearray(b"tiles")
+            self.score: int = 0
+
+        def on_load(self, reload: bool) -> None:
+            calls.append("on_load")
+
+        def on_hibernate(self) -> Dict[str, Any]:
+            calls.append("on_hibernate")
+            return {
+                "tiles": pickle.PickleBuffer(self.tiles),
+                "score": self.score,
+            }
+
+        def on_resume(self, snapshot: Dict[str, Any]) -> None:
+            calls.append("on_resume")
+            self.readonly: bool = memoryview(snapshot["tiles"]).readonly
+            self.tiles = bytearray(snapshot["tiles"])
+            self.score = snapshot["score"]
+
+    manager = StateManager[State["Any"]]()
+    manager.hibernation_dir = str(tmp_path)
+    manager.load_states(Menu, Level)
+
+    return manager, calls
+
+
+def test_hibernate_resume(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+    tmp_path: Path,
+) -> None:
+    manager, calls = scenario
+    level: Any = manager.state_map["Level"]
+    level.score = 10
+    manager.unload_state("Level")
+
+    assert "Level" in manager.lazy_state_map, (
+        "Expected the hibernated state to be kept as a lazy state"
+    )
+    assert len(list(tmp_path.iterdir())) == 1, (
+        "Expected the snapshot to be written to the hibernation directory"
+    )
+
+    manager.change_state("Level")
+    level = manager.state_map["Level"]
+
+    assert calls == ["__init__", "on_load", "on_hibernate", "on_resume"], (
+        "Expected the state to be resumed without being loaded again"
+    )
+    assert (level.tiles, level.score) == (bytearray(b"tiles"), 10), (
+        "Expected the state to be restored from its snapshot"
+    )
+    assert level.readonly, (
+        "Expected the buffers to be read back as read-only views"
+    )
+    assert level.manager is manager, "Expected the state to be bound"
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected the snapshot to be removed"
+    )
+
+
+def test_hibernation_codec(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    class Codec:
+        def dumps(self, snapshot: Any) -> bytes:
+            return json.dumps(snapshot).encode()
+
+        def loads(self, data: bytes) -> Any:
+            return json.loads(data)
+
+    class Counter(State["Any"]):
+        count: int = 0
+
+        def on_hibernate(self) -> Dict[str, Any]:
+            return {"count": 3}
+
+        def on_resume(self, snapshot: Dict[str, Any]) -> None:
+            self.count = snapshot["count"]
+
+    manager, _ = scenario
+    manager.hibernation_codec = Codec()
+    manager.load_states(Counter)
+    manager.unload_state("Counter")
+    manager.change_state("Counter")
+
+    counter: Any = manager.state_map["Counter"]
+    assert counter.count == 3, (
+        "Expected the snapshot to be restored through the codec"
+    )
+
+
+def test_hibernation_skipped(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+    tmp_path: Path,
+) -> None:
+    manager, calls = scenario
+    manager.reload_state("Level")
+    manager.unload_state("Menu")
+
+    assert "on_hibernate" not in calls, (
+        "Expected reloading a state not to hibernate it"
+    )
+    assert "Menu" not in manager.lazy_state_map, (
+        "Expected a state without a snapshot to be unloaded as usual"
+    )
+
+    manager.unload_state("Level")
+    manager.remove_lazy_state("Level")
+
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected removing a hibernated state to remove its snapshot"
+    )
+
+
+def test_begin_loading_hibernated(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+    tmp_path: Path,
+) -> None:
+    manager, calls = scenario
+    level: Any = manager.state_map["Level"]
+    level.score = 10
+    manager.unload_state("Level")
+    manager.begin_loading("Level")
+    manager.finish_loading()
+    level = manager.current_state
+
+    assert calls == ["__init__", "on_load", "on_hibernate", "on_resume"], (
+        "Expected the state to be resumed without being loaded again"
+    )
+    assert level.score == 10, "Expected the state to be restored"
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected the snapshot to be removed"
+    )
+
+
+def test_prefetch_hibernated(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    level: Any = manager.state_map["Level"]
+    level.score = 10
+    manager.unload_state("Level")
+    manager.prefetch("Level")
+    manager.close()
+
+    assert calls == ["__init__", "on_load", "on_hibernate", "on_resume"], (
+        "Expected the prefetched state to be resumed without being loaded again"
+    )
+    assert "Level" not in manager.state_map, (
+        "Expected the prefetched state to stay lazy until it is switched to"
+    )
+
+    manager.change_state("Level")
+    level = manager.current_state
+
+    assert level.score == 10, "Expected the state to be restored"
+
+
+def test_hibernation_copied(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.setattr(utils, "_SNAPSHOT_MAPPED_BUFFERS", False)
+    manager, _ = scenario
+    manager.unload_state("Level")
+    manager.change_state("Level")
+    level: Any = manager.current_state
+
+    assert level.tiles == bytearray(b"tiles"), (
+        "Expected the state to be restored"
+    )
+    assert not level.readonly, "Expected the buffers to be copied"
+    assert list(tmp_path.iterdir()) == [], (
+        "Expected the snapshot to be removed"
+    )
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.history import Transition, TransitionHistory
+
+if TYPE_CHECKING:
+    from typing import Any  # noqa: F401
+
+
+def test_history() -> None:
+    class Menu(State["Any"]): ...
+
+    class Game(State["Any"]): ...
+
+    class Pause(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(Menu, Game, Pause)
+
+    assert manager.history is None, "Expected the history to be disabled"
+    history = manager.enable_history(3)
+
+    manager.change_state("Menu")
+    manager.change_state("Game")
+    manager.push_state("Pause")
+    manager.pop_state()
+    manager.change_state("Menu")
+
+    assert len(history) == 3, "Expected the history to be bounded"
+    assert history.total == 5, "Expected every transition to be counted"
+    assert [
+        (transition.from_state, transition.to_state)
+        for transition in history.last(5)
+    ] == [("Game", "Pause"), ("Pause", "Game"), ("Game", "Menu")], (
+        "Expected the most recent transitions, oldest first"
+    )
+    assert all(
+        transition.duration_ns >= 0 for transition in history.last(3)
+    ), "Expected the transitions to be timed"
+
+    with pytest.raises(ValueError, match="history"):
+        manager.history = None
+
+    manager.disable_history()
+    manager.change_state("Game")
+
+    assert history.total == 5, "Expected the history to be disabled"
+
+
+def test_history_queries() -> None:
+    history = TransitionHistory(3, ["Menu", "Game"])
+    assert history.dwell_times() == {}, "Expected an empty history"
+
+    history.record(None, 0, 0, 1)
+    history.record(0, 1, 10, 1)
+    history.record(1, 0, 30, 1)
+    history.record(0, 1, 35, 1)
+
+    assert history.last(1) == [Transition("Menu", "Game", 35, 1)], (
+        "Expected the last transition"
+    )
+    assert history.dwell_times(now_ns=50) == {"Game": 35, "Menu": 5}, (
+        "Expected the time spent in the states over the kept transitions"
+    )
+    assert history.counts() == {("Game", "Menu"): 1, ("Menu", "Game"): 2}, (
+        "Expected the transitions to be counted by their states"
+    )
+
+    history.clear()
+    assert history.last(3) == [], "Expected the history to be cleared"
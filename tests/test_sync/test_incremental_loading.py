@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from typing import Any, Tuple, Type
+
+STEPS: int = 4
+
+
+@pytest.fixture
+def scenario() -> Tuple[StateManager[State[Any]], Type[State[Any]]]:
+    class Menu(State["Any"]): ...
+
+    class Level(State["Any"]):
+        def on_load(self, reload: bool) -> Generator[float, None, None]:
+            for step in range(STEPS):
+                yield (step + 1) / STEPS
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(Menu)
+    manager.add_lazy_states(Level)
+    manager.change_state("Menu")
+
+    return manager, Level
+
+
+def test_incremental_loading(
+    scenario: Tuple[StateManager[State[Any]], Type[State[Any]]],
+) -> None:
+    manager, level = scenario
+
+    assert manager.update_loading(0) is None, "Expected nothing to load."
+
+    manager.begin_loading(level.state_name)
+
+    with pytest.raises(StateError):
+        manager.begin_loading("Menu")
+
+    progress = [manager.update_loading(0) for _ in range(STEPS + 2)]
+
+    assert progress == [0.25, 0.5, 0.75, 1.0, 1.0, None], (
+        f"Expected loading to advance once per update, instead got {progress}"
+    )
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == level.state_name, (
+        "Expected the manager to switch to the loaded state."
+    )
+    assert level.state_name not in manager.lazy_state_map, (
+        "Expected the loaded state to be removed from the lazy states."
+    )
+
+
+def test_incremental_loading_interrupted(
+    scenario: Tuple[StateManager[State[Any]], Type[State[Any]]],
+) -> None:
+    manager, level = scenario
+
+    manager.begin_loading(level.state_name, switch=False)
+    manager.update_loading(0)
+    assert manager.loading_progress == 1 / STEPS
+
+    manager.change_state(level.state_name)
+
+    assert manager.loading_progress is None, "Expected loading to finish."
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == level.state_name, (
+        "Expected change_state to finish loading and switch to the state."
+    )
+
+
+def test_incremental_loading_failed() -> None:
+    class Level(State["Any"]):
+        def on_load(self, reload: bool) -> Generator[float, None, None]:
+            yield 0.5
+            msg = "Missing asset."
+            raise OSError(msg)
+
+    manager = StateManager[State["Any"]]()
+    manager.add_lazy_states(Level)
+    manager.begin_loading("Level")
+    manager.update_loading(0)
+
+    with pytest.raises(OSError, match="Missing asset"):
+        manager.update_loading(0)
+
+    assert manager.loading_progress is None, (
+        "Expected loading to be cancelled."
+    )
+    assert manager.update_loading(0) is None, "Expected nothing to load."
+    assert "Level" in manager.lazy_state_map, (
+        "Expected the state to be left in the lazy states."
+    )
+    assert "Level" not in manager.state_map, (
+        "Expected the half loaded state not to be registered."
+    )
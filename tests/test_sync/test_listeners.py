@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional
+
+
+def test_listener_order() -> None:
+    calls: List[str] = []
+
+    class StateOne(State["Any"]): ...
+
+    def make_listener(
+        name: str,
+    ) -> Any:
+        def listener(
+            state: State[Any], _previous_state: Optional[State[Any]]
+        ) -> None:
+            calls.append(f"{name} {state.state_name}")
+
+        return listener
+
+    first = make_listener("first")
+    last = make_listener("last")
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(StateOne)
+    manager.add_listener("global_on_enter", last, priority=-1)
+    manager.add_listener("global_on_enter", make_listener("added"))
+    manager.add_listener("global_on_enter", first, priority=1)
+    manager.global_on_enter = make_listener("assigned")
+    manager.change_state("StateOne")
+
+    assert calls == [
+        "first StateOne",
+        "assigned StateOne",
+        "added StateOne",
+        "last StateOne",
+    ], f"Expected the listeners to be called by their priority: {calls}"
+
+    calls.clear()
+    manager.remove_listener("global_on_enter", first)
+    manager.remove_listener("global_on_enter", last)
+    manager.global_on_enter = None
+    manager.change_state("StateOne")
+
+    assert calls == ["added StateOne"], (
+        f"Expected the removed listeners not to be called: {calls}"
+    )
+
+    with pytest.raises(ValueError, match="wasn't added"):
+        manager.remove_listener("global_on_enter", first)
+
+
+def test_load_listeners() -> None:
+    loaded: List[str] = []
+    unloaded: List[str] = []
+
+    class StateOne(State["Any"]):
+        def on_unload(self, reload: bool) -> None:
+            unloaded.append(f"on_unload {reload}")
+
+    def global_on_load(state: State[Any], _reload: bool) -> None:
+        loaded.append(f"assigned {state.state_name}")
+
+    def added(state: State[Any], _reload: bool) -> None:
+        loaded.append(f"added {state.state_name}")
+
+    def global_on_unload(state: State[Any], reload: bool) -> None:
+        unloaded.append(f"{state.state_name} {reload}")
+
+    manager = StateManager[State["Any"]]()
+    manager.global_on_load = global_on_load
+    manager.add_listener("global_on_load", added)
+    manager.global_on_unload = global_on_unload
+    manager.load_states(StateOne)
+
+    assert loaded == ["assigned StateOne", "added StateOne"], (
+        f"Expected every load listener to be called: {loaded}"
+    )
+    assert manager.global_on_load is not manager.global_on_unload, (
+        "Expected global_on_unload not to replace global_on_load"
+    )
+
+    manager.unload_state("StateOne")
+
+    assert unloaded == ["StateOne False", "on_unload False"], (
+        f"Expected global_on_unload to be called before on_unload: {unloaded}"
+    )
+
+
+def test_listener_validation() -> None:
+    def listener(_state: State[Any], _previous: Optional[State[Any]]) -> None:
+        pass
+
+    def missing_previous(_state: State[Any]) -> None:
+        pass
+
+    manager = StateManager[State["Any"]]()
+
+    with pytest.raises(ValueError, match="isn't a global listener"):
+        manager.add_listener("on_enter", listener)
+
+    with pytest.raises(TypeError, match="Expected 2 positional argument"):
+        manager.add_listener("global_on_leave", missing_previous)
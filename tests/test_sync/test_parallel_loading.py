@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateLoadError
+
+if TYPE_CHECKING:
+    from typing import Any, List, Set, Type
+
+
+def make_states(count: int, threads: Set[int]) -> List[Type[State[Any]]]:
+    states: List[Type[State[Any]]] = []
+
+    for index in range(count):
+
+        class SlowState(State["Any"], state_name=f"Slow {index}"):
+            def on_load(self, reload: bool) -> None:
+                threads.add(threading.get_ident())
+                time.sleep(0.01)
+
+        states.append(SlowState)
+
+    return states
+
+
+def test_parallel_load() -> None:
+    manager = StateManager[State["Any"]]()
+    threads: Set[int] = set()
+    global_loads: List[str] = []
+    states = make_states(4, threads)
+
+    def global_on_load(state: State[Any], reload: bool) -> None:  # noqa: ARG001
+        assert threading.get_ident() == threading.main_thread().ident, (
+            "Expected global_on_load to be called on the calling thread."
+        )
+        global_loads.append(state.state_name)
+
+    manager.global_on_load = global_on_load
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        manager.load_states(*states, executor=executor)
+
+    expected = [state.state_name for state in states]
+    assert list(manager.state_map) == expected, (
+        "Expected states to be registered in the order they were passed."
+    )
+    assert global_loads == expected, (
+        f"Expected global_on_load to be called in order, got {global_loads}"
+    )
+    assert threading.get_ident() not in threads, (
+        "Expected on_load to be called on the executor's threads."
+    )
+
+
+def test_parallel_load_errors() -> None:
+    class Working(State["Any"]): ...
+
+    class Broken(State["Any"]):
+        def on_load(self, reload: bool) -> None:
+            raise RuntimeError
+
+    manager = StateManager[State["Any"]]()
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(RuntimeError):
+            manager.load_states(Working, Broken, executor=executor)
+
+        assert len(manager.state_map) == 0, (
+            "Expected no state to be registered after a failed load."
+        )
+
+        manager.load_states(Working, executor=executor)
+        with pytest.raises(StateLoadError):
+            manager.load_states(Working, executor=executor)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManagerPool
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, List, Set  # noqa: F401
+
+
+# The keyword arguments of the pool & its sessions are bound to the instances.
+class Menu(State["Any"]):
+    """Records the players it's unloaded for."""
+
+    game: str
+    player: str
+    unloaded: List[str]
+
+    def on_unload(self, reload: bool) -> None:
+        self.unloaded.append(self.player)
+
+
+def test_sessions() -> None:
+    unloaded: List[str] = []
+    pool = StateManagerPool[State["Any"]](
+        states=[Menu], game="Pong", unloaded=unloaded
+    )
+
+    first = pool.acquire(player="first")
+    second = pool.acquire(player="second")
+    first.change_state(Menu.state_name)
+    second.change_state(Menu.state_name)
+    first_state = first.current_state
+    second_state = second.current_state
+
+    assert len(pool) == 2, f"Expected 2 sessions, got {len(pool)}"
+    assert isinstance(first_state, Menu), "Expected Menu to be entered"
+    assert isinstance(second_state, Menu), "Expected Menu to be entered"
+    assert first_state is not second_state, (
+        "Expected sessions to have their own state instances"
+    )
+    assert first_state.manager is first, (
+        "Expected the session manager to be bound to its state instance"
+    )
+    assert first_state.player == "first", (
+        "Expected the session's keyword arguments to be bound"
+    )
+    assert second_state.game == "Pong", (
+        "Expected the pool's keyword arguments to be bound"
+    )
+    assert not hasattr(Menu, "player"), (
+        "Expected the state class to be left untouched"
+    )
+
+    pool.release(first)
+
+    assert len(pool) == 1, f"Expected 1 session, got {len(pool)}"
+    assert unloaded == ["first"], (
+        f"Expected only the released session to be unloaded: {unloaded}"
+    )
+    assert not first.state_map, "Expected the released session to be empty"
+
+    with pytest.raises(StateError, match="doesn't belong"):
+        pool.release(first)
+
+
+def test_release_prefetching() -> None:
+    threads: Set[int] = set()
+
+    class Game(State["Any"]):
+        def on_load(self, reload: bool) -> None:
+            threads.add(threading.get_ident())
+
+    pool = StateManagerPool[State["Any"]](states=[Menu], unloaded=[])
+    session = pool.acquire(player="first")
+    session.add_lazy_states(Game)
+    session.prefetch("Game")
+
+    pool.release(session)
+
+    assert not session.lazy_state_map, "Expected the lazy states to be removed"
+    assert not any(
+        thread.ident in threads for thread in threading.enumerate()
+    ), "Expected the prefetch worker of the session to be stopped"
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Set, Tuple  # noqa: F401
+
+
+def test_prefetch() -> None:
+    threads: Set[int] = set()
+
+    class Menu(State["Any"]): ...
+
+    class Game(State["Any"]):
+        def on_load(self, reload: bool) -> None:
+            threads.add(threading.get_ident())
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(Menu)
+    manager.add_lazy_states(Game)
+
+    with pytest.raises(StateError):
+        manager.prefetch("Unknown")
+
+    manager.prefetch("Game", "Menu")
+    assert "Game" not in manager.state_map, (
+        "Expected prefetched state to stay lazy until it is switched to."
+    )
+
+    manager.change_state("Game")
+
+    assert "Game" in manager.state_map, "Expected Game to be loaded."
+    assert "Game" not in manager.lazy_state_map, (
+        "Expected Game to be removed from the lazy states."
+    )
+    assert threading.get_ident() not in threads, (
+        "Expected Game to be loaded in the background."
+    )
+
+    manager.close()
+    assert not any(
+        thread.ident in threads for thread in threading.enumerate()
+    ), "Expected the prefetch worker to be stopped."
+
+
+def test_auto_prefetch() -> None:
+    class Menu(State["Any"]):
+        neighbours: Tuple[str, ...] = ("Game",)
+
+    class Game(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+    manager.auto_prefetch = True
+    manager.load_states(Menu)
+    manager.add_lazy_states(Game)
+
+    manager.change_state("Menu")
+    assert "Game" in manager._prefetching, (  # pyright: ignore[reportPrivateUsage]
+        "Expected the neighbour of Menu to be prefetched."
+    )
+
+    manager.remove_lazy_state("Game")
+    assert "Game" not in manager._prefetching, (  # pyright: ignore[reportPrivateUsage]
+        "Expected removing a lazy state to drop its prefetch."
+    )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import atexit
+import json
+from typing import TYPE_CHECKING
+
+from src.game_state import State, StateManager, profiling
+from src.game_state.profiling import StartupProfiler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, List
+
+    import pytest
+
+
+HOOK = """
+from src.game_state import State
+
+
+class Shop(State["Any"]): ...
+
+
+def hook(manager):
+    manager.load_states(Shop)
+"""
+
+
+def test_profiler(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "profiled_sync_shop.py").write_text(HOOK)
+    monkeypatch.syspath_prepend(  # pyright: ignore[reportUnknownMemberType]
+        str(tmp_path)
+    )
+
+    class Menu(State["Any"]):
+        def on_load(self, reload: bool) -> None: ...
+
+    manager = StateManager[State["Any"]]()
+    profiler = manager.profiler = StartupProfiler()
+    manager.global_on_load = lambda _state, _reload: None
+    manager.load_states(Menu)
+    manager.connect_state_hook("profiled_sync_shop", manager=manager)
+
+    spans = {(span[0], span[1]) for span in profiler._spans}  # pyright: ignore[reportPrivateUsage]
+    assert spans == {
+        ("init", "Menu"),
+        ("on_load", "Menu"),
+        ("global_on_load", "Menu"),
+        ("import", "profiled_sync_shop"),
+        ("hook", "profiled_sync_shop"),
+        ("init", "Shop"),
+        ("on_load", "Shop"),
+        ("global_on_load", "Shop"),
+    }, "Expected the imports, hooks, initialization & loading to be recorded"
+
+    report = profiler.report(limit=3).splitlines()
+    assert len(report) == 5, "Expected the report to be limited"
+    assert report[2].split()[0] == "1", "Expected the rows to be ranked"
+
+    trace_path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(str(trace_path))
+    events = json.loads(trace_path.read_text())["traceEvents"]
+
+    assert len(events) == len(profiler), "Expected every span to be exported"
+    assert all(event["ph"] == "X" for event in events), (
+        "Expected complete events to be exported"
+    )
+
+
+def test_profiler_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    registered: List[Any] = []
+
+    def register(*args: Any) -> None:
+        registered.append(args)
+
+    monkeypatch.setattr(atexit, "register", register)
+    monkeypatch.setenv(profiling.PROFILE_ENV, "trace.json")
+    profiling._get_environment_profiler.cache_clear()  # pyright: ignore[reportPrivateUsage]
+
+    try:
+        profiler = StateManager[State["Any"]]().profiler
+        assert profiler is StateManager[State["Any"]]().profiler, (
+            "Expected the managers to share the profiler"
+        )
+    finally:
+        profiling._get_environment_profiler.cache_clear()  # pyright: ignore[reportPrivateUsage]
+
+    assert profiler is not None, "Expected the variable to enable profiling"
+    assert registered[0][1] == "trace.json", (
+        "Expected the trace to be written on exit"
+    )
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import RegionManager, State
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Type
+
+
+@pytest.fixture
+def scenario() -> Type[State[Any]]:
+    class Ambience(State["Any"]):
+        updates: Dict[str, str]
+        region: str
+
+        def process_update(self, dt: float) -> None:
+            self.updates[self.region] = threading.current_thread().name
+
+    return Ambience
+
+
+def test_regions(scenario: Type[State[Any]]) -> None:
+    updates: Dict[str, str] = {}
+
+    with ThreadPoolExecutor(thread_name_prefix="region") as executor:
+        regions = RegionManager[State["Any"]](
+            executor=executor, updates=updates
+        )
+        regions.add_region("hud", region="hud").load_states(scenario)
+        regions.add_region("world", region="world").load_states(scenario)
+        regions.add_region("idle", region="idle")
+
+        with pytest.raises(StateError):
+            regions.add_region("hud")
+
+        regions["hud"].change_state(scenario.state_name)
+        regions["world"].change_state(scenario.state_name)
+        regions.update(0.1)
+
+    assert set(updates) == {"hud", "world"}, (
+        f"Expected every active region to be updated: {updates}"
+    )
+    assert all(name.startswith("region") for name in updates.values()), (
+        f"Expected the regions to be updated on the executor: {updates}"
+    )
+    assert (
+        regions["hud"].current_state is not regions["world"].current_state
+    ), "Expected each region to have its own current state"
+
+    regions.remove_region("idle")
+
+    assert len(regions) == 2, f"Expected 2 regions, got {len(regions)}"
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, Iterator, List, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[StateManager[State[Any]], List[Tuple[str, Any]]]:
+    calls: List[Tuple[str, Any]] = []
+
+    class Game(State["Any"]):
+        def process_event(self, event: Any) -> None:
+            calls.append(("event", event))
+            if event == "quit":
+                self.manager.is_running = False
+
+        def process_update(self, dt: float) -> None:
+            calls.append(("update", dt))
+
+        def process_render(self, alpha: float) -> None:
+            calls.append(("render", alpha))
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(Game)
+
+    return manager, calls
+
+
+def test_run(
+    scenario: Tuple[StateManager[State[Any]], List[Tuple[str, Any]]],
+) -> None:
+    manager, calls = scenario
+    times: Iterator[float] = iter([0.0, 0.25, 0.75, 2.75, 3.25])
+    frames: Iterator[List[str]] = iter([[], ["key"], [], ["quit"]])
+
+    with pytest.raises(StateError):
+        manager.run(events=frames.__next__, clock=times.__next__)
+
+    manager.change_state("Game")
+    manager.run(
+        events=frames.__next__,
+        timestep=0.5,
+        max_steps=2,
+        clock=times.__next__,
+    )
+
+    assert calls == [
+        # 0.25s passed, not enough for an update.
+        ("render", 0.5),
+        # 0.75s passed in total.
+        ("event", "key"),
+        ("update", 0.5),
+        ("render", 0.5),
+        # 2.75s passed in total, only 2 updates are run & the rest is dropped
+        # except for the time between updates.
+        ("update", 0.5),
+        ("update", 0.5),
+        ("render", 0.5),
+        ("event", "quit"),
+        ("update", 0.5),
+        ("render", 0.5),
+    ], f"Unexpected order of calls: {calls}"
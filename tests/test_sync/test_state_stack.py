@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.errors import StateError
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[StateManager[State[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Base(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+        def on_leave(self, next_state: State[Any]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+        def process_update(self, dt: float) -> None:
+            calls.append(f"{self.state_name}.update")
+
+        def process_render(self, alpha: float) -> None:
+            calls.append(f"{self.state_name}.render")
+
+    class Game(Base): ...
+
+    class Pause(Base):
+        render_below: bool = True
+
+    class Dialog(Base):
+        update_below: bool = True
+        render_below: bool = True
+
+    manager = StateManager[State["Any"]](bound_state_type=Base)
+    manager.load_states(Game, Pause, Dialog)
+
+    return manager, calls
+
+
+def test_push_pop(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+
+    with pytest.raises(StateError):
+        manager.push_state("Pause")
+
+    manager.change_state("Game")
+    game = manager.current_state
+    manager.push_state("Pause")
+    manager.push_state("Dialog")
+
+    assert [state.state_name for state in manager.state_stack] == [
+        "Game",
+        "Pause",
+        "Dialog",
+    ], f"Unexpected state stack: {manager.state_stack}"
+
+    with pytest.raises(StateError):
+        manager.push_state("Game")
+    with pytest.raises(StateError):
+        manager.unload_state("Game")
+
+    frames = iter([[], ["quit"]])
+
+    def events() -> List[str]:
+        frame = next(frames)
+        if frame:
+            manager.is_running = False
+        return frame
+
+    times = iter([0.0, 0.0, 1.0])
+    calls.clear()
+    manager.run(events=events, timestep=1, clock=times.__next__)
+
+    assert calls == [
+        # The first frame has no time to update with.
+        "Game.render",
+        "Pause.render",
+        "Dialog.render",
+        "Pause.update",
+        "Dialog.update",
+        "Game.render",
+        "Pause.render",
+        "Dialog.render",
+    ], f"Unexpected layers updated & rendered: {calls}"
+
+    calls.clear()
+    popped = manager.pop_state()
+    manager.pop_state()
+
+    assert popped is manager.state_map["Dialog"], (
+        f"Unexpected popped state: {popped}"
+    )
+    assert manager.current_state is game, "Expected to return to the game"
+    assert calls == ["Dialog.on_leave", "Pause.on_leave"], (
+        f"Expected only the leave listeners of the popped states: {calls}"
+    )
+
+    with pytest.raises(StateError):
+        manager.pop_state()
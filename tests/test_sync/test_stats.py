@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from typing import Any, Tuple, Type
+
+
+@pytest.fixture
+def scenario() -> Tuple[
+    StateManager[State[Any]], Type[State[Any]], Type[State[Any]]
+]:
+    class StateOne(State["Any"]):
+        def on_enter(self, previous_state: State[Any] | None) -> None: ...
+
+    class StateTwo(State["Any"]): ...
+
+    manager = StateManager[State["Any"]]()
+
+    return manager, StateOne, StateTwo
+
+
+def test_histogram() -> None:
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(50) == 0, (
+        "Expected an empty histogram to report 0"
+    )
+
+    for elapsed in (100, 120, 900, 5000):
+        histogram.record(elapsed)
+
+    summary = histogram.summary()
+
+    assert (summary.count, summary.total_ns, summary.max_ns) == (
+        4,
+        6120,
+        5000,
+    ), f"Expected the exact counters to be kept: {summary}"
+    assert 64 <= summary.p50_ns <= 127, (
+        f"Expected p50 to fall in the bucket of 100 & 120: {summary.p50_ns}"
+    )
+    assert summary.p95_ns == 5000, (
+        f"Expected p95 to be capped by the max timing: {summary.p95_ns}"
+    )
+
+
+def test_stats(
+    scenario: Tuple[
+        StateManager[State[Any]], Type[State[Any]], Type[State[Any]]
+    ],
+) -> None:
+    manager, state_one, state_two = scenario
+
+    manager.load_states(state_one, state_two)
+    manager.change_state(state_one.state_name)
+
+    assert manager.stats() == {}, "Expected no timings while disabled"
+
+    manager.enable_stats()
+    manager.change_state(state_two.state_name)
+    manager.change_state(state_one.state_name)
+    manager.reload_state(state_two.state_name)
+
+    stats = manager.stats()
+
+    assert set(stats) == {
+        "StateOne.change_state",
+        "StateOne.on_enter",
+        "StateTwo.change_state",
+        "StateTwo.unload_state",
+        "StateTwo.on_unload",
+        "StateTwo.on_load",
+        "StateTwo.reload_state",
+        "load_states",
+    }, f"Expected only the timed operations & listeners: {set(stats)}"
+    assert stats["StateOne.on_enter"].count == 1, (
+        "Expected the listener to be timed once"
+    )
+
+    manager.disable_stats()
+    manager.change_state(state_two.state_name)
+
+    assert manager.stats() == {}, "Expected the timings to be discarded"
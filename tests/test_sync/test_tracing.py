@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+from src.game_state.tracing import Tracer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any, Optional
+
+
+def test_tracer(tmp_path: Path) -> None:
+    class StateOne(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None: ...
+
+    manager = StateManager[State["Any"]]()
+    tracer = manager.tracer = Tracer()
+    manager.load_states(StateOne)
+    manager.change_state("StateOne")
+
+    spans = {
+        event["name"]: event for event in tracer.events() if event["ph"] == "X"
+    }
+    assert set(spans) == {
+        "StateOne.on_load",
+        "load_states",
+        "StateOne.on_enter",
+        "StateOne.change_state",
+    }, "Expected the operations & listeners to be traced"
+
+    parent, child = spans["StateOne.change_state"], spans["StateOne.on_enter"]
+    assert parent["ts"] <= child["ts"], "Expected the listener to be nested"
+    assert child["ts"] + child["dur"] <= parent["ts"] + parent["dur"], (
+        "Expected the listener to be nested"
+    )
+    assert child["tid"] == threading.get_ident(), (
+        "Expected the spans to be on the track of the thread"
+    )
+
+    manager.tracer = None
+    manager.change_state("StateOne")
+
+    assert len(tracer.events()) == 4, "Expected the tracing to be disabled"
+
+    trace_path = tmp_path / "trace.json"
+    tracer.export(str(trace_path))
+    assert len(json.loads(trace_path.read_text())["traceEvents"]) == 4, (
+        "Expected the spans to be exported"
+    )
+
+
+def test_tracer_ring_buffer() -> None:
+    with pytest.raises(ValueError, match="capacity"):
+        Tracer(0)
+
+    tracer = Tracer(2)
+    for started in range(3):
+        tracer.record(f"span{started}", started, started + 1)
+
+    assert [event["name"] for event in tracer.events()] == [
+        "span1",
+        "span2",
+    ], "Expected the oldest span to be overwritten"
+
+    tracer.clear()
+    assert tracer.events() == [], "Expected the spans to be removed"
+    assert next(tracer._counter) == 0, (  # pyright: ignore[reportPrivateUsage]
+        "Expected the ring buffer to start over once cleared"
+    )
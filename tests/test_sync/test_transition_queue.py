@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.game_state import State, StateManager
+
+if TYPE_CHECKING:
+    from typing import Any, List, Optional, Tuple
+
+
+@pytest.fixture
+def scenario() -> Tuple[StateManager[State[Any]], List[str]]:
+    calls: List[str] = []
+
+    class Base(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            calls.append(f"{self.state_name}.on_enter")
+
+        def on_leave(self, next_state: State[Any]) -> None:
+            calls.append(f"{self.state_name}.on_leave")
+
+    class StateA(Base): ...
+
+    class StateB(Base): ...
+
+    class StateC(Base): ...
+
+    class Redirect(Base):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            super().on_enter(previous_state)
+            self.manager.change_state("StateC")
+            calls.append("Redirect.on_enter finished")
+
+    manager = StateManager[State["Any"]](bound_state_type=Base)
+    manager.load_states(StateA, StateB, StateC, Redirect)
+
+    return manager, calls
+
+
+def test_deferred_transitions(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    manager.change_state("StateA")
+    manager.deferred_transitions = True
+    calls.clear()
+
+    manager.change_state("StateB")
+    manager.change_state("StateC")
+
+    assert calls == [], f"Expected the switches to be queued: {calls}"
+
+    manager.apply_transitions()
+
+    assert calls == ["StateA.on_leave", "StateC.on_enter"], (
+        f"Expected the queued switches to be coalesced: {calls}"
+    )
+
+
+def test_reentrant_transitions(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+    manager.change_state("StateA")
+    calls.clear()
+
+    manager.change_state("Redirect")
+
+    assert calls == [
+        "StateA.on_leave",
+        "Redirect.on_enter",
+        "Redirect.on_enter finished",
+        "Redirect.on_leave",
+        "StateC.on_enter",
+    ], f"Expected the nested switch to run after the first one: {calls}"
+    assert manager.current_state is not None
+    assert manager.current_state.state_name == "StateC"
+
+
+def test_reentrant_stack_transitions() -> None:
+    calls: List[str] = []
+
+    class Game(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            self.manager.push_state("Pause")
+            calls.append("Game.on_enter finished")
+
+    class Pause(State["Any"]):
+        def on_enter(self, previous_state: Optional[State[Any]]) -> None:
+            popped = self.manager.pop_state()
+            calls.append(f"Pause.on_enter finished {popped}")
+
+        def on_leave(self, next_state: State[Any]) -> None:
+            calls.append(f"Pause.on_leave {next_state.state_name}")
+
+    manager = StateManager[State["Any"]]()
+    manager.load_states(Game, Pause)
+    manager.change_state("Game")
+
+    assert calls == [
+        "Game.on_enter finished",
+        "Pause.on_enter finished None",
+        "Pause.on_leave Game",
+    ], f"Expected the nested push & pop to be queued: {calls}"
+    assert manager.state_stack == (manager.state_map["Game"],)
+
+
+def test_failed_transition_clears_queue(
+    scenario: Tuple[StateManager[State[Any]], List[str]],
+) -> None:
+    manager, calls = scenario
+
+    def global_on_enter(
+        state: State[Any], _previous_state: Optional[State[Any]]
+    ) -> None:
+        if state.state_name == "StateB":
+            manager.change_state("StateC")
+            msg = "Broken listener."
+            raise RuntimeError(msg)
+
+    manager.global_on_enter = global_on_enter
+    manager.change_state("StateA")
+
+    with pytest.raises(RuntimeError, match="Broken listener"):
+        manager.change_state("StateB")
+
+    calls.clear()
+    manager.apply_transitions()
+
+    assert calls == [], f"Expected the queued switch to be dropped: {calls}"